@@ -1,3 +1,3 @@
-from mddj._internal.cli import main
+from mddj._cli import main
 
 main()
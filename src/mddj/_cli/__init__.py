@@ -1,17 +1,29 @@
 import click
 
-from .read import read
-from .self import self
+from .lazy_group import LazyGroup
 from .state import CommandState, common_args
-from .write import write
 
 
-@click.group("mddj")
+@click.group(
+    "mddj",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "batch": "mddj._cli.batch:batch",
+        "read": "mddj._cli.read:read",
+        "self": "mddj._cli.self:self",
+        "serve": "mddj._cli.serve:serve",
+        "workspace": "mddj._cli.workspace:workspace",
+        "write": "mddj._cli.write:write",
+    },
+)
 @common_args
-def main(*, state: CommandState) -> None:
+@click.option(
+    "--stats",
+    is_flag=True,
+    help="On exit, print statistics for mddj's in-memory caches to stderr.",
+)
+def main(*, state: CommandState, stats: bool) -> None:
     """MetaData DJ"""
-
-
-main.add_command(read)
-main.add_command(write)
-main.add_command(self)
+    if stats:
+        state.enable_stats()
+        click.get_current_context().call_on_close(state.print_stats)
@@ -0,0 +1,105 @@
+import json
+import pathlib
+import sys
+import typing as t
+
+import click
+
+from mddj._cli.state import CommandState, common_args
+
+
+@click.command("batch")
+@common_args
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="The maximum number of projects to read at once. Defaults to the CPU count.",
+)
+@click.option(
+    "--order",
+    type=click.Choice(("input", "completion")),
+    default="input",
+    show_default=True,
+    help="Write results in the order of the requests, or as they complete.",
+)
+def batch(
+    *,
+    jobs: int | None,
+    order: t.Literal["input", "completion"],
+    state: CommandState,
+) -> None:
+    """
+    Read fields from many projects, with requests read from stdin as JSON Lines.
+
+    Each request is an object with a 'path' and, optionally, a list of 'fields'
+    (by default, 'name', 'version', 'requires-python', and 'dependencies'), as in:
+
+    \b
+        {"path": "src/foo", "fields": ["version", "dependencies"]}
+
+    One result is written to stdout for each request, with the 'path', the
+    'values' and 'errors' of the fields, and whether or not the project was
+    'built'. The 'id' of a request, if it has one, is copied to its result.
+
+    Invalid requests are reported on stderr, and cause a non-zero exit status
+    once all other requests have been read.
+    """
+    from mddj.api import read_stream
+    from mddj.api.reader._snapshot import DEFAULT_FIELDS
+
+    invalid_lines = 0
+
+    def _requests() -> t.Iterator[tuple[pathlib.Path, t.Sequence[str], t.Any]]:
+        nonlocal invalid_lines
+        for line_number, line in enumerate(sys.stdin, 1):
+            if not line.strip():
+                continue
+            try:
+                path, fields, request_id = _parse_request(line)
+            except ValueError as e:
+                click.echo(f"line {line_number}: invalid request: {e}", err=True)
+                invalid_lines += 1
+                continue
+            # the id is passed through as the tag of the request
+            yield path, fields if fields is not None else DEFAULT_FIELDS, request_id
+
+    results = read_stream(
+        _requests(), workers=jobs, ordered=order == "input", config=state.dj.config
+    )
+    for result in results:
+        output: dict[str, t.Any] = {}
+        if result.tag is not None:
+            output["id"] = result.tag
+        output.update(
+            path=str(result.path),
+            values=dict(result.values),
+            errors={
+                field: {"type": type(error).__name__, "message": str(error)}
+                for field, error in result.errors.items()
+            },
+            built=result.built,
+        )
+        click.echo(json.dumps(output, default=dict))
+
+    if invalid_lines:
+        click.get_current_context().exit(1)
+
+
+def _parse_request(
+    line: str,
+) -> tuple[pathlib.Path, list[str] | None, t.Any]:
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(str(e)) from None
+    if not isinstance(request, dict):
+        raise ValueError("a request must be an object")
+    if not isinstance(path := request.get("path"), str):
+        raise ValueError("'path' must be a string")
+    fields = request.get("fields")
+    if fields is not None and not (
+        isinstance(fields, list) and all(isinstance(f, str) for f in fields)
+    ):
+        raise ValueError("'fields' must be a list of strings")
+    return pathlib.Path(path), fields, request.get("id")
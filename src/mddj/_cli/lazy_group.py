@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import importlib
+import typing as t
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    A group whose subcommands are listed in a static table, and only imported when
+    they are invoked or when help for the group is rendered.
+
+    Each entry in ``lazy_subcommands`` maps a command name to the import path of
+    the command, as ``"module:attribute"``.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, _, attribute = self.lazy_subcommands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command '{cmd_name}' in '{self.name}' did not resolve to a "
+                f"click command: {self.lazy_subcommands[cmd_name]}"
+            )
+        return command
@@ -1,43 +1,33 @@
 import click
 
+from mddj._cli.lazy_group import LazyGroup
 from mddj._cli.state import CommandState, common_args
 
-from .authors import read_authors
-from .classifiers import read_classifiers
-from .dependencies import read_dependencies
-from .description import read_description
-from .import_names import read_import_names
-from .import_namespaces import read_import_namespaces
-from .keywords import read_keywords
-from .maintainers import read_maintainers
-from .name import read_name
-from .optional_dependencies import read_optional_dependencies
-from .readthedocs import read_readthedocs
-from .requires_python import read_requires_python
-from .sys import read_sys
-from .tox import read_tox
-from .version import read_version
 
-
-@click.group("read")
+@click.group(
+    "read",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "authors": "mddj._cli.read.authors:read_authors",
+        "classifiers": "mddj._cli.read.classifiers:read_classifiers",
+        "dependencies": "mddj._cli.read.dependencies:read_dependencies",
+        "description": "mddj._cli.read.description:read_description",
+        "fields": "mddj._cli.read.fields:read_fields",
+        "import-names": "mddj._cli.read.import_names:read_import_names",
+        "import-namespaces": "mddj._cli.read.import_namespaces:read_import_namespaces",
+        "keywords": "mddj._cli.read.keywords:read_keywords",
+        "maintainers": "mddj._cli.read.maintainers:read_maintainers",
+        "name": "mddj._cli.read.name:read_name",
+        "optional-dependencies": (
+            "mddj._cli.read.optional_dependencies:read_optional_dependencies"
+        ),
+        "requires-python": "mddj._cli.read.requires_python:read_requires_python",
+        "version": "mddj._cli.read.version:read_version",
+        "readthedocs": "mddj._cli.read.readthedocs:read_readthedocs",
+        "sys": "mddj._cli.read.sys:read_sys",
+        "tox": "mddj._cli.read.tox:read_tox",
+    },
+)
 @common_args
 def read(*, state: CommandState) -> None:
     """Read metadata from the current project."""
-
-
-read.add_command(read_authors)
-read.add_command(read_classifiers)
-read.add_command(read_dependencies)
-read.add_command(read_description)
-read.add_command(read_import_names)
-read.add_command(read_import_namespaces)
-read.add_command(read_keywords)
-read.add_command(read_maintainers)
-read.add_command(read_name)
-read.add_command(read_optional_dependencies)
-read.add_command(read_requires_python)
-read.add_command(read_version)
-
-read.add_command(read_readthedocs)
-read.add_command(read_sys)
-read.add_command(read_tox)
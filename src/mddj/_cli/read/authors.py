@@ -21,7 +21,7 @@ def read_authors(
     Note that when dynamic author metadata is encountered, it is not always possible to
     perfectly reconstruct the inputs.
     """
-    authors = state.dj.read.authors()
+    authors = state.read.authors()
 
     for author_item in authors:
         if only is not None and only not in author_item:
@@ -15,5 +15,5 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def read_classifiers(*, state: CommandState, python_versions: bool) -> None:
     """Read the classifiers of the current project."""
-    for c in state.dj.read.classifiers(python_versions=python_versions):
+    for c in state.read.classifiers(python_versions=python_versions):
         click.echo(c)
@@ -7,5 +7,5 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def read_dependencies(*, state: CommandState) -> None:
     """Read the dependencies of the current project."""
-    for d in state.dj.read.dependencies():
+    for d in state.read.dependencies():
         click.echo(d)
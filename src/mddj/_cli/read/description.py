@@ -7,4 +7,4 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def read_description(*, state: CommandState) -> None:
     """Read the description of the current project."""
-    click.echo(state.dj.read.description())
+    click.echo(state.read.description())
@@ -0,0 +1,57 @@
+import json
+import shlex
+import typing as t
+
+import click
+
+from mddj._cli.state import CommandState, common_args
+from mddj.api import FIELDS
+
+
+@click.command("fields")
+@common_args
+@click.argument("fields", nargs=-1, type=click.Choice(FIELDS))
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(("json", "shell")),
+    default="json",
+    show_default=True,
+    help="The output format.",
+)
+def read_fields(
+    *,
+    fields: tuple[str, ...],
+    output_format: t.Literal["json", "shell"],
+    state: CommandState,
+) -> None:
+    """
+    Read several fields of the current project at once.
+
+    By default, 'name', 'version', 'requires-python', and 'dependencies' are read.
+    All of the fields share one build, if any of them need it.
+
+    With '--format shell', each field is written as an 'export MDDJ_<FIELD>=...'
+    line, for use with 'eval' in CI scripts. Lists of strings are joined with
+    newlines, and tables are written as JSON.
+    """
+    snapshot = state.read.snapshot(fields) if fields else state.read.snapshot()
+    values = snapshot.as_dict()
+
+    if output_format == "json":
+        click.echo(json.dumps(values, indent=2, default=dict))
+    else:
+        for field, value in values.items():
+            variable = "MDDJ_" + field.upper().replace("-", "_")
+            click.echo(f"export {variable}={shlex.quote(_shell_value(value))}")
+
+
+def _shell_value(value: t.Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, tuple) and all(isinstance(item, str) for item in value):
+        return "\n".join(value)
+    # mapping proxies are written as objects
+    return json.dumps(value, default=dict)
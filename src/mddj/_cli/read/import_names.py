@@ -7,5 +7,5 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def read_import_names(*, state: CommandState) -> None:
     """Read the Import-Names of the current project."""
-    for n in state.dj.read.import_names():
+    for n in state.read.import_names():
         click.echo(n)
@@ -7,5 +7,5 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def read_keywords(*, state: CommandState) -> None:
     """Read the keywords of the current project."""
-    for d in state.dj.read.keywords():
+    for d in state.read.keywords():
         click.echo(d)
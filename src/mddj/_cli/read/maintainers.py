@@ -21,7 +21,7 @@ def read_maintainers(
     Note that when dynamic maintainer metadata is encountered, it is not always possible
     to perfectly reconstruct the inputs.
     """
-    maintainers = state.dj.read.maintainers()
+    maintainers = state.read.maintainers()
 
     for maintainer_item in maintainers:
         if only is not None and only not in maintainer_item:
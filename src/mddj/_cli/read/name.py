@@ -7,4 +7,4 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def read_name(*, state: CommandState) -> None:
     """Read the name of the current project."""
-    click.echo(state.dj.read.name())
+    click.echo(state.read.name())
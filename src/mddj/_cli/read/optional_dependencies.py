@@ -47,7 +47,7 @@ def read_optional_dependencies(
     encoded into dependency markers. By default, `mddj` will try to strip off these
     modifications. Use `--exact-wheel-metadata` to disable this behavior.
     """
-    opt_deps = state.dj.read.optional_dependencies(
+    opt_deps = state.read.optional_dependencies(
         exact_wheel_metadata=exact_wheel_metadata
     )
 
@@ -20,5 +20,5 @@ def python_version(*, state: CommandState) -> None:
     By default, this attempts to read from 'build.tools.python'.
     The lookup behavior can be configured in `[tool.mddj.readthedocs]`.
     """
-    value = state.dj.read.readthedocs.python_version()
+    value = state.read.readthedocs.python_version()
     click.echo(value)
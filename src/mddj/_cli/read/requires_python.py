@@ -14,5 +14,5 @@ def read_requires_python(*, state: CommandState, lower_bound: bool) -> None:
     """
     Read the 'Requires-Python' data.
     """
-    requires_python = state.dj.read.requires_python(lower_bound=lower_bound)
+    requires_python = state.read.requires_python(lower_bound=lower_bound)
     click.echo(requires_python)
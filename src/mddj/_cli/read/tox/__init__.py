@@ -1,16 +1,17 @@
 import click
 
+from mddj._cli.lazy_group import LazyGroup
 from mddj._cli.state import CommandState, common_args
 
-from .list_versions import tox_list_versions
-from .min_version import tox_min_version
 
-
-@click.group("tox")
+@click.group(
+    "tox",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "min-version": "mddj._cli.read.tox.min_version:tox_min_version",
+        "list-versions": "mddj._cli.read.tox.list_versions:tox_list_versions",
+    },
+)
 @common_args
 def read_tox(*, state: CommandState) -> None:
     """Read metadata from the current project via 'tox'."""
-
-
-read_tox.add_command(tox_min_version)
-read_tox.add_command(tox_list_versions)
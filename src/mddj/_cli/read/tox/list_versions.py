@@ -8,6 +8,6 @@ from mddj._cli.state import CommandState, common_args
 @common_args
 def tox_list_versions(*, state: CommandState) -> None:
     """Print all of the python versions tested under tox in version-sorted order."""
-    versions = state.dj.read.tox.list_python_versions()
+    versions = state.read.tox.list_python_versions()
     for v in sorted(Version(v) for v in versions):
         click.echo(str(v))
@@ -25,7 +25,7 @@ def read_version(
     state: CommandState,
 ) -> None:
     """Read the 'Version' of the current project."""
-    version = state.dj.read.version()
+    version = state.read.version()
     if attr is not None:
         version = _get_version_attr(version, attr)
     click.echo(version)
@@ -1,14 +1,17 @@
 import click
 
+from mddj._cli.lazy_group import LazyGroup
 from mddj._cli.state import CommandState, common_args
 
-from .version import self_version
 
-
-@click.group("self")
+@click.group(
+    "self",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "version": "mddj._cli.self.version:self_version",
+        "cache": "mddj._cli.self.cache:self_cache",
+    },
+)
 @common_args
 def self(*, state: CommandState) -> None:
     """Interact with mddj itself."""
-
-
-self.add_command(self_version)
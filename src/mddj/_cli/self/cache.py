@@ -0,0 +1,86 @@
+import click
+
+from mddj._cli.state import CommandState, common_args
+from mddj.api import CacheInfo
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+_BYTES_PER_MIB = 1024 * 1024
+
+
+@click.group("cache")
+@common_args
+def self_cache(*, state: CommandState) -> None:
+    """
+    Inspect and maintain the persistent mddj caches.
+
+    There are two caches: 'metadata' holds metadata produced by builds, and
+    'build-envs' holds reusable build environments.
+    The cache location can be set with 'MDDJ_CACHE_DIR'.
+    """
+
+
+@self_cache.command("info")
+@common_args
+def cache_info(*, state: CommandState) -> None:
+    """Show the location, number of entries, and size of each cache."""
+    for info in state.dj.cache.info():
+        click.echo(f"{info.name}:")
+        click.echo(f"    path: {info.path}")
+        click.echo(f"    entries: {info.entries}")
+        click.echo(f"    size: {_format_size(info.size)}")
+
+
+@self_cache.command("prune")
+@common_args
+@click.option(
+    "--max-age",
+    type=click.FloatRange(min=0),
+    default=30,
+    show_default=True,
+    help="Remove entries which have not been used in this many days.",
+)
+@click.option(
+    "--max-size",
+    type=click.FloatRange(min=0),
+    default=64,
+    show_default=True,
+    help=(
+        "Remove least recently used metadata entries until the metadata cache "
+        "is this size, in MiB."
+    ),
+)
+def cache_prune(*, max_age: float, max_size: float, state: CommandState) -> None:
+    """
+    Evict old and least recently used entries from the caches.
+
+    Build environments which are in use are never evicted.
+    """
+    _echo_removed(
+        state.dj.cache.prune(
+            max_age=max_age * _SECONDS_PER_DAY,
+            max_size=int(max_size * _BYTES_PER_MIB),
+        )
+    )
+
+
+@self_cache.command("clear")
+@common_args
+def cache_clear(*, state: CommandState) -> None:
+    """Remove all entries from the caches."""
+    _echo_removed(state.dj.cache.clear())
+
+
+def _echo_removed(removed: tuple[CacheInfo, ...]) -> None:
+    for info in removed:
+        click.echo(
+            f"{info.name}: removed {info.entries} entries "
+            f"({_format_size(info.size)})"
+        )
+
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < _BYTES_PER_MIB:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / _BYTES_PER_MIB:.1f} MiB"
@@ -0,0 +1,50 @@
+import pathlib
+import socket
+
+import click
+
+from mddj._cli.state import CommandState, common_args
+
+
+@click.command("serve")
+@common_args
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    envvar="MDDJ_DAEMON",
+    required=True,
+    help="The path of the Unix socket to listen on. Defaults to 'MDDJ_DAEMON'.",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=600,
+    show_default=True,
+    help="Exit after this many seconds without any connections.",
+)
+def serve(
+    *, socket_path: pathlib.Path, idle_timeout: float, state: CommandState
+) -> None:
+    """
+    Run a daemon which reads metadata for other mddj commands.
+
+    When 'MDDJ_DAEMON' is set to the path of the socket, 'mddj read' commands
+    send their reads to the daemon, which keeps parsed files and build results
+    in memory between commands. Files are checked for changes on every read.
+
+    The daemon's configuration (e.g. 'MDDJ_ISOLATED_BUILDS') is used for all
+    reads, rather than that of each command.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        click.echo("mddj serve requires Unix domain sockets.", err=True)
+        click.get_current_context().exit(1)
+
+    from mddj.api import DJConfig
+    from mddj.api._daemon_server import serve as serve_daemon
+
+    try:
+        serve_daemon(socket_path, config=DJConfig(), idle_timeout=idle_timeout)
+    except FileExistsError as e:
+        click.echo(str(e), err=True)
+        click.get_current_context().exit(1)
@@ -1,18 +1,63 @@
 from __future__ import annotations
 
 import functools
+import os
+import pathlib
 import typing as t
 
 import click
 
-from ..api import DJ
+if t.TYPE_CHECKING:
+    from ..api import DJ
+    from ..api.reader import Reader
 
 F = t.TypeVar("F", bound=t.Callable[..., t.Any])
 
 
 class CommandState:
     def __init__(self) -> None:
-        self.dj = DJ()
+        self._collect_stats = False
+
+    @functools.cached_property
+    def dj(self) -> DJ:
+        # the API is imported when a command first uses it
+        from ..api import DJ, DJConfig
+
+        config = DJConfig()
+        config.collect_stats = config.collect_stats or self._collect_stats
+        return DJ(config)
+
+    @functools.cached_property
+    def read(self) -> Reader:
+        """
+        The reader for commands, which forwards reads to the daemon at
+        ``MDDJ_DAEMON`` when one is listening there.
+        """
+        if socket_path := os.environ.get("MDDJ_DAEMON"):
+            from ..api._daemon import DaemonClient, RemoteReader
+
+            client = DaemonClient(pathlib.Path(socket_path))
+            if client.connect():
+                click.get_current_context().call_on_close(client.close)
+                return t.cast("Reader", RemoteReader(client, pathlib.Path.cwd()))
+        return self.dj.read
+
+    def enable_stats(self) -> None:
+        self._collect_stats = True
+
+    def print_stats(self) -> None:
+        stats = self.dj.stats()
+        name_width = max([len("cache"), *(len(s.name) for s in stats)])
+        click.echo(
+            f"{'cache':<{name_width}}  {'hits':>8}  {'misses':>8}  {'time (s)':>10}",
+            err=True,
+        )
+        for s in stats:
+            click.echo(
+                f"{s.name:<{name_width}}  {s.hits:>8}  {s.misses:>8}  "
+                f"{s.compute_time:>10.4f}",
+                err=True,
+            )
 
 
 def common_args(cmd: F) -> F:
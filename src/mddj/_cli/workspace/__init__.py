@@ -0,0 +1,14 @@
+import click
+
+from mddj._cli.lazy_group import LazyGroup
+from mddj._cli.state import CommandState, common_args
+
+
+@click.group(
+    "workspace",
+    cls=LazyGroup,
+    lazy_subcommands={"list": "mddj._cli.workspace.list:workspace_list"},
+)
+@common_args
+def workspace(*, state: CommandState) -> None:
+    """Interact with the workspace which contains the current project."""
@@ -0,0 +1,22 @@
+import click
+
+from mddj._cli.state import CommandState, common_args
+
+
+@click.command("list")
+@common_args
+def workspace_list(*, state: CommandState) -> None:
+    """
+    Print the directory of each project in the workspace.
+
+    Workspaces are declared by the 'tool.uv.workspace' table, or by a
+    'workspace' table of a hatch environment, in the 'pyproject.toml' file at the
+    workspace root.
+    """
+    try:
+        workspace = state.dj.find_workspace()
+    except LookupError as e:
+        click.echo(str(e), err=True)
+        click.get_current_context().exit(1)
+    for member in workspace.members:
+        click.echo(str(member))
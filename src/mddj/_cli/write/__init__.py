@@ -1,14 +1,14 @@
 import click
 
+from mddj._cli.lazy_group import LazyGroup
 from mddj._cli.state import CommandState, common_args
 
-from .version import write_version
 
-
-@click.group("write")
+@click.group(
+    "write",
+    cls=LazyGroup,
+    lazy_subcommands={"version": "mddj._cli.write.version:write_version"},
+)
 @common_args
 def write(*, state: CommandState) -> None:
     """Write metadata for the current project."""
-
-
-write.add_command(write_version)
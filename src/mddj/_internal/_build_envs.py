@@ -0,0 +1,260 @@
+"""
+A pool of reusable, isolated build environments.
+
+Environments are virtualenvs stored under a cache directory, keyed by the
+normalized list of requirements installed into them and the identity of the
+interpreter. An environment is never modified once it has been created, so a
+build which needs more than its ``build-system.requires`` uses an environment of
+its own, keyed by the full set of requirements.
+
+They are shared between processes, guarded by a lock file per environment:
+
+- creating (or deleting) an environment requires an exclusive lock
+- using an environment to run build hooks requires a shared lock
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import time
+import typing as t
+import venv
+
+from . import _filelock
+
+# bump this to invalidate all existing environments if the layout changes
+_POOL_FORMAT_VERSION = "2"
+_READY_MARKER = "mddj-build-env.json"
+
+DEFAULT_MAX_AGE: float = 30 * 24 * 60 * 60  # 30 days
+
+
+class BuildEnvironmentError(RuntimeError):
+    """Raised when a pooled build environment cannot be created or updated."""
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolEntry:
+    path: pathlib.Path
+    last_used: float
+
+
+class PooledBuildEnv:
+    """
+    An isolated build environment drawn from a pool.
+
+    This satisfies the ``build.env.IsolatedEnv`` protocol, so it can be used with
+    ``build.ProjectBuilder.from_isolated_env``.
+    """
+
+    def __init__(self, path: pathlib.Path, requirements: list[str]) -> None:
+        self.path = path
+        #: The normalized requirements which are installed in the environment.
+        self.requirements = requirements
+
+    @property
+    def python_executable(self) -> str:
+        return str(_env_python(self.path))
+
+    def make_extra_environ(self) -> dict[str, str]:
+        # as in build's DefaultIsolatedEnv, clear PYTHONPATH so that packages of
+        # the host can't shadow the build requirements
+        search_path = str(_env_python(self.path).parent)
+        if (path := os.environ.get("PATH")) is not None:
+            search_path = os.pathsep.join((search_path, path))
+        return {"PATH": search_path, "PYTHONPATH": ""}
+
+
+class BuildEnvPool:
+    def __init__(
+        self, cache_dir: pathlib.Path, *, max_age: float | None = DEFAULT_MAX_AGE
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+
+    @property
+    def envs_dir(self) -> pathlib.Path:
+        return self.cache_dir / "build-envs"
+
+    @contextlib.contextmanager
+    def acquire(
+        self, requirements: t.Collection[str], *, quiet: bool = True
+    ) -> t.Iterator[PooledBuildEnv]:
+        """
+        Get an environment with ``requirements`` installed, creating it if needed.
+
+        The environment is held under a shared lock until the context exits.
+        """
+        normalized = normalize_requirements(requirements)
+        key = environment_key(normalized)
+        env_path = self.envs_dir / key
+        lock = _filelock.FileLock(self.envs_dir / f"{key}.lock")
+
+        lock.acquire()
+        try:
+            created = False
+            while True:
+                if not (env_path / _READY_MARKER).is_file():
+                    self._create(env_path, normalized, quiet=quiet)
+                    created = True
+                lock.acquire(shared=True)
+                if (env_path / _READY_MARKER).is_file():
+                    break
+                # the conversion to a shared lock is not atomic, so the environment
+                # may have been pruned in between
+                lock.acquire()
+
+            # mark the environment as recently used
+            os.utime(env_path / _READY_MARKER)
+
+            yield PooledBuildEnv(env_path, normalized)
+        finally:
+            lock.release()
+
+        if created:
+            self.prune(max_age=self.max_age)
+
+    def entries(self) -> list[PoolEntry]:
+        """List all environments, least recently used first."""
+        result = []
+        try:
+            children = list(self.envs_dir.iterdir())
+        except FileNotFoundError:
+            return []
+        for child in children:
+            try:
+                last_used = (child / _READY_MARKER).stat().st_mtime
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            result.append(PoolEntry(child, last_used))
+        result.sort(key=lambda e: e.last_used)
+        return result
+
+    def prune(self, *, max_age: float | None = None) -> list[PoolEntry]:
+        """
+        Delete environments which have not been used in ``max_age`` seconds, along
+        with their lock files. Environments which are currently in use are skipped.
+
+        Returns the deleted environments.
+        """
+        cutoff = None if max_age is None else time.time() - max_age
+        evicted = []
+        for entry in self.entries():
+            if cutoff is not None and entry.last_used >= cutoff:
+                continue
+            lock = _filelock.FileLock(self.envs_dir / f"{entry.path.name}.lock")
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            finally:
+                lock.delete()
+            evicted.append(entry)
+        self._remove_orphaned_locks()
+        return evicted
+
+    def _remove_orphaned_locks(self) -> None:
+        """Delete lock files whose environments no longer exist."""
+        for lock_path in self.envs_dir.glob("*.lock"):
+            env_path = lock_path.with_suffix("")
+            if env_path.exists():
+                continue
+            lock = _filelock.FileLock(lock_path)
+            if not lock.acquire(blocking=False):
+                continue
+            # the environment may have been created before the lock was acquired
+            if env_path.exists():
+                lock.release()
+            else:
+                lock.delete()
+
+    def _create(
+        self, env_path: pathlib.Path, requirements: list[str], *, quiet: bool
+    ) -> None:
+        # a previous attempt may have been interrupted, leaving a partial env
+        if env_path.exists():
+            shutil.rmtree(env_path)
+
+        try:
+            try:
+                builder = venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt")
+                builder.create(env_path)
+            except subprocess.CalledProcessError as e:
+                raise BuildEnvironmentError(
+                    f"Failed to create a build environment: {e}"
+                ) from e
+            if requirements:
+                _pip_install(env_path, requirements, quiet=quiet)
+        except BaseException:
+            shutil.rmtree(env_path, ignore_errors=True)
+            raise
+
+        marker = {"requires": requirements}
+        (env_path / _READY_MARKER).write_text(json.dumps(marker), encoding="utf-8")
+
+
+def normalize_requirements(requirements: t.Iterable[str]) -> list[str]:
+    """
+    Normalize a collection of requirements so that equivalent lists compare equal,
+    regardless of order, whitespace, or name normalization.
+    """
+    from packaging.requirements import Requirement
+    from packaging.utils import canonicalize_name
+
+    normalized = set()
+    for requirement in requirements:
+        parsed = Requirement(requirement)
+        parsed.name = canonicalize_name(parsed.name)
+        normalized.add(str(parsed))
+    return sorted(normalized)
+
+
+def environment_key(normalized_requirements: list[str]) -> str:
+    """
+    Compute the key for an environment from its (normalized) requirements and the
+    identity of the current interpreter.
+    """
+    identity = {
+        "format": _POOL_FORMAT_VERSION,
+        "requires": normalized_requirements,
+        "executable": os.path.realpath(sys.executable),
+        "version": sys.version,
+        "cache_tag": sys.implementation.cache_tag,
+    }
+    digest = hashlib.sha256(json.dumps(identity, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def _env_python(env_path: pathlib.Path) -> pathlib.Path:
+    if os.name == "nt":
+        return env_path / "Scripts" / "python.exe"
+    return env_path / "bin" / "python"
+
+
+def _pip_install(
+    env_path: pathlib.Path, requirements: t.Sequence[str], *, quiet: bool
+) -> None:
+    cmd = [
+        str(_env_python(env_path)),
+        "-m",
+        "pip",
+        "install",
+        "--disable-pip-version-check",
+        "--no-input",
+        *requirements,
+    ]
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    result = subprocess.run(cmd, capture_output=quiet, text=True, env=env)
+    if result.returncode != 0:
+        message = f"Failed to install build requirements: {', '.join(requirements)}"
+        if quiet:
+            message = f"{message}\n{result.stdout}{result.stderr}"
+        raise BuildEnvironmentError(message)
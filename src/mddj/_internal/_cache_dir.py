@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+
+
+def default_cache_dir() -> pathlib.Path:
+    """
+    Get the default directory for persistent mddj caches.
+
+    ``MDDJ_CACHE_DIR`` takes precedence. Otherwise, the platform's conventional
+    user cache location is used.
+    """
+    if explicit := os.environ.get("MDDJ_CACHE_DIR"):
+        return pathlib.Path(explicit)
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+        if base:
+            return pathlib.Path(base) / "mddj" / "Cache"
+        return pathlib.Path.home() / "AppData" / "Local" / "mddj" / "Cache"
+    if sys.platform == "darwin":
+        return pathlib.Path.home() / "Library" / "Caches" / "mddj"
+
+    if xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        return pathlib.Path(xdg_cache_home) / "mddj"
+    return pathlib.Path.home() / ".cache" / "mddj"
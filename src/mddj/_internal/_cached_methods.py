@@ -1,24 +1,71 @@
 """
 An implementation of method caching as proposed for `functools` itself in
 https://github.com/python/cpython/pull/150002
+
+Unlike `functools`, the caches here are single-flight: when several threads call a
+cached method (or get a cached property) with the same instance and arguments, one
+thread computes the value while the others wait for it.
 """
 
+import contextlib
 import functools
+import threading
 import typing as t
 import weakref
 
+from . import _stats
+
 T = t.TypeVar("T")
 R = t.TypeVar("R")
 P = t.ParamSpec("P")
 
 F = t.TypeVar("F", bound=t.Callable[..., t.Any])
 
+_make_key = functools._make_key
+
+
+class _KeyedLocks:
+    """
+    Reentrant locks which are created for each key when it is first held, and
+    discarded when no thread holds or waits for them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # each key's lock, and the number of threads holding or waiting for it
+        self._locks: dict[t.Hashable, tuple[threading.RLock, int]] = {}
+
+    @contextlib.contextmanager
+    def hold(self, key: t.Hashable) -> t.Iterator[None]:
+        with self._lock:
+            lock, users = self._locks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.RLock()
+            self._locks[key] = lock, users + 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._locks[key]
+                if users == 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = lock, users - 1
+
 
 def _cached_method_weakref_callback(
-    cache_dict: dict[int, T], id_key: int
+    cache_dict: dict[int, tuple[weakref.ref[t.Any], T]],
+    table_lock: threading.RLock,
+    id_key: int,
 ) -> t.Callable[[weakref.ref[R]], None]:
     def callback(ref: weakref.ref[R]) -> None:
-        cache_dict.pop(id_key)
+        # the id may already have been reused by a new instance, whose entry must
+        # be kept
+        with table_lock:
+            entry = cache_dict.get(id_key)
+            if entry is not None and entry[0] is ref:
+                del cache_dict[id_key]
 
     return callback
 
@@ -29,12 +76,51 @@ def _wrap_unbound_cached_method(
     maxsize: int | None,
     typed: bool,
 ) -> t.Callable[P, T]:
+    locks = _KeyedLocks()
+    stats_name = unbound_method.__qualname__
+
+    if maxsize is None:
+        results: dict[t.Hashable, T] = {}
+
+        @functools.wraps(unbound_method)
+        def wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
+            if _stats.enabled:
+                _stats.record_lookup(stats_name)
+            # the args are a valid key by themselves, and cheaper than _make_key
+            key = args if not (kwargs or typed) else _make_key(args, kwargs, typed)
+            # values are only ever added, so hits need no lock
+            try:
+                return results[key]
+            except KeyError:
+                pass
+            with locks.hold(key):
+                try:
+                    return results[key]
+                except KeyError:
+                    self_val: R = ref()  # type: ignore[assignment]
+                    with _stats.miss(stats_name):
+                        value = unbound_method(self_val, *args, **kwargs)
+                    results[key] = value
+                    return value
+
+        return wrapped
+
     @functools.lru_cache(maxsize, typed)
-    def wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
+    def cached(*args: P.args, **kwargs: P.kwargs) -> T:
         self_val: R = ref()  # type: ignore[assignment]
-        return unbound_method(self_val, *args, **kwargs)
+        with _stats.miss(stats_name):
+            return unbound_method(self_val, *args, **kwargs)
+
+    @functools.wraps(unbound_method)
+    def wrapped_lru(*args: P.args, **kwargs: P.kwargs) -> T:
+        if _stats.enabled:
+            _stats.record_lookup(stats_name)
+        # lru_cache is thread-safe, but computes a value in every thread which
+        # misses the cache, so only one thread at a time may try each key
+        with locks.hold(_make_key(args, kwargs, typed)):
+            return cached(*args, **kwargs)  # type: ignore[arg-type]
 
-    return wrapped  # type: ignore[return-value]
+    return wrapped_lru
 
 
 class _cached_method:
@@ -61,6 +147,8 @@ class _cached_method:
         self._function_table: dict[
             int, tuple[weakref.ref[object], t.Callable[..., t.Any]]
         ] = {}
+        # reentrant, as a weakref callback may run in a thread which holds it
+        self._table_lock = threading.RLock()
 
         self._maxsize = maxsize
         self._typed = typed
@@ -86,12 +174,22 @@ class _cached_method:
 
         instance_id = id(instance)
 
-        try:
-            ref, cached_func = self._function_table[instance_id]
-        except KeyError:
+        # an entry whose ref is dead belongs to a collected instance with the same
+        # id, whose callback has not run yet
+        entry = self._function_table.get(instance_id)
+        if entry is not None and entry[0]() is instance:
+            return entry[1]
+
+        with self._table_lock:
+            entry = self._function_table.get(instance_id)
+            if entry is not None and entry[0]() is instance:
+                return entry[1]
+
             ref = weakref.ref(
                 instance,
-                _cached_method_weakref_callback(self._function_table, instance_id),
+                _cached_method_weakref_callback(
+                    self._function_table, self._table_lock, instance_id
+                ),
             )
             cached_func = _wrap_unbound_cached_method(
                 ref, self.func, self._maxsize, self._typed
@@ -101,6 +199,70 @@ class _cached_method:
         return cached_func
 
 
+class cached_property(functools.cached_property[T]):
+    """
+    A `functools.cached_property` which computes the value once for each instance
+    when it is accessed by several threads. Instances of different objects are
+    computed in parallel.
+
+    Unlike `functools.cached_property`, this is a data descriptor, so that hits can
+    be counted in the cache statistics. Values are still stored in the instance's
+    ``__dict__``, and can be set or deleted there.
+    """
+
+    def __init__(self, func: t.Callable[[t.Any], T]) -> None:
+        super().__init__(func)
+        self._locks = _KeyedLocks()
+
+    @t.overload
+    def __get__(  # noqa: E704
+        self, instance: None, owner: type[t.Any] | None = None
+    ) -> "cached_property[T]": ...
+
+    @t.overload
+    def __get__(  # noqa: E704
+        self, instance: object, owner: type[t.Any] | None = None
+    ) -> T: ...
+
+    def __get__(
+        self, instance: object | None, owner: type[t.Any] | None = None
+    ) -> "T | cached_property[T]":
+        if instance is None:
+            return self
+        name = self._name()
+        if _stats.enabled:
+            _stats.record_lookup(self.func.__qualname__)
+        cache = instance.__dict__
+        try:
+            return cache[name]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+
+        # the instance is alive while its lock is held, so its id is unique
+        with self._locks.hold(id(instance)):
+            try:
+                return cache[name]  # type: ignore[no-any-return]
+            except KeyError:
+                with _stats.miss(self.func.__qualname__):
+                    value = self.func(instance)
+                cache[name] = value
+                return value
+
+    def __set__(self, instance: object, value: T) -> None:
+        instance.__dict__[self._name()] = value
+
+    def __delete__(self, instance: object) -> None:
+        del instance.__dict__[self._name()]
+
+    def _name(self) -> str:
+        if self.attrname is None:
+            raise TypeError(
+                "Cannot use cached_property instance without calling __set_name__ "
+                "on it."
+            )
+        return self.attrname
+
+
 @t.overload
 def cached_method(  # noqa: E704
     func: None = None,
@@ -1,20 +1,192 @@
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import pathlib
+import sys
+import threading
+import typing as t
 
-import tomlkit
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+from . import _partial_toml, _stats
+
+if t.TYPE_CHECKING:
+    import tomlkit
+
+# files at least this large are read table-by-table, when possible
+_PARTIAL_PARSE_MIN_SIZE = 64 * 1024
+
+# process-wide caches, keyed by whether or not they verify content hashes
+_SHARED_CACHES: dict[bool, TomlDocumentCache] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def shared_cache(*, verify_hashes: bool = False) -> TomlDocumentCache:
+    """
+    Get the process-wide document cache, which validates its entries against the
+    files on disk on every access.
+    """
+    with _SHARED_CACHES_LOCK:
+        if verify_hashes not in _SHARED_CACHES:
+            _SHARED_CACHES[verify_hashes] = TomlDocumentCache(
+                validate=True, verify_hashes=verify_hashes
+            )
+        return _SHARED_CACHES[verify_hashes]
+
+
+@dataclasses.dataclass(frozen=True)
+class _FileState:
+    mtime_ns: int
+    size: int
+    inode: int
+    digest: bytes | None
+
+    @classmethod
+    def of(cls, path: pathlib.Path, *, with_digest: bool) -> _FileState:
+        stat = path.stat()
+        digest = None
+        if with_digest:
+            digest = hashlib.sha256(path.read_bytes()).digest()
+        return cls(stat.st_mtime_ns, stat.st_size, stat.st_ino, digest)
 
 
 class TomlDocumentCache:
-    def __init__(self) -> None:
-        self._cache: dict[pathlib.Path, tomlkit.TOMLDocument] = {}
+    """
+    A cache of parsed TOML files.
+
+    Reads use plain data parsed with ``tomllib``. A style-preserving ``tomlkit``
+    document, which is much slower to build, is only parsed for files which are
+    written.
+
+    Large files are not parsed in full when only some tables are needed (see
+    ``load_table``).
+
+    By default, files are assumed not to change while the cache is in use, other
+    than by writes which call ``invalidate``. With ``validate=True``, each access
+    checks the file's mtime, size, and inode, and with ``verify_hashes=True`` also
+    its SHA-256 digest, and re-parses the file if it has changed.
+    """
+
+    def __init__(self, *, validate: bool = False, verify_hashes: bool = False) -> None:
+        self._validate = validate or verify_hashes
+        self._verify_hashes = verify_hashes
+        # guards the entries of a cache which is shared between threads
+        self._lock = threading.RLock()
+        # when validating, the state of each file when its entries were created
+        self._states: dict[pathlib.Path, _FileState] = {}
+        self._cache: dict[pathlib.Path, dict[str, t.Any]] = {}
+        self._write_cache: dict[pathlib.Path, tomlkit.TOMLDocument] = {}
+        # for large files, an index of tables, or None if the file must be parsed
+        # in full
+        self._indexes: dict[pathlib.Path, _partial_toml.TableIndex | None] = {}
+        self._tables: dict[pathlib.Path, dict[tuple[str, ...], t.Any]] = {}
 
-    def load(self, path: pathlib.Path) -> tomlkit.TOMLDocument:
-        if not path.is_absolute():
-            raise ValueError("Cached loads must use absolute paths for consistency.")
+    def load(self, path: pathlib.Path) -> dict[str, t.Any]:
+        _check_absolute(path)
+        _stats.record_lookup("TomlDocumentCache.load")
+        with self._lock:
+            self._check_current(path)
+            return self._load(path, "TomlDocumentCache.load")
 
+    def load_table(self, path: pathlib.Path, *keys: str) -> t.Any:
+        """
+        Load the value of a table (or any other value) in a file, or None if it is
+        not defined.
+
+        For large files, only the parts of the file which define the table are
+        parsed, unless the file has to be parsed in full to find it.
+        """
+        _check_absolute(path)
+        _stats.record_lookup("TomlDocumentCache.load_table")
+        with self._lock:
+            self._check_current(path)
+            return self._load_table(path, keys)
+
+    def load_for_write(self, path: pathlib.Path) -> tomlkit.TOMLDocument:
+        """Load a document which can be modified and written back to ``path``."""
+        _check_absolute(path)
+        with self._lock:
+            self._check_current(path)
+            if path not in self._write_cache:
+                import tomlkit
+
+                with path.open("r", encoding="utf-8") as fp:
+                    self._write_cache[path] = tomlkit.load(fp)
+            return self._write_cache[path]
+
+    def invalidate(self, path: pathlib.Path) -> None:
+        """Drop the plain data for a file, after it has been written."""
+        with self._lock:
+            self._cache.pop(path, None)
+            self._states.pop(path, None)
+            self._indexes.pop(path, None)
+            self._tables.pop(path, None)
+
+    def _load(self, path: pathlib.Path, stats_name: str) -> dict[str, t.Any]:
+        # a miss is counted for the public method which needed the parse
         if path not in self._cache:
-            with path.open("r", encoding="utf-8") as fp:
-                data = tomlkit.load(fp)
-            self._cache[path] = data
+            with _stats.miss(stats_name), path.open("rb") as fp:
+                self._cache[path] = tomllib.load(fp)
         return self._cache[path]
+
+    def _load_table(self, path: pathlib.Path, keys: tuple[str, ...]) -> t.Any:
+        if path not in self._cache and (index := self._index(path)) is not None:
+            tables = self._tables.setdefault(path, {})
+            if keys not in tables:
+                try:
+                    with _stats.miss("TomlDocumentCache.load_table"):
+                        tables[keys] = index.read_table(path, keys)
+                except _partial_toml.Ambiguous:
+                    self._indexes[path] = None
+                    return self._load_table(path, keys)
+            return tables[keys]
+
+        cursor: t.Any = self._load(path, "TomlDocumentCache.load_table")
+        for key in keys:
+            if not isinstance(cursor, dict) or key not in cursor:
+                return None
+            cursor = cursor[key]
+        return cursor
+
+    def _index(self, path: pathlib.Path) -> _partial_toml.TableIndex | None:
+        if path not in self._indexes:
+            index = None
+            if path.stat().st_size >= _PARTIAL_PARSE_MIN_SIZE:
+                try:
+                    index = _partial_toml.TableIndex.build(path)
+                except _partial_toml.Ambiguous:
+                    pass
+            self._indexes[path] = index
+        return self._indexes[path]
+
+    def _check_current(self, path: pathlib.Path) -> None:
+        """
+        When validating, drop all entries for a file which has changed since they
+        were created.
+
+        The state is read before the file is parsed, so a change which races with
+        parsing only causes an unnecessary re-parse on the next access.
+        """
+        if not self._validate:
+            return
+        try:
+            state = _FileState.of(path, with_digest=self._verify_hashes)
+        except OSError:
+            self._discard(path)
+            raise
+        if self._states.get(path) != state:
+            self._discard(path)
+            self._states[path] = state
+
+    def _discard(self, path: pathlib.Path) -> None:
+        self.invalidate(path)
+        self._write_cache.pop(path, None)
+
+
+def _check_absolute(path: pathlib.Path) -> None:
+    if not path.is_absolute():
+        raise ValueError("Cached loads must use absolute paths for consistency.")
@@ -0,0 +1,95 @@
+"""
+A parser for Core Metadata (``METADATA`` and ``PKG-INFO`` files).
+
+Headers are indexed in a single pass, which stops at the end of the headers. The
+body (the long description, in Metadata 2.1+) is only sliced out of the text when
+it is requested.
+
+Values match those produced by ``importlib.metadata``, which parses the same
+format with ``email`` and re-indents folded values.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import textwrap
+import typing as t
+
+_T = t.TypeVar("_T")
+
+# a blank line, which separates the headers from the body
+_SEPARATOR_RE = re.compile(r"(?:^|\n)\r?\n")
+# header names are printable ASCII, excluding the colon
+_HEADER_RE = re.compile(r"([\041-\071\073-\176]+):[ \t]*(.*)")
+
+
+class CoreMetadata:
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._headers: dict[str, list[str]] = {}
+        self._body_start = len(text)
+        self._parse_headers()
+
+    def get(self, name: str) -> str | None:
+        """Get the first value of a header, or None if it is absent."""
+        values = self._values(name)
+        return values[0] if values else None
+
+    def get_all(self, name: str, failobj: _T) -> list[str] | _T:
+        """Get all of the values of a header, or ``failobj`` if it is absent."""
+        return self._values(name) or failobj
+
+    def __contains__(self, name: str) -> bool:
+        return bool(self._values(name))
+
+    @functools.cached_property
+    def body(self) -> str:
+        return self._text[self._body_start :]
+
+    def _values(self, name: str) -> list[str]:
+        key = name.lower()
+        values = self._headers.get(key, [])
+        # like importlib.metadata, the body is treated as a trailing description
+        if key == "description" and self.body:
+            values = [*values, self.body]
+        return values
+
+    def _parse_headers(self) -> None:
+        text = self._text
+        # only the header block is split into lines
+        if (separator := _SEPARATOR_RE.search(text)) is not None:
+            header_block = text[: separator.start()]
+            self._body_start = separator.end()
+        else:
+            header_block = text.rstrip("\r\n")
+
+        name: str | None = None
+        value_lines: list[str] = []
+        pos = 0
+        for line in header_block.split("\n") if header_block else ():
+            line_start, pos = pos, pos + len(line) + 1
+            line = line.rstrip("\r")
+            if line[:1] in (" ", "\t") and name is not None:
+                value_lines.append(line)
+                continue
+
+            if name is not None:
+                self._add(name, value_lines)
+                name = None
+            if (match := _HEADER_RE.match(line)) is None:
+                # a line which is not a header is the start of the body
+                self._body_start = line_start
+                return
+            name, first_value = match.groups()
+            value_lines = [first_value]
+
+        if name is not None:
+            self._add(name, value_lines)
+
+    def _add(self, name: str, value_lines: list[str]) -> None:
+        value = "\n".join(value_lines)
+        if len(value_lines) > 1:
+            # "Correct for RFC822 indentation", as importlib.metadata does
+            value = textwrap.dedent(" " * 8 + value)
+        self._headers.setdefault(name.lower(), []).append(value)
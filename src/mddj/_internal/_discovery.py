@@ -2,32 +2,75 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+import os
 import pathlib
+import threading
 import typing as t
 
-import tomlkit
-
-from . import _cached_toml, _types
+from . import _cached_methods, _cached_toml, _workspace
 
 Characteristic: t.TypeAlias = t.Literal[
-    "pyproject", "python-package", "tox", "readthedocs", "vcs-root"
+    "pyproject", "python-package", "tox", "readthedocs", "vcs-root", "workspace"
 ]
+_CHARACTERISTICS: tuple[Characteristic, ...] = t.get_args(Characteristic)
 _VCS_INDICATORS: tuple[str, ...] = (".git", ".hg", ".svn")
 
 
 class DirExplorer:
+    """
+    Find directories with certain characteristics, searching upwards from a
+    starting directory until a VCS root is found.
+
+    By default, each directory is listed. With ``probe=True``, each directory is
+    instead checked for only the names which can match, which avoids listing
+    very large directories on slow filesystems.
+
+    The search never moves up into one of the ``ceiling_directories``.
+
+    The ancestors of each start dir are walked once, to build an index of the
+    nearest directory with each characteristic (see ``characteristic_index``).
+    Explorers made by ``with_start_dir`` share their nodes and indexes, and a lock
+    which guards them, so they may be used from several threads.
+    """
+
     def __init__(
         self,
         default_start_dir: pathlib.Path,
         *,
         document_cache: _cached_toml.TomlDocumentCache | None = None,
+        probe: bool = False,
+        ceiling_directories: t.Iterable[pathlib.Path] = (),
     ) -> None:
         self.default_start_dir = default_start_dir
+        self.probe = probe
+        self.ceiling_directories = frozenset(
+            _normalize(d) for d in ceiling_directories if d.is_absolute()
+        )
 
         self._document_cache = document_cache or _cached_toml.TomlDocumentCache()
 
         # all nodes in a flat cache
         self._node_cache: dict[pathlib.Path, DiscoveryNode] = {}
+        # an index for each start dir
+        self._indexes: dict[pathlib.Path, CharacteristicIndex] = {}
+        # guards the nodes and indexes, which may be shared between explorers
+        self._lock = threading.RLock()
+
+    def with_start_dir(self, start_dir: pathlib.Path) -> DirExplorer:
+        """
+        Get an explorer which searches from another directory by default, and
+        shares the nodes and indexes of this explorer.
+        """
+        explorer = DirExplorer(
+            start_dir,
+            document_cache=self._document_cache,
+            probe=self.probe,
+            ceiling_directories=self.ceiling_directories,
+        )
+        explorer._node_cache = self._node_cache
+        explorer._indexes = self._indexes
+        explorer._lock = self._lock
+        return explorer
 
     @functools.cached_property
     def pyproject_path(self) -> pathlib.Path | None:
@@ -39,33 +82,120 @@ class DirExplorer:
     def search_for(
         self, characteristic: Characteristic, *, start_dir: pathlib.Path | None = None
     ) -> DiscoveryNode:
+        node = self.characteristic_index(start_dir=start_dir).lookup(characteristic)
+        if node is None:
+            raise LookupError(
+                f"mddj searched for a directory which matched the '{characteristic}' "
+                "rule and could not find one."
+            )
+        return node
+
+    def find_workspace(
+        self, *, start_dir: pathlib.Path | None = None
+    ) -> _workspace.Workspace:
+        """
+        Find the nearest directory which declares a workspace, and read its
+        members. No directories other than those named by the workspace's
+        globs are listed.
+        """
+        root = self.search_for("workspace", start_dir=start_dir).dirpath
+        workspace = _workspace.Workspace.load(root, self._document_cache)
+        # the detector and the loader read the same tables
+        assert workspace is not None
+        return workspace
+
+    def characteristic_index(
+        self, *, start_dir: pathlib.Path | None = None
+    ) -> CharacteristicIndex:
+        """
+        Get the index of characteristics for the ancestors of a directory, which is
+        built in one walk upwards and reused by every search from that directory.
+        """
         if start_dir is None:
             start_dir = self.default_start_dir
 
-        for node in DiscoveryNode._vcs_bounded_ancestors(
-            start_dir, node_cache=self._node_cache
-        ):
-            node.run_dir_content_detection()
+        with self._lock:
+            if start_dir not in self._indexes:
+                nodes = DiscoveryNode._vcs_bounded_ancestors(
+                    start_dir,
+                    node_cache=self._node_cache,
+                    probe=self.probe,
+                    ceiling_directories=self.ceiling_directories,
+                )
+                self._indexes[start_dir] = CharacteristicIndex(
+                    tuple(nodes), self._document_cache, lock=self._lock
+                )
+            return self._indexes[start_dir]
+
+
+class CharacteristicIndex:
+    """
+    A map from each characteristic to the nearest node which has it, or None, for
+    one chain of ancestor directories.
+
+    Characteristics which are found from directory contents are indexed when the
+    index is built. Those which require parsing ``pyproject.toml`` are resolved
+    on first lookup, so that other searches never parse it.
+    """
+
+    def __init__(
+        self,
+        nodes: tuple[DiscoveryNode, ...],
+        document_cache: _cached_toml.TomlDocumentCache,
+        *,
+        lock: threading.RLock | None = None,
+    ) -> None:
+        self.nodes = nodes
+        self._document_cache = document_cache
+        # guards the nodes, which pyproject detection updates
+        self._lock = lock or threading.RLock()
+        self._nearest: dict[Characteristic, DiscoveryNode | None] = {
+            characteristic: None
+            for characteristic in _CHARACTERISTICS
+            if characteristic not in _PYPROJECT_CHARACTERISTICS
+        }
+        for node in reversed(nodes):
+            for characteristic in node.characteristics:
+                if characteristic in self._nearest:
+                    self._nearest[characteristic] = node
+
+    def lookup(self, characteristic: Characteristic) -> DiscoveryNode | None:
+        with self._lock:
+            if characteristic not in self._nearest:
+                self._nearest[characteristic] = self._search_with_pyproject(
+                    characteristic
+                )
+            return self._nearest[characteristic]
+
+    def as_dict(self) -> dict[Characteristic, pathlib.Path | None]:
+        """Resolve every characteristic, for debugging."""
+        result: dict[Characteristic, pathlib.Path | None] = {}
+        for characteristic in _CHARACTERISTICS:
+            node = self.lookup(characteristic)
+            result[characteristic] = None if node is None else node.dirpath
+        return result
+
+    def _search_with_pyproject(
+        self, characteristic: Characteristic
+    ) -> DiscoveryNode | None:
+        for node in self.nodes:
             if characteristic in node.characteristics:
                 return node
             if node.has_pyproject_file:
-                pyproject_content = self._document_cache.load(
-                    node.dirpath / "pyproject.toml"
+                node.run_pyproject_detection(
+                    node.dirpath / "pyproject.toml", self._document_cache
                 )
-                node.run_pyproject_detection(pyproject_content)
             if characteristic in node.characteristics:
                 return node
-
-        raise LookupError(
-            f"mddj searched for a directory which matched the '{characteristic}' rule "
-            "and could not find one."
-        )
+        return None
 
 
 class _ParsedPyprojectTomlDetector(t.Protocol):
     characteristics: tuple[Characteristic, ...]
 
-    def match(self, document: tomlkit.TOMLDocument) -> bool: ...  # noqa: E704
+    def match(  # noqa: E704
+        self, path: pathlib.Path, document_cache: _cached_toml.TomlDocumentCache
+    ) -> bool: ...
 
 
 class _DirContentsDetector(t.Protocol):
@@ -100,13 +230,19 @@ class _SetupPyPackageDetector:
 class _ToxToolTableDetector:
     characteristics: tuple[Characteristic, ...] = ("tox",)
 
-    def match(self, document: tomlkit.TOMLDocument) -> bool:
-        if "tool" not in document:
-            return False
-        tool_table = document["tool"]
-        if not _types.is_toml_table(tool_table):
-            return False
-        return "tox" in tool_table
+    def match(
+        self, path: pathlib.Path, document_cache: _cached_toml.TomlDocumentCache
+    ) -> bool:
+        return document_cache.load_table(path, "tool", "tox") is not None
+
+
+class _WorkspaceTableDetector:
+    characteristics: tuple[Characteristic, ...] = ("workspace",)
+
+    def match(
+        self, path: pathlib.Path, document_cache: _cached_toml.TomlDocumentCache
+    ) -> bool:
+        return bool(_workspace.read_declarations(path, document_cache))
 
 
 _DIR_CONTENTS_DETECTORS: tuple[_DirContentsDetector, ...] = (
@@ -119,6 +255,12 @@ _DIR_CONTENTS_DETECTORS: tuple[_DirContentsDetector, ...] = (
 )
 _PYPROJECT_CONTENT_DETECTORS: tuple[_ParsedPyprojectTomlDetector, ...] = (
     _ToxToolTableDetector(),
+    _WorkspaceTableDetector(),
+)
+_PYPROJECT_CHARACTERISTICS: frozenset[Characteristic] = frozenset(
+    characteristic
+    for detector in _PYPROJECT_CONTENT_DETECTORS
+    for characteristic in detector.characteristics
 )
 
 
@@ -128,11 +270,31 @@ _NAMES_OF_INTEREST: set[str] = {
     if isinstance(detector, _SimplePathDetector)
     for name in detector.names
 } | {"setup.py"}
+# the names which are checked for when probing, rather than listing, a directory
+_PROBED_NAMES: tuple[str, ...] = tuple(sorted(_NAMES_OF_INTEREST | {"__init__.py"}))
+
+
+def detect_characteristics(dir_contents: frozenset[str]) -> list[Characteristic]:
+    """Get the characteristics of a directory which has the given contents."""
+    # if there's nothing of interest in a dir, bail quickly (expect this to
+    # be the majority case, make it fast)
+    if not _NAMES_OF_INTEREST & dir_contents:
+        return []
+
+    characteristics: list[Characteristic] = []
+    for detector in _DIR_CONTENTS_DETECTORS:
+        if not detector.match(dir_contents):
+            continue
+        for result in detector.characteristics:
+            if result not in characteristics:
+                characteristics.append(result)
+    return characteristics
 
 
 @dataclasses.dataclass
 class DiscoveryNode:
     dirpath: pathlib.Path
+    probe: bool = False
     _characteristics: list[Characteristic] = dataclasses.field(default_factory=list)
     _ran_pyproject_detection: bool = False
 
@@ -149,12 +311,14 @@ class DiscoveryNode:
     def has_pyproject_file(self) -> bool:
         return "pyproject.toml" in self._dir_contents
 
-    def run_pyproject_detection(self, document: tomlkit.TOMLDocument) -> None:
+    def run_pyproject_detection(
+        self, path: pathlib.Path, document_cache: _cached_toml.TomlDocumentCache
+    ) -> None:
         if self._ran_pyproject_detection:
             return
 
         for detector in _PYPROJECT_CONTENT_DETECTORS:
-            if not detector.match(document):
+            if not detector.match(path, document_cache):
                 continue
             for result in detector.characteristics:
                 if result not in self._characteristics:
@@ -162,33 +326,46 @@ class DiscoveryNode:
 
         self._ran_pyproject_detection = True
 
-    @functools.cached_property
+    @_cached_methods.cached_property
     def _dir_contents(self) -> frozenset[str]:
-        """get dir contents and add to inferred characteristics"""
-        dir_contents = frozenset(p.name for p in self.dirpath.iterdir())
-        # if there's nothing of interest in a dir, bail quickly (expect this to
-        # be the majority case, make it fast)
-        if not _NAMES_OF_INTEREST & dir_contents:
-            return dir_contents
-
-        for detector in _DIR_CONTENTS_DETECTORS:
-            if not detector.match(dir_contents):
-                continue
-            for result in detector.characteristics:
-                if result not in self._characteristics:
-                    self._characteristics.append(result)
+        """
+        get dir contents and add to inferred characteristics
+
+        when probing, only the names which detectors look for are included
+        """
+        if self.probe:
+            dir_contents = frozenset(_probe(self.dirpath))
+        else:
+            try:
+                dir_contents = frozenset(p.name for p in self.dirpath.iterdir())
+            except PermissionError:
+                # an unreadable ancestor has no contents, as when probing
+                dir_contents = frozenset()
+        for result in detect_characteristics(dir_contents):
+            if result not in self._characteristics:
+                self._characteristics.append(result)
 
         return dir_contents
 
     @classmethod
     def _vcs_bounded_ancestors(
-        cls, start_dir: pathlib.Path, *, node_cache: dict[pathlib.Path, DiscoveryNode]
+        cls,
+        start_dir: pathlib.Path,
+        *,
+        node_cache: dict[pathlib.Path, DiscoveryNode],
+        probe: bool = False,
+        ceiling_directories: frozenset[pathlib.Path] = frozenset(),
     ) -> t.Iterator[DiscoveryNode]:
         for d in _ancestors(start_dir):
+            # like git, the start dir may itself be a ceiling, but the search
+            # never moves up into one
+            if d != start_dir and _normalize(d) in ceiling_directories:
+                break
+
             if d in node_cache:
                 item = node_cache[d]
             else:
-                item = cls(dirpath=d)
+                item = cls(dirpath=d, probe=probe)
                 node_cache[d] = item
 
             yield item
@@ -203,3 +380,18 @@ class DiscoveryNode:
 def _ancestors(start_dir: pathlib.Path) -> t.Iterator[pathlib.Path]:
     yield start_dir
     yield from start_dir.parents
+
+
+def _probe(dirpath: pathlib.Path) -> t.Iterator[str]:
+    # lstat finds the same names as a listing would, including broken symlinks
+    for name in _PROBED_NAMES:
+        try:
+            os.lstat(os.path.join(dirpath, name))
+        except OSError:
+            continue
+        yield name
+
+
+def _normalize(path: pathlib.Path) -> pathlib.Path:
+    # normalize lexically, to avoid resolving symlinks on slow filesystems
+    return pathlib.Path(os.path.normpath(path))
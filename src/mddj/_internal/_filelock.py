@@ -0,0 +1,138 @@
+"""
+Advisory inter-process file locks.
+
+On POSIX, these are ``flock()`` locks, which support shared and exclusive modes.
+On Windows, only exclusive locks are available, so shared requests are treated as
+exclusive.
+
+A lock file may be deleted by the holder of an exclusive lock. Anyone who was
+waiting on the deleted file finds that it is no longer at the lock's path once
+they acquire it, and waits on the current file instead.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import time
+import types
+
+
+class FileLock:
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self._fd: int | None = None
+        self._held = False
+
+    def acquire(self, *, shared: bool = False, blocking: bool = True) -> bool:
+        """
+        Acquire the lock, or convert an already held lock to the requested mode.
+
+        Returns False if ``blocking=False`` and the lock is held by someone else.
+        In that case, any lock previously held via this object is released, since
+        ``flock()`` conversions are not atomic.
+        """
+        while True:
+            if self._fd is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            elif self._held and not _SUPPORTS_SHARED:
+                # the lock is always exclusive, so there is nothing to convert
+                return True
+
+            if not _lock(self._fd, shared=shared, blocking=blocking):
+                if not blocking:
+                    self.release()
+                return False
+            self._held = True
+            if self._is_current():
+                return True
+            # the file was deleted while waiting for it
+            self.release()
+
+    def delete(self) -> None:
+        """Delete the lock file and release the lock, which must be held exclusively."""
+        if sys.platform == "win32":  # pragma: no cover
+            # open files can't be deleted, so this fails if others are waiting
+            self.release()
+            try:
+                self.path.unlink(missing_ok=True)
+            except PermissionError:
+                pass
+        else:
+            self.path.unlink(missing_ok=True)
+            self.release()
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            _unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._held = False
+
+    def _is_current(self) -> bool:
+        assert self._fd is not None
+        try:
+            path_stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        fd_stat = os.fstat(self._fd)
+        return (path_stat.st_dev, path_stat.st_ino) == (fd_stat.st_dev, fd_stat.st_ino)
+
+    def __enter__(self) -> FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    _SUPPORTS_SHARED = False
+
+    def _lock(fd: int, *, shared: bool, blocking: bool) -> bool:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.1)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+
+else:
+    import fcntl
+
+    _SUPPORTS_SHARED = True
+
+    def _lock(fd: int, *, shared: bool, blocking: bool) -> bool:
+        flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
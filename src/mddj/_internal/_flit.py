@@ -0,0 +1,83 @@
+"""
+Emulation of flit-core's rules for dynamic ``version`` and ``description``.
+
+flit reads these from the module's ``__version__`` and docstring. It first
+inspects the module's AST, and only imports the module when that fails. mddj
+implements only the AST step, and reports "unknown" (None) whenever flit would
+need to import the module.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import pathlib
+
+
+@dataclasses.dataclass(frozen=True)
+class ModuleInfo:
+    docstring: str | None
+    version: str | None
+
+
+def find_module_file(
+    project_dir: pathlib.Path, module_name: str
+) -> pathlib.Path | None:
+    """
+    Find the file which flit reads for a module's metadata.
+
+    Following flit, the module may be a package or a single file, either at the
+    project root or under ``src/``. If more than one candidate exists, flit raises
+    an error, and None is returned.
+    """
+    name_as_path = pathlib.Path(*module_name.split("."))
+
+    candidates = []
+    for base in (project_dir, project_dir / "src"):
+        pkg_dir = base / name_as_path
+        py_file = base / name_as_path.with_name(f"{name_as_path.name}.py")
+        if pkg_dir.is_dir():
+            candidates.append(pkg_dir / "__init__.py")
+        if py_file.is_file():
+            candidates.append(py_file)
+
+    if len(candidates) != 1 or not candidates[0].is_file():
+        return None
+    return candidates[0]
+
+
+def read_module_info(path: pathlib.Path) -> ModuleInfo | None:
+    """
+    Get the docstring and ``__version__`` of a module without importing it.
+
+    As in flit, only the first assignment of a string literal to ``__version__`` at
+    the top level of the module is used.
+    """
+    try:
+        node = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    version = None
+    for child in node.body:
+        if isinstance(child, ast.Assign):
+            targets = child.targets
+        elif isinstance(child, ast.AnnAssign) and child.value is not None:
+            targets = [child.target]
+        else:
+            continue
+        if not any(isinstance(t, ast.Name) and t.id == "__version__" for t in targets):
+            continue
+        if isinstance(child.value, ast.Constant) and isinstance(child.value.value, str):
+            version = child.value.value
+            break
+
+    return ModuleInfo(docstring=ast.get_docstring(node), version=version)
+
+
+def summary_from_docstring(docstring: str) -> str | None:
+    """Get the summary line of a docstring, as flit does for ``description``."""
+    lines = docstring.lstrip().splitlines()
+    if not lines:
+        return None
+    return lines[0].strip()
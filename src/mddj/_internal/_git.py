@@ -0,0 +1,157 @@
+"""
+Minimal, read-only access to git repository data.
+
+This reads the on-disk format directly, so that no ``git`` executable is needed
+to answer simple questions like "what commit is checked out?"
+"""
+
+from __future__ import annotations
+
+import pathlib
+
+
+def find_git_dir(worktree: pathlib.Path) -> pathlib.Path | None:
+    """
+    Given a worktree root, find the git directory for it.
+
+    ``.git`` is usually a directory, but for linked worktrees and submodules it is
+    a file containing a ``gitdir: <path>`` pointer.
+    """
+    dotgit = worktree / ".git"
+    if dotgit.is_dir():
+        return dotgit
+    if not dotgit.is_file():
+        return None
+
+    content = dotgit.read_text(encoding="utf-8").strip()
+    if not content.startswith("gitdir:"):
+        return None
+    gitdir = pathlib.Path(content[len("gitdir:") :].strip())
+    if not gitdir.is_absolute():
+        gitdir = worktree / gitdir
+    return gitdir if gitdir.is_dir() else None
+
+
+def common_dir(git_dir: pathlib.Path) -> pathlib.Path:
+    """
+    Get the "common" git dir, which holds refs and objects.
+
+    For a linked worktree, this is the main repository's git dir. Otherwise, it is
+    the git dir itself.
+    """
+    commondir_file = git_dir / "commondir"
+    if not commondir_file.is_file():
+        return git_dir
+    path = pathlib.Path(commondir_file.read_text(encoding="utf-8").strip())
+    if not path.is_absolute():
+        path = git_dir / path
+    return path.resolve()
+
+
+def read_head(git_dir: pathlib.Path) -> str | None:
+    """
+    Resolve ``HEAD`` to a commit hash, or return None if it cannot be resolved
+    (e.g. in a freshly initialized repo with no commits).
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref:"):
+        return head or None
+    return resolve_ref(git_dir, head[len("ref:") :].strip())
+
+
+def resolve_ref(git_dir: pathlib.Path, refname: str) -> str | None:
+    """
+    Resolve a full refname, like ``refs/heads/main``, to the hash it points to.
+
+    Loose refs are checked first (per-worktree, then common), then ``packed-refs``.
+    """
+    commondir = common_dir(git_dir)
+    for base in dict.fromkeys((git_dir, commondir)):
+        try:
+            value = (base / refname).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if value.startswith("ref:"):
+            return resolve_ref(git_dir, value[len("ref:") :].strip())
+        return value or None
+
+    return read_packed_refs(commondir).get(refname)
+
+
+def read_packed_refs(git_dir: pathlib.Path) -> dict[str, str]:
+    """
+    Read ``packed-refs`` into a mapping of refname to hash.
+
+    Peeled values (``^<hash>`` lines) are not included.
+    """
+    try:
+        content = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return {}
+
+    refs: dict[str, str] = {}
+    for line in content.splitlines():
+        if not line or line.startswith(("#", "^")):
+            continue
+        sha, _, refname = line.partition(" ")
+        refs[refname.strip()] = sha
+    return refs
+
+
+def list_refs(git_dir: pathlib.Path, prefix: str) -> dict[str, str]:
+    """
+    List the refs under a prefix, like ``refs/tags/``, as a mapping of refname to
+    hash, sorted by refname. Loose refs take precedence over packed refs.
+    """
+    commondir = common_dir(git_dir)
+    refs = {
+        refname: sha
+        for refname, sha in read_packed_refs(commondir).items()
+        if refname.startswith(prefix)
+    }
+
+    loose_root = commondir / prefix
+    if loose_root.is_dir():
+        for path in loose_root.rglob("*"):
+            if not path.is_file():
+                continue
+            refname = path.relative_to(commondir).as_posix()
+            if (sha := resolve_ref(git_dir, refname)) is not None:
+                refs[refname] = sha
+
+    return dict(sorted(refs.items()))
+
+
+def read_config(git_dir: pathlib.Path) -> dict[str, str]:
+    """
+    Read the repository's ``config`` file into a flat mapping of ``section.key``
+    (or ``section.subsection.key``) to the last value set.
+
+    Section and key names are lowercased. Includes are not followed.
+    """
+    try:
+        content = (common_dir(git_dir) / "config").read_text(encoding="utf-8")
+    except OSError:
+        return {}
+
+    config: dict[str, str] = {}
+    section = ""
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        if line.startswith("["):
+            header = line[1 : line.index("]")] if "]" in line else line[1:]
+            name, _, subsection = header.partition(" ")
+            section = name.lower()
+            if subsection := subsection.strip().strip('"'):
+                section = f"{section}.{subsection}"
+            continue
+        key, sep, value = line.partition("=")
+        value = value.split("#", 1)[0].split(";", 1)[0].strip().strip('"')
+        config[f"{section}.{key.strip().lower()}"] = value if sep else "true"
+    return config
@@ -0,0 +1,515 @@
+"""
+An implementation of ``git describe --dirty --tags --long --match '*[0-9]*'``.
+
+The repository is read directly when possible, following git's algorithm for
+choosing a tag. When a repository uses features which are not supported here
+(shallow clones, replace refs, content filters, submodules, ...), a ``git``
+subprocess is used instead.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import fnmatch
+import hashlib
+import heapq
+import itertools
+import os
+import pathlib
+import re
+import stat
+import struct
+import subprocess
+import typing as t
+import zlib
+
+from . import _git, _git_objects
+
+TAG_MATCH = "*[0-9]*"
+
+# git considers at most this many candidate tags
+_MAX_CANDIDATES = 10
+# beyond this many commits, a native walk is too slow to be worthwhile
+_MAX_WALK = 100_000
+_FALLBACK_ABBREV = 7
+
+_SHA_HEX = re.compile(r"[0-9a-f]{40}")
+_LONG_DESCRIBE = re.compile(
+    r"^(?P<tag>.+)-(?P<distance>\d+)-g(?P<node>[0-9a-f]+)(?P<dirty>-dirty)?$"
+)
+_ALWAYS_DESCRIBE = re.compile(r"^(?P<node>[0-9a-f]+)(?P<dirty>-dirty)?$")
+
+# attributes which make worktree content differ from what is stored
+_FILTER_ATTRIBUTES = re.compile(
+    r"(^|\s)-?(filter|text|eol|crlf|ident|working-tree-encoding)\b"
+)
+
+_INDEX_ENTRY_HEADER = struct.Struct(">10I20sH")
+_GITLINK_MODE = 0o160000
+
+
+@dataclasses.dataclass(frozen=True)
+class Description:
+    #: the nearest tag, or None if no tag is reachable
+    tag: str | None
+    #: the number of commits since the tag (or since the root, with no tag)
+    distance: int
+    #: the full hash of HEAD
+    sha: str
+    #: the abbreviated hash of HEAD, as shown by ``git describe``
+    abbrev: str
+    dirty: bool
+
+
+def describe(worktree: pathlib.Path) -> Description | None:
+    """
+    Describe ``HEAD`` of a git worktree.
+
+    Returns None if there is no git repository or it has no commits.
+    """
+    try:
+        return describe_native(worktree)
+    except (
+        _git_objects.UnsupportedRepository,
+        _git_objects.ObjectNotFound,
+        OSError,
+        ValueError,
+        IndexError,
+        struct.error,
+        zlib.error,
+    ):
+        return describe_subprocess(worktree)
+
+
+def describe_native(worktree: pathlib.Path) -> Description | None:
+    if (git_dir := _git.find_git_dir(worktree)) is None:
+        raise _git_objects.UnsupportedRepository("no git directory")
+    commondir = _git.common_dir(git_dir)
+    config = _git.read_config(git_dir)
+    _check_supported(commondir, config)
+
+    if (head := _git.read_head(git_dir)) is None:
+        return None
+    if not _SHA_HEX.fullmatch(head):
+        raise _git_objects.UnsupportedRepository(f"unexpected HEAD: {head}")
+
+    store = _git_objects.ObjectStore(commondir / "objects")
+    try:
+        names = _tag_names(git_dir, store)
+        tag, distance = _find_nearest_tag(store, head, names)
+        return Description(
+            tag=tag,
+            distance=distance,
+            sha=head,
+            abbrev=_abbreviate(store, head, config),
+            dirty=_is_dirty(worktree, git_dir, store, head, config),
+        )
+    finally:
+        store.close()
+
+
+def describe_subprocess(worktree: pathlib.Path) -> Description | None:
+    def _git_output(*args: str) -> str | None:
+        try:
+            result = subprocess.run(
+                ["git", *args], cwd=worktree, capture_output=True, text=True
+            )
+        except OSError:
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    output = _git_output(
+        "describe", "--dirty", "--tags", "--long", "--always", "--match", TAG_MATCH
+    )
+    sha = _git_output("rev-parse", "--verify", "--quiet", "HEAD")
+    if output is None or sha is None:
+        return None
+
+    if match := _LONG_DESCRIBE.match(output):
+        return Description(
+            tag=match.group("tag"),
+            distance=int(match.group("distance")),
+            sha=sha,
+            abbrev=match.group("node"),
+            dirty=bool(match.group("dirty")),
+        )
+    if (match := _ALWAYS_DESCRIBE.match(output)) is None:
+        return None
+    count = _git_output("rev-list", "--count", "HEAD")
+    if count is None:
+        return None
+    return Description(
+        tag=None,
+        distance=int(count),
+        sha=sha,
+        abbrev=match.group("node"),
+        dirty=bool(match.group("dirty")),
+    )
+
+
+def _check_supported(commondir: pathlib.Path, config: dict[str, str]) -> None:
+    if config.get("extensions.objectformat", "sha1") != "sha1":
+        raise _git_objects.UnsupportedRepository("unsupported object format")
+    if config.get("extensions.refstorage", "files") != "files":
+        raise _git_objects.UnsupportedRepository("unsupported ref storage")
+    for path in (commondir / "shallow", commondir / "info" / "grafts"):
+        if path.exists():
+            raise _git_objects.UnsupportedRepository(f"{path.name} is not supported")
+    if _git.list_refs(commondir, "refs/replace/"):
+        raise _git_objects.UnsupportedRepository("replace refs are not supported")
+
+
+@dataclasses.dataclass
+class _TagName:
+    name: str
+    # 2 for annotated tags, 1 for lightweight tags
+    prio: int
+    tagger_time: int | None
+
+
+def _tag_names(
+    git_dir: pathlib.Path, store: _git_objects.ObjectStore
+) -> dict[str, _TagName]:
+    """
+    Map tagged commits to the tag which git would use to name them.
+
+    Annotated tags are preferred over lightweight ones, and newer annotated tags
+    over older ones. Otherwise, the first tag by refname is used.
+    """
+    names: dict[str, _TagName] = {}
+    for refname, sha in _git.list_refs(git_dir, "refs/tags/").items():
+        name = refname[len("refs/tags/") :]
+        if not fnmatch.fnmatchcase(name, TAG_MATCH):
+            continue
+
+        prio, tagger_time = 1, None
+        target = sha
+        obj_type, _ = store.read(target)
+        if obj_type == "tag":
+            prio = 2
+            tag = store.read_tag(target)
+            tagger_time = tag.tagger_time
+            while True:
+                target = tag.object
+                if tag.object_type != "tag":
+                    break
+                tag = store.read_tag(target)
+            obj_type = tag.object_type
+        if obj_type != "commit":
+            continue
+
+        candidate = _TagName(name, prio, tagger_time)
+        if (existing := names.get(target)) is None or _replaces(existing, candidate):
+            names[target] = candidate
+    return names
+
+
+def _replaces(existing: _TagName, candidate: _TagName) -> bool:
+    if existing.prio < candidate.prio:
+        return True
+    if existing.prio == candidate.prio == 2:
+        return (existing.tagger_time or 0) < (candidate.tagger_time or 0)
+    return False
+
+
+class _CommitQueue:
+    """A queue of commits ordered newest first, with ties in insertion order."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, str]] = []
+        self._counter = itertools.count()
+
+    def push(self, sha: str, commit_time: int) -> None:
+        heapq.heappush(self._heap, (-commit_time, next(self._counter), sha))
+
+    def pop(self) -> str:
+        return heapq.heappop(self._heap)[2]
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return (sha for _, _, sha in self._heap)
+
+
+@dataclasses.dataclass
+class _Candidate:
+    name: str
+    # the number of commits seen which are not reachable from the tag
+    depth: int
+    flag: int
+    found_order: int
+
+
+def _find_nearest_tag(
+    store: _git_objects.ObjectStore, head: str, names: dict[str, _TagName]
+) -> tuple[str | None, int]:
+    """
+    Find the tag git describe would choose, and the number of commits since it.
+
+    With no tag, the number of commits reachable from HEAD is returned.
+    """
+    if head in names:
+        return names[head].name, 0
+
+    commits: dict[str, _git_objects.Commit] = {}
+
+    def _commit(sha: str) -> _git_objects.Commit:
+        if sha not in commits:
+            if len(commits) >= _MAX_WALK:
+                raise _git_objects.UnsupportedRepository("history is too large")
+            commits[sha] = store.read_commit(sha)
+        return commits[sha]
+
+    # per-commit bitmasks: which candidates the commit is reachable from
+    flags: dict[str, int] = {head: 0}
+    queue = _CommitQueue()
+    queue.push(head, _commit(head).commit_time)
+
+    candidates: list[_Candidate] = []
+    seen_commits = 0
+    gave_up_on: str | None = None
+
+    def _push_parents(sha: str) -> None:
+        for parent in _commit(sha).parents:
+            if parent not in flags:
+                flags[parent] = 0
+                queue.push(parent, _commit(parent).commit_time)
+            flags[parent] |= flags[sha]
+
+    while queue:
+        sha = queue.pop()
+        seen_commits += 1
+        if (name := names.get(sha)) is not None:
+            if len(candidates) < _MAX_CANDIDATES:
+                candidate = _Candidate(
+                    name.name,
+                    depth=seen_commits - 1,
+                    flag=1 << len(candidates),
+                    found_order=len(candidates),
+                )
+                candidates.append(candidate)
+                flags[sha] |= candidate.flag
+            else:
+                gave_up_on = sha
+                break
+        for candidate in candidates:
+            if not flags[sha] & candidate.flag:
+                candidate.depth += 1
+        _push_parents(sha)
+
+    if not candidates:
+        return None, seen_commits
+
+    candidates.sort(key=lambda c: (c.depth, c.found_order))
+    best = candidates[0]
+    if gave_up_on is not None:
+        queue.push(gave_up_on, _commit(gave_up_on).commit_time)
+
+    # finish counting the commits which are not reachable from the best tag
+    while queue:
+        sha = queue.pop()
+        if flags[sha] & best.flag:
+            if all(flags[other] & best.flag for other in queue):
+                break
+        else:
+            best.depth += 1
+        _push_parents(sha)
+
+    return best.name, best.depth
+
+
+def _abbreviate(
+    store: _git_objects.ObjectStore, sha: str, config: dict[str, str]
+) -> str:
+    """Abbreviate a hash to a unique prefix, following git's default sizing."""
+    setting = config.get("core.abbrev", "auto").lower()
+    if setting in ("no", "false", "off"):
+        return sha
+    if setting == "auto":
+        bits = store.approximate_count().bit_length()
+        length = max(_FALLBACK_ABBREV, (max(bits, 1) + 1) // 2)
+    else:
+        length = max(4, int(setting))
+
+    while length < len(sha) and store.count_prefix(sha[:length]) > 1:
+        length += 1
+    return sha[:length]
+
+
+def _is_dirty(
+    worktree: pathlib.Path,
+    git_dir: pathlib.Path,
+    store: _git_objects.ObjectStore,
+    head: str,
+    config: dict[str, str],
+) -> bool:
+    """
+    Check for changes to tracked files, relative to HEAD, in the index or worktree.
+    """
+    if config.get("core.autocrlf", "false").lower() not in ("false", "no", "off"):
+        raise _git_objects.UnsupportedRepository("core.autocrlf is not supported")
+
+    index_path = git_dir / "index"
+    try:
+        index_data = index_path.read_bytes()
+        index_mtime_ns = index_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        # no index: nothing is staged, so every file in HEAD was removed
+        return bool(_flatten_tree(store, store.read_commit(head).tree))
+
+    entries = _read_index(index_data)
+    if any(name.endswith(b".gitattributes") for name in entries):
+        _check_attributes(worktree, git_dir, entries)
+
+    head_files = _flatten_tree(store, store.read_commit(head).tree)
+    if head_files.keys() != entries.keys():
+        return True
+
+    filemode = config.get("core.filemode", "true").lower() in ("true", "yes", "on")
+    for name, entry in entries.items():
+        if entry.conflicted or entry.intent_to_add:
+            return True
+        if head_files[name] != (entry.mode, entry.sha):
+            return True
+        if entry.skip_worktree or entry.assume_valid:
+            continue
+        if _worktree_differs(
+            worktree / os.fsdecode(name), entry, index_mtime_ns, filemode
+        ):
+            return True
+    return False
+
+
+@dataclasses.dataclass(frozen=True)
+class _IndexEntry:
+    mtime_ns: int
+    size: int
+    mode: int
+    sha: str
+    conflicted: bool
+    assume_valid: bool
+    skip_worktree: bool
+    intent_to_add: bool
+
+
+def _read_index(data: bytes) -> dict[bytes, _IndexEntry]:
+    if data[:4] != b"DIRC":
+        raise _git_objects.UnsupportedRepository("invalid index")
+    version, count = struct.unpack(">II", data[4:12])
+    if version not in (2, 3):
+        raise _git_objects.UnsupportedRepository(f"index version {version}")
+
+    entries: dict[bytes, _IndexEntry] = {}
+    pos = 12
+    for _ in range(count):
+        start = pos
+        fields = _INDEX_ENTRY_HEADER.unpack_from(data, pos)
+        _, _, mtime_s, mtime_ns, _, _, mode, _, _, size, sha, flags = fields
+        pos += _INDEX_ENTRY_HEADER.size
+        extended_flags = 0
+        if flags & 0x4000:
+            (extended_flags,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+        name_end = data.index(b"\0", pos)
+        name = data[pos:name_end]
+        # entries are NUL padded to a multiple of 8 bytes
+        pos = start + ((name_end - start) // 8 + 1) * 8
+
+        if stat.S_ISDIR(mode) or mode == _GITLINK_MODE:
+            raise _git_objects.UnsupportedRepository("unsupported index entry")
+        entry = _IndexEntry(
+            mtime_ns=mtime_s * 1_000_000_000 + mtime_ns,
+            size=size,
+            mode=mode,
+            sha=sha.hex(),
+            conflicted=bool(flags & 0x3000),
+            assume_valid=bool(flags & 0x8000),
+            skip_worktree=bool(extended_flags & 0x4000),
+            intent_to_add=bool(extended_flags & 0x2000),
+        )
+        # conflicted paths have multiple entries; any of them marks the path dirty
+        if name not in entries or entry.conflicted:
+            entries[name] = entry
+
+    # a split index stores entries in another file
+    while pos + 8 <= len(data) - 20:
+        signature = data[pos : pos + 4]
+        (size,) = struct.unpack_from(">I", data, pos + 4)
+        if signature in (b"link", b"sdir"):
+            raise _git_objects.UnsupportedRepository("unsupported index extension")
+        pos += 8 + size
+    return entries
+
+
+def _flatten_tree(
+    store: _git_objects.ObjectStore, tree: str, prefix: bytes = b""
+) -> dict[bytes, tuple[int, str]]:
+    files: dict[bytes, tuple[int, str]] = {}
+    for mode, name, sha in store.read_tree(tree):
+        path = prefix + name
+        if stat.S_ISDIR(mode):
+            files.update(_flatten_tree(store, sha, path + b"/"))
+        elif mode == _GITLINK_MODE:
+            raise _git_objects.UnsupportedRepository("submodules are not supported")
+        else:
+            files[path] = (mode, sha)
+    return files
+
+
+def _check_attributes(
+    worktree: pathlib.Path, git_dir: pathlib.Path, entries: dict[bytes, _IndexEntry]
+) -> None:
+    paths = [
+        worktree / os.fsdecode(name)
+        for name in entries
+        if name.endswith(b".gitattributes")
+    ]
+    paths.append(_git.common_dir(git_dir) / "info" / "attributes")
+    for path in paths:
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        for line in content.splitlines():
+            if not line.lstrip().startswith("#") and _FILTER_ATTRIBUTES.search(line):
+                raise _git_objects.UnsupportedRepository("content filters are set")
+
+
+def _worktree_differs(
+    path: pathlib.Path, entry: _IndexEntry, index_mtime_ns: int, filemode: bool
+) -> bool:
+    try:
+        st = path.lstat()
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+
+    if stat.S_ISLNK(entry.mode) != stat.S_ISLNK(st.st_mode):
+        return True
+    if not stat.S_ISLNK(entry.mode):
+        if not stat.S_ISREG(st.st_mode):
+            return True
+        if filemode and bool(entry.mode & 0o100) != bool(st.st_mode & 0o100):
+            return True
+
+    if st.st_size != entry.size:
+        return True
+    # a file modified in the same instant as the index was written is "racy", and
+    # must be compared by content
+    racy = st.st_mtime_ns >= index_mtime_ns
+    if _same_mtime(st.st_mtime_ns, entry.mtime_ns) and not racy:
+        return False
+
+    if stat.S_ISLNK(entry.mode):
+        content = os.fsencode(os.readlink(path))
+    else:
+        content = path.read_bytes()
+    blob = hashlib.sha1(b"blob %d\0" % len(content) + content, usedforsecurity=False)
+    return blob.hexdigest() != entry.sha
+
+
+def _same_mtime(worktree_ns: int, index_ns: int) -> bool:
+    # some platforms do not record nanoseconds in the index
+    if index_ns % 1_000_000_000 == 0:
+        return worktree_ns // 1_000_000_000 == index_ns // 1_000_000_000
+    return worktree_ns == index_ns
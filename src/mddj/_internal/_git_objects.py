@@ -0,0 +1,366 @@
+"""
+Read-only access to a git object database.
+
+Loose objects and version 2 pack indexes (with their packs) are supported,
+including offset and ref deltas. Anything else, such as SHA-256 repositories,
+raises ``UnsupportedRepository``, so that callers can fall back to ``git``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import mmap
+import pathlib
+import struct
+import zlib
+
+_OBJ_TYPES: dict[int, str] = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+_OFS_DELTA = 6
+_REF_DELTA = 7
+
+_IDX_MAGIC = b"\377tOc"
+_READ_CHUNK_SIZE = 64 * 1024
+# delta bases are cached, since walking history repeatedly hits the same bases
+_BASE_CACHE_SIZE = 256
+
+
+class UnsupportedRepository(Exception):
+    """Raised when a repository uses a feature which this reader can't handle."""
+
+
+class ObjectNotFound(LookupError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class Commit:
+    tree: str
+    parents: tuple[str, ...]
+    commit_time: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Tag:
+    object: str
+    object_type: str
+    tagger_time: int | None
+
+
+class _PackIndex:
+    def __init__(self, idx_path: pathlib.Path) -> None:
+        data = idx_path.read_bytes()
+        if data[:4] != _IDX_MAGIC or struct.unpack(">I", data[4:8])[0] != 2:
+            raise UnsupportedRepository(f"unsupported pack index: {idx_path}")
+        self._data = data
+        self.count = struct.unpack(">I", data[8 + 255 * 4 : 8 + 256 * 4])[0]
+        self._names_offset = 8 + 256 * 4
+        self._offsets_offset = self._names_offset + self.count * 24
+        self._large_offsets_offset = self._offsets_offset + self.count * 4
+        self.pack_path = idx_path.with_suffix(".pack")
+
+    def _fanout(self, byte: int) -> int:
+        if byte < 0:
+            return 0
+        start = 8 + byte * 4
+        return int(struct.unpack(">I", self._data[start : start + 4])[0])
+
+    def _name(self, i: int) -> bytes:
+        start = self._names_offset + i * 20
+        return self._data[start : start + 20]
+
+    def find(self, sha: bytes) -> int | None:
+        """Get the pack offset of an object, or None if it is not in this pack."""
+        lo, hi = self._fanout(sha[0] - 1), self._fanout(sha[0])
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name = self._name(mid)
+            if name < sha:
+                lo = mid + 1
+            elif name > sha:
+                hi = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count the objects whose hex name starts with ``prefix``."""
+        first = int(prefix[:2], 16)
+        lo, hi = self._fanout(first - 1), self._fanout(first)
+        return sum(1 for i in range(lo, hi) if self._name(i).hex().startswith(prefix))
+
+    def _offset(self, i: int) -> int:
+        start = self._offsets_offset + i * 4
+        offset = int(struct.unpack(">I", self._data[start : start + 4])[0])
+        if offset & 0x80000000:
+            start = self._large_offsets_offset + (offset & 0x7FFFFFFF) * 8
+            offset = int(struct.unpack(">Q", self._data[start : start + 8])[0])
+        return offset
+
+
+class _Pack:
+    def __init__(self, index: _PackIndex) -> None:
+        self.index = index
+        self._mmap: mmap.mmap | None = None
+        self._base_cache: dict[int, tuple[int, bytes]] = {}
+
+    @property
+    def _data(self) -> mmap.mmap:
+        if self._mmap is None:
+            with self.index.pack_path.open("rb") as fp:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def read_at(self, offset: int, store: ObjectStore) -> tuple[int, bytes]:
+        if (cached := self._base_cache.get(offset)) is not None:
+            return cached
+
+        data = self._data
+        pos = offset
+        byte = data[pos]
+        pos += 1
+        type_num = (byte >> 4) & 0x7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+
+        if type_num == _OFS_DELTA:
+            byte = data[pos]
+            pos += 1
+            distance = byte & 0x7F
+            while byte & 0x80:
+                byte = data[pos]
+                pos += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+            base_type, base = self.read_at(offset - distance, store)
+            result = (base_type, _apply_delta(base, self._inflate(pos)))
+        elif type_num == _REF_DELTA:
+            base_sha = bytes(data[pos : pos + 20])
+            base_type_name, base = store.read(base_sha.hex())
+            base_type = _type_number(base_type_name)
+            result = (base_type, _apply_delta(base, self._inflate(pos + 20)))
+        elif type_num in _OBJ_TYPES:
+            result = (type_num, self._inflate(pos))
+        else:
+            raise UnsupportedRepository(f"unknown pack object type: {type_num}")
+
+        if len(self._base_cache) >= _BASE_CACHE_SIZE:
+            self._base_cache.pop(next(iter(self._base_cache)))
+        self._base_cache[offset] = result
+        return result
+
+    def _inflate(self, pos: int) -> bytes:
+        view = memoryview(self._data)
+        decompressor = zlib.decompressobj()
+        chunks = []
+        try:
+            while not decompressor.eof:
+                chunk = view[pos : pos + _READ_CHUNK_SIZE]
+                if not chunk:
+                    raise UnsupportedRepository("truncated pack data")
+                chunks.append(decompressor.decompress(chunk))
+                pos += len(chunk)
+        finally:
+            view.release()
+        return b"".join(chunks)
+
+
+class ObjectStore:
+    def __init__(self, objects_dir: pathlib.Path) -> None:
+        self.objects_dir = objects_dir
+        self._packs: list[_Pack] | None = None
+        self._alternates: list[ObjectStore] | None = None
+
+    def read(self, sha: str) -> tuple[str, bytes]:
+        """Read an object, returning its type name and content."""
+        loose = self.objects_dir / sha[:2] / sha[2:]
+        try:
+            raw = zlib.decompress(loose.read_bytes())
+        except FileNotFoundError:
+            pass
+        else:
+            header, _, body = raw.partition(b"\0")
+            return header.split(b" ", 1)[0].decode("ascii"), body
+
+        sha_bytes = bytes.fromhex(sha)
+        for pack in self.packs:
+            if (offset := pack.index.find(sha_bytes)) is not None:
+                type_num, body = pack.read_at(offset, self)
+                return _OBJ_TYPES[type_num], body
+
+        for alternate in self.alternates:
+            try:
+                return alternate.read(sha)
+            except ObjectNotFound:
+                continue
+        raise ObjectNotFound(sha)
+
+    def read_commit(self, sha: str) -> Commit:
+        obj_type, body = self.read(sha)
+        if obj_type != "commit":
+            raise ObjectNotFound(f"{sha} is a {obj_type}, not a commit")
+        tree = ""
+        parents = []
+        commit_time = 0
+        for line in _headers(body):
+            key, _, value = line.partition(b" ")
+            if key == b"tree":
+                tree = value.decode("ascii")
+            elif key == b"parent":
+                parents.append(value.decode("ascii"))
+            elif key == b"committer":
+                commit_time = _signature_time(value) or 0
+        return Commit(tree, tuple(parents), commit_time)
+
+    def read_tag(self, sha: str) -> Tag:
+        obj_type, body = self.read(sha)
+        if obj_type != "tag":
+            raise ObjectNotFound(f"{sha} is a {obj_type}, not a tag")
+        target, target_type, tagger_time = "", "", None
+        for line in _headers(body):
+            key, _, value = line.partition(b" ")
+            if key == b"object":
+                target = value.decode("ascii")
+            elif key == b"type":
+                target_type = value.decode("ascii")
+            elif key == b"tagger":
+                tagger_time = _signature_time(value)
+        return Tag(target, target_type, tagger_time)
+
+    def read_tree(self, sha: str) -> list[tuple[int, bytes, str]]:
+        """Read a tree as a list of (mode, name, sha) entries."""
+        obj_type, body = self.read(sha)
+        if obj_type != "tree":
+            raise ObjectNotFound(f"{sha} is a {obj_type}, not a tree")
+        entries = []
+        pos = 0
+        while pos < len(body):
+            space = body.index(b" ", pos)
+            nul = body.index(b"\0", space)
+            mode = int(body[pos:space], 8)
+            name = body[space + 1 : nul]
+            entries.append((mode, name, body[nul + 1 : nul + 21].hex()))
+            pos = nul + 21
+        return entries
+
+    def approximate_count(self) -> int:
+        """The number of packed objects, as used by git to size abbreviations."""
+        return sum(pack.index.count for pack in self.packs)
+
+    def count_prefix(self, prefix: str) -> int:
+        """Count the objects (loose or packed) whose name starts with ``prefix``."""
+        count = 0
+        try:
+            count += sum(
+                1
+                for path in (self.objects_dir / prefix[:2]).iterdir()
+                if path.name.startswith(prefix[2:])
+            )
+        except FileNotFoundError:
+            pass
+        count += sum(pack.index.count_prefix(prefix) for pack in self.packs)
+        count += sum(alt.count_prefix(prefix) for alt in self.alternates)
+        return count
+
+    @property
+    def packs(self) -> list[_Pack]:
+        if self._packs is None:
+            pack_dir = self.objects_dir / "pack"
+            try:
+                idx_paths = sorted(pack_dir.glob("*.idx"))
+            except OSError:
+                idx_paths = []
+            self._packs = [_Pack(_PackIndex(path)) for path in idx_paths]
+        return self._packs
+
+    @property
+    def alternates(self) -> list[ObjectStore]:
+        if self._alternates is None:
+            self._alternates = []
+            try:
+                content = (self.objects_dir / "info" / "alternates").read_text(
+                    encoding="utf-8"
+                )
+            except OSError:
+                content = ""
+            for line in content.splitlines():
+                if not line.strip() or line.startswith("#"):
+                    continue
+                path = pathlib.Path(line.strip())
+                if not path.is_absolute():
+                    path = (self.objects_dir / path).resolve()
+                self._alternates.append(ObjectStore(path))
+        return self._alternates
+
+    def close(self) -> None:
+        for pack in self._packs or ():
+            pack.close()
+        for alternate in self._alternates or ():
+            alternate.close()
+
+
+def _type_number(type_name: str) -> int:
+    for number, name in _OBJ_TYPES.items():
+        if name == type_name:
+            return number
+    raise UnsupportedRepository(f"unknown object type: {type_name}")
+
+
+def _headers(body: bytes) -> list[bytes]:
+    header, _, _ = body.partition(b"\n\n")
+    return header.split(b"\n")
+
+
+def _signature_time(value: bytes) -> int | None:
+    # "Name <email> 1700000000 +0000"
+    try:
+        return int(value.rsplit(b" ", 2)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return result, pos
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    base_size, pos = _read_varint(delta, 0)
+    if base_size != len(base):
+        raise UnsupportedRepository("delta base size mismatch")
+    result_size, pos = _read_varint(delta, pos)
+
+    out = bytearray()
+    while pos < len(delta):
+        opcode = delta[pos]
+        pos += 1
+        if opcode & 0x80:
+            offset = size = 0
+            for i in range(4):
+                if opcode & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if opcode & (1 << (4 + i)):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[offset : offset + (size or 0x10000)]
+        elif opcode:
+            out += delta[pos : pos + opcode]
+            pos += opcode
+        else:
+            raise UnsupportedRepository("invalid delta opcode")
+
+    if len(out) != result_size:
+        raise UnsupportedRepository("delta result size mismatch")
+    return bytes(out)
@@ -0,0 +1,181 @@
+"""
+Matching of paths against gitignore rules.
+
+This supports the pattern syntax of ``.gitignore`` files, for the ``.gitignore``
+files in a worktree and the repository's ``info/exclude``. User and global
+excludes (``core.excludesFile``) are not read.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import re
+
+from . import _git
+
+
+@dataclasses.dataclass(frozen=True)
+class _Rule:
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+@dataclasses.dataclass(frozen=True)
+class _RuleFile:
+    # the path of the dir holding the rules, relative to the worktree root, with a
+    # trailing slash (or "" for the root)
+    base: str
+    rules: tuple[_Rule, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class IgnoreRules:
+    """
+    The rules which apply in one directory of a worktree, from the ``.gitignore``
+    files in it and its parents.
+    """
+
+    worktree: pathlib.Path
+    rule_files: tuple[_RuleFile, ...] = ()
+
+    @classmethod
+    def for_directory(cls, directory: pathlib.Path) -> IgnoreRules | None:
+        """
+        Load the rules which apply in ``directory``, or return None if it is not in
+        a git worktree.
+        """
+        for worktree in (directory, *directory.parents):
+            if (git_dir := _git.find_git_dir(worktree)) is not None:
+                break
+        else:
+            return None
+
+        rules = cls(worktree)
+        exclude = _read_rules(_git.common_dir(git_dir) / "info" / "exclude")
+        if exclude:
+            rules = dataclasses.replace(rules, rule_files=(_RuleFile("", exclude),))
+        for d in reversed((directory, *directory.parents)):
+            if d == worktree or worktree in d.parents:
+                rules = rules.enter(d)
+        return rules
+
+    def enter(self, directory: pathlib.Path) -> IgnoreRules:
+        """Get the rules for a subdirectory, adding its ``.gitignore`` if present."""
+        rules = _read_rules(directory / ".gitignore")
+        if not rules:
+            return self
+        base = directory.relative_to(self.worktree).as_posix()
+        base = "" if base == "." else base + "/"
+        return dataclasses.replace(
+            self, rule_files=(*self.rule_files, _RuleFile(base, rules))
+        )
+
+    def is_ignored(self, path: pathlib.Path, *, is_dir: bool) -> bool:
+        relative = path.relative_to(self.worktree).as_posix()
+        # deeper files take precedence, and later rules within a file
+        for rule_file in reversed(self.rule_files):
+            if not relative.startswith(rule_file.base):
+                continue
+            local = relative[len(rule_file.base) :]
+            for rule in reversed(rule_file.rules):
+                if rule.dir_only and not is_dir:
+                    continue
+                if rule.regex.fullmatch(local):
+                    return not rule.negated
+        return False
+
+
+def _read_rules(path: pathlib.Path) -> tuple[_Rule, ...]:
+    try:
+        content = path.read_text(encoding="utf-8", errors="surrogateescape")
+    except OSError:
+        return ()
+    rules = []
+    for line in content.splitlines():
+        if (rule := _parse_rule(line)) is not None:
+            rules.append(rule)
+    return tuple(rules)
+
+
+def _parse_rule(line: str) -> _Rule | None:
+    if not line or line.startswith("#"):
+        return None
+    # trailing spaces are ignored unless escaped
+    line = re.sub(r"(?<!\\)[ ]+$", "", line)
+    negated = line.startswith("!")
+    if negated or line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # a pattern with a slash (other than a trailing one) is relative to the dir
+    # of the .gitignore file, and any other pattern can match at any depth
+    anchored = "/" in line
+    line = line.lstrip("/")
+    pattern = _translate(line)
+    if not anchored:
+        pattern = f"(?:.*/)?{pattern}"
+    try:
+        regex = re.compile(pattern, re.DOTALL)
+    except re.error:
+        return None
+    return _Rule(regex, negated, dir_only)
+
+
+def _translate(glob: str) -> str:
+    parts = []
+    segments = glob.split("/")
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            if last:
+                # "foo/**" matches everything inside of foo
+                parts.append(".*")
+            else:
+                # "**/" matches zero or more directories
+                parts.append("(?:.*/)?")
+            continue
+        parts.append(_translate_segment(segment))
+        if not last:
+            parts.append("/")
+    return "".join(parts)
+
+
+def _translate_segment(segment: str) -> str:
+    result = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == "\\" and i < len(segment):
+            result.append(re.escape(segment[i]))
+            i += 1
+        elif char == "*":
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[" and (end := _class_end(segment, i)) is not None:
+            body = segment[i:end]
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            body = body.replace("\\", "\\\\").replace("[", "\\[")
+            result.append("[" + body + "]")
+            i = end + 1
+        else:
+            result.append(re.escape(char))
+    return "".join(result)
+
+
+def _class_end(segment: str, start: int) -> int | None:
+    # a "]" right after the opening bracket (or its negation) is a literal
+    i = start
+    if i < len(segment) and segment[i] in "!^":
+        i += 1
+    if i < len(segment) and segment[i] == "]":
+        i += 1
+    end = segment.find("]", i)
+    return end if end != -1 else None
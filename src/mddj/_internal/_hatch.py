@@ -0,0 +1,63 @@
+"""
+Emulation of hatchling's built-in version sources.
+
+Only sources which read data (``regex`` and ``env``) are supported. Sources
+which run code, and any configuration of metadata hooks, require a build.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import re
+import typing as t
+
+HATCH_BACKEND = "hatchling.build"
+
+# hatchling's pattern for the regex source, used when `pattern` is unset or `true`
+DEFAULT_PATTERN = r"(?i)^(__version__|VERSION) *= *([\'\"])v?(?P<version>.+?)\2"
+
+
+def read_regex_version(
+    root: pathlib.Path, relative_path: str, pattern: str | bool | None
+) -> str | None:
+    """
+    Find a version in a file with a regex, as hatchling's ``regex`` source does.
+
+    Returns None if the file can't be read or does not match.
+    """
+    if not pattern or pattern is True:
+        pattern = DEFAULT_PATTERN
+
+    try:
+        contents = (root / relative_path).read_text(encoding="utf-8")
+        match = re.search(pattern, contents, flags=re.MULTILINE)
+    except (OSError, UnicodeDecodeError, re.error):
+        return None
+    if match is None:
+        return None
+    return match.groupdict().get("version")
+
+
+def read_env_version(config: t.Mapping[str, t.Any]) -> str | None:
+    """Get a version from an environment variable, as hatchling's ``env`` source."""
+    variable = config.get("variable")
+    if not isinstance(variable, str) or not variable:
+        return None
+    return os.environ.get(variable)
+
+
+def vcs_scm_options(config: t.Mapping[str, t.Any]) -> dict[str, t.Any] | None:
+    """
+    Convert the options of hatch-vcs's ``vcs`` source to setuptools-scm options.
+    Returns None if the options are malformed.
+    """
+    raw_options = config.get("raw-options", {})
+    if not isinstance(raw_options, t.Mapping):
+        return None
+    options = dict(raw_options)
+    if tag_pattern := config.get("tag-pattern"):
+        options["tag_regex"] = tag_pattern
+    if fallback_version := config.get("fallback-version"):
+        options["fallback_version"] = fallback_version
+    return options
@@ -0,0 +1,255 @@
+"""
+A persistent, content-addressed cache of built wheel metadata.
+
+Entries are keyed by a fingerprint of the inputs which can affect metadata, and
+stored as individual files. Writes are atomic (write to a temporary file, then
+rename), so parallel processes may share a cache directory without locking: the
+worst case for a race is that two processes both build and both store the same
+entry.
+
+Recency of use is tracked via file mtimes, which are refreshed on every hit, and
+eviction removes the least recently used entries first.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+
+from . import _git
+
+# bump this to invalidate all existing cache entries if the entry format changes
+_CACHE_FORMAT_VERSION = "1"
+_ENTRY_SUFFIX = ".metadata"
+
+# the files in a source tree which are hashed to build a fingerprint
+_FINGERPRINT_FILES: tuple[str, ...] = ("pyproject.toml", "setup.cfg", "setup.py")
+
+DEFAULT_MAX_AGE: float = 30 * 24 * 60 * 60  # 30 days
+DEFAULT_MAX_SIZE: int = 64 * 1024 * 1024  # 64 MiB
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    path: pathlib.Path
+    size: int
+    last_used: float
+
+
+class MetadataCache:
+    def __init__(
+        self,
+        cache_dir: pathlib.Path,
+        *,
+        max_age: float | None = DEFAULT_MAX_AGE,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.max_size = max_size
+
+    @property
+    def entries_dir(self) -> pathlib.Path:
+        return self.cache_dir / "metadata"
+
+    def get(self, key: str) -> str | None:
+        path = self._entry_path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        # mark as recently used, but tolerate concurrent eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.entries_dir, prefix=".tmp-", suffix=_ENTRY_SUFFIX
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                fp.write(text)
+            os.replace(tmp_name, self._entry_path(key))
+        except BaseException:
+            pathlib.Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self.prune(max_age=self.max_age, max_size=self.max_size)
+
+    def entries(self) -> list[CacheEntry]:
+        """List all cache entries, least recently used first."""
+        result = []
+        try:
+            children = list(self.entries_dir.iterdir())
+        except FileNotFoundError:
+            return []
+        for child in children:
+            if child.name.startswith(".") or child.suffix != _ENTRY_SUFFIX:
+                continue
+            try:
+                stat = child.stat()
+            except FileNotFoundError:
+                continue
+            result.append(CacheEntry(child, stat.st_size, stat.st_mtime))
+        result.sort(key=lambda e: e.last_used)
+        return result
+
+    def prune(
+        self, *, max_age: float | None = None, max_size: int | None = None
+    ) -> list[CacheEntry]:
+        """
+        Evict entries which are older than ``max_age`` (in seconds), and then evict
+        least recently used entries until the total size is under ``max_size`` (in
+        bytes).
+
+        Returns the evicted entries.
+        """
+        entries = self.entries()
+        evicted: list[CacheEntry] = []
+
+        if max_age is not None:
+            cutoff = time.time() - max_age
+            evicted.extend(e for e in entries if e.last_used < cutoff)
+            entries = [e for e in entries if e.last_used >= cutoff]
+
+        if max_size is not None:
+            total_size = sum(e.size for e in entries)
+            for entry in entries:
+                if total_size <= max_size:
+                    break
+                evicted.append(entry)
+                total_size -= entry.size
+
+        for entry in evicted:
+            entry.path.unlink(missing_ok=True)
+        return evicted
+
+    def clear(self) -> list[CacheEntry]:
+        """Remove all entries, returning the removed entries."""
+        return self.prune(max_size=0)
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        return self.entries_dir / f"{key}{_ENTRY_SUFFIX}"
+
+
+class MemoryMetadataCache(MetadataCache):
+    """
+    A metadata cache which keeps entries in memory, for long-running processes.
+
+    With ``persistent=True``, entries are also read from and written to the cache
+    directory. At most ``max_entries`` are kept in memory, and the least recently
+    used are evicted first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: pathlib.Path,
+        *,
+        persistent: bool = False,
+        max_entries: int = 256,
+    ) -> None:
+        super().__init__(cache_dir)
+        self.persistent = persistent
+        self.max_entries = max_entries
+        self._memory: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if (text := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                return text
+        if not self.persistent:
+            return None
+        if (text := super().get(key)) is not None:
+            self._remember(key, text)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._remember(key, text)
+        if self.persistent:
+            super().put(key, text)
+
+    def _remember(self, key: str, text: str) -> None:
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+def source_fingerprint(
+    source_dir: pathlib.Path,
+    *,
+    vcs_root: pathlib.Path | None,
+    isolated: bool,
+) -> str:
+    """
+    Compute a fingerprint of the inputs for a metadata build.
+
+    This covers ``pyproject.toml``, ``setup.cfg``, and ``setup.py`` (and therefore
+    the ``build-system`` table), plus the VCS ``HEAD`` commit. Metadata which is
+    read from any other file will not be detected as changed until a new commit is
+    made.
+    """
+    hasher = hashlib.sha256()
+
+    def _feed(label: str, data: bytes) -> None:
+        hasher.update(label.encode("utf-8"))
+        hasher.update(len(data).to_bytes(8, "big"))
+        hasher.update(data)
+
+    header = {
+        "format": _CACHE_FORMAT_VERSION,
+        "isolated": isolated,
+        "interpreter": sys.implementation.cache_tag,
+    }
+    _feed("header", json.dumps(header, sort_keys=True).encode("utf-8"))
+
+    for filename in _FINGERPRINT_FILES:
+        try:
+            _feed(filename, (source_dir / filename).read_bytes())
+        except FileNotFoundError:
+            _feed(filename, b"<absent>")
+
+    head = _read_vcs_head(vcs_root) if vcs_root is not None else None
+    _feed("vcs-head", (head or "<none>").encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def _read_vcs_head(vcs_root: pathlib.Path) -> str | None:
+    if (git_dir := _git.find_git_dir(vcs_root)) is not None:
+        return _git.read_head(git_dir)
+
+    # for mercurial, the first 40 bytes of the dirstate are the working dir parents
+    hg_dirstate = vcs_root / ".hg" / "dirstate"
+    try:
+        with hg_dirstate.open("rb") as fp:
+            return fp.read(40).hex()
+    except OSError:
+        return None
+
+
+def summarize(entries: t.Iterable[CacheEntry]) -> tuple[int, int]:
+    """Get the (count, total size) of a collection of entries."""
+    count, size = 0, 0
+    for entry in entries:
+        count += 1
+        size += entry.size
+    return count, size
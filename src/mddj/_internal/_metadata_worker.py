@@ -0,0 +1,82 @@
+"""
+A worker process which builds the METADATA for one project, so that the build
+can be run and cancelled as a subprocess.
+
+Usage: ``python -m mddj._internal._metadata_worker ARGS_JSON OUTPUT_PATH``
+
+``command`` runs the worker with this copy of mddj on ``sys.path``, rather than
+on ``PYTHONPATH``, which would be inherited by the build and could shadow the
+packages of its environment.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import typing as t
+
+import mddj
+
+from . import _build_envs, _metadata_cache, _wheel_metadata
+
+
+def command(
+    output: pathlib.Path,
+    *,
+    source_dir: pathlib.Path,
+    isolated: bool,
+    quiet: bool,
+    cache: _metadata_cache.MetadataCache | None,
+    vcs_root: pathlib.Path | None,
+    env_pool: _build_envs.BuildEnvPool | None,
+) -> list[str]:
+    """
+    Get the command for a worker which writes METADATA to ``output``. The
+    arguments are those of ``_wheel_metadata.get_package_metadata``.
+    """
+    arguments = {
+        "source_dir": str(source_dir),
+        "isolated": isolated,
+        "quiet": quiet,
+        "cache_dir": None if cache is None else str(cache.cache_dir),
+        "vcs_root": None if vcs_root is None else str(vcs_root),
+        "env_pool_dir": None if env_pool is None else str(env_pool.cache_dir),
+    }
+    package_parent = str(pathlib.Path(mddj.__file__).parent.parent)
+    bootstrap = (
+        f"import sys; sys.path.insert(0, {package_parent!r}); "
+        f"from {__name__} import main; main(sys.argv[1:])"
+    )
+    return [sys.executable, "-c", bootstrap, json.dumps(arguments), str(output)]
+
+
+def main(argv: t.Sequence[str]) -> None:
+    raw_arguments, output = argv
+    arguments = json.loads(raw_arguments)
+    cache_dir, env_pool_dir = arguments["cache_dir"], arguments["env_pool_dir"]
+    text = _wheel_metadata.get_package_metadata_text(
+        pathlib.Path(arguments["source_dir"]),
+        arguments["isolated"],
+        arguments["quiet"],
+        cache=(
+            None
+            if cache_dir is None
+            else _metadata_cache.MetadataCache(pathlib.Path(cache_dir))
+        ),
+        vcs_root=(
+            None
+            if arguments["vcs_root"] is None
+            else pathlib.Path(arguments["vcs_root"])
+        ),
+        env_pool=(
+            None
+            if env_pool_dir is None
+            else _build_envs.BuildEnvPool(pathlib.Path(env_pool_dir))
+        ),
+    )
+    pathlib.Path(output).write_text(text, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,225 @@
+"""
+Partial parsing of TOML files.
+
+A file is scanned for its table headers, skipping over strings, comments, and
+array and inline table values, which divides it into sections. To read a table,
+only the sections which can contribute to it are parsed.
+
+A section which is an ancestor of the requested table (like the root section, or
+``[tool]`` for ``tool.mddj``) could also define it with dotted keys or an inline
+table. If such a section appears to mention the table, or if the file can't be
+scanned confidently, the caller is told to parse the whole file instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import mmap
+import os
+import pathlib
+import re
+import sys
+import typing as t
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+# files at least this large are memory-mapped for scanning
+_MMAP_MIN_SIZE = 256 * 1024
+
+# skip over anything other than a bracket or brace, including strings and comments
+# which contain them, and then match the bracket
+# this is used with `match()`, and can't fail, so it never backtracks
+_BRACKET_RE = re.compile(
+    rb"""
+    (?:
+        [^"'\#\[\]{}]+
+        | \"\"\"(?:[^"\\]|\\[\s\S]|""?(?!"))*\"{3,5}
+        | '''[\s\S]*?'{3,5}
+        | "(?:[^"\\\n]|\\.)*"
+        | '[^'\n]*'
+        | \#[^\n]*
+    )*
+    (?P<bracket>[\[\]{}])?
+    """,
+    re.VERBOSE,
+)
+_SIMPLE_KEY = rb"""[A-Za-z0-9_-]+|"(?:[^"\\\n]|\\.)*"|'[^'\n]*'"""
+_HEADER_RE = re.compile(
+    rb"(\[\[?)[ \t]*((?:%s)(?:[ \t]*\.[ \t]*(?:%s))*)[ \t]*(\]\]?)"
+    % (_SIMPLE_KEY, _SIMPLE_KEY)
+)
+_SIMPLE_KEY_RE = re.compile(_SIMPLE_KEY)
+
+_Data: t.TypeAlias = bytes | mmap.mmap
+
+
+class Ambiguous(Exception):
+    """Raised when a table can't be read without parsing the whole file."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _Section:
+    # the key path of the table header, or () for the root section
+    path: tuple[str, ...]
+    is_array: bool
+    start: int
+    end: int
+
+
+@dataclasses.dataclass(frozen=True)
+class TableIndex:
+    """The sections of a TOML file, and the file state which they describe."""
+
+    sections: tuple[_Section, ...]
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def build(cls, path: pathlib.Path) -> TableIndex:
+        """
+        Scan a file for its table headers.
+
+        :raises Ambiguous: if the file can't be divided into sections
+        """
+        with path.open("rb") as fp:
+            stat = os.fstat(fp.fileno())
+            with _open_data(fp, stat.st_size) as data:
+                sections = _scan(data)
+        return cls(sections, stat.st_size, stat.st_mtime_ns)
+
+    def is_current(self, path: pathlib.Path) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    def read_table(self, path: pathlib.Path, keys: tuple[str, ...]) -> t.Any:
+        """
+        Parse the sections of a file which define the table at ``keys``, and
+        return its value (or None if it is not defined).
+
+        :raises Ambiguous: if the value can't be determined from a partial parse
+        """
+        with path.open("rb") as fp:
+            stat = os.fstat(fp.fileno())
+            if (stat.st_size, stat.st_mtime_ns) != (self.size, self.mtime_ns):
+                raise Ambiguous("the file changed after it was scanned")
+            with _open_data(fp, stat.st_size) as data:
+                content = b"".join(
+                    data[section.start : section.end]
+                    for section in self._select(keys, data)
+                )
+        if not content:
+            return None
+
+        try:
+            cursor: t.Any = tomllib.loads(content.decode("utf-8"))
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+            # let a full parse report the error
+            raise Ambiguous("the partial document could not be parsed") from e
+        for key in keys:
+            if not isinstance(cursor, dict) or key not in cursor:
+                return None
+            cursor = cursor[key]
+        return cursor
+
+    def _select(self, keys: tuple[str, ...], data: _Data) -> list[_Section]:
+        selected = []
+        for section in self.sections:
+            if section.path[: len(keys)] == keys:
+                selected.append(section)
+            elif keys[: len(section.path)] == section.path:
+                # an ancestor table could define the requested one with a dotted
+                # key or an inline table
+                if section.is_array:
+                    raise Ambiguous(f"{section.path} is an array of tables")
+                pattern = _key_line_pattern(keys[len(section.path)])
+                if pattern.search(data, section.start, section.end):
+                    raise Ambiguous(f"{section.path} may define {keys}")
+        return selected
+
+
+@contextlib.contextmanager
+def _open_data(fp: t.BinaryIO, size: int) -> t.Iterator[_Data]:
+    """Read a file's content, using a memory map for large files."""
+    if size < _MMAP_MIN_SIZE:
+        yield fp.read()
+        return
+    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield data
+
+
+def _key_line_pattern(key: str) -> re.Pattern[bytes]:
+    """
+    Match a line which starts with ``key``, followed by ``.`` or ``=``.
+
+    Lines inside of multiline strings may match, which only means that a full parse
+    is done unnecessarily.
+    """
+    escaped = re.escape(key.encode("utf-8"))
+    return re.compile(
+        rb"""^[ \t]*(?:%s|"%s"|'%s')[ \t]*[.=]""" % (escaped, escaped, escaped),
+        re.MULTILINE,
+    )
+
+
+def _scan(data: _Data) -> tuple[_Section, ...]:
+    sections: list[_Section] = []
+    path: tuple[str, ...] = ()
+    is_array = False
+    start = 0
+    depth = 0
+    pos = 0
+    while pos < len(data):
+        match = _BRACKET_RE.match(data, pos)
+        assert match is not None
+        pos = match.end()
+        if match["bracket"] is None:
+            if pos < len(data):
+                raise Ambiguous("unterminated string")
+            break
+        bracket_pos = match.start("bracket")
+        bracket = data[bracket_pos : bracket_pos + 1]
+        if bracket in (b"]", b"}"):
+            depth -= 1
+            if depth < 0:
+                raise Ambiguous("unbalanced brackets")
+        elif depth == 0 and bracket == b"[" and _at_line_start(data, bracket_pos):
+            header = _HEADER_RE.match(data, bracket_pos)
+            if header is None or len(header[1]) != len(header[3]):
+                raise Ambiguous("malformed table header")
+            sections.append(_Section(path, is_array, start, bracket_pos))
+            path = _parse_key(header[2])
+            is_array = len(header[1]) == 2
+            start = bracket_pos
+            pos = header.end()
+        else:
+            depth += 1
+
+    if depth != 0:
+        raise Ambiguous("unbalanced brackets")
+    sections.append(_Section(path, is_array, start, len(data)))
+    return tuple(sections)
+
+
+def _at_line_start(data: _Data, pos: int) -> bool:
+    line_start = data.rfind(b"\n", 0, pos) + 1
+    return not data[line_start:pos].strip(b" \t")
+
+
+def _parse_key(raw_key: bytes) -> tuple[str, ...]:
+    parts = []
+    for part in _SIMPLE_KEY_RE.findall(raw_key):
+        if part[:1] == b'"':
+            if b"\\" in part:
+                raise Ambiguous("escape sequences in table header")
+            part = part[1:-1]
+        elif part[:1] == b"'":
+            part = part[1:-1]
+        parts.append(part.decode("utf-8"))
+    return tuple(parts)
@@ -0,0 +1,122 @@
+"""
+Walking downwards from a root directory to find every project under it.
+
+Each directory is listed once with ``os.scandir`` and classified with the same
+detectors which are used for upwards discovery. VCS data, virtualenvs, tool
+caches, and (optionally) paths ignored by git are pruned from the walk.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import os
+import pathlib
+
+from . import _discovery, _gitignore
+
+# directories which never contain projects of interest
+PRUNED_NAMES: frozenset[str] = frozenset(
+    (".git", ".hg", ".svn", ".tox", ".nox", "node_modules", "__pycache__")
+)
+# a file which marks a directory as a virtualenv
+_VIRTUALENV_MARKER = "pyvenv.cfg"
+
+
+@dataclasses.dataclass(frozen=True)
+class FoundDirectory:
+    dirpath: pathlib.Path
+    characteristics: tuple[_discovery.Characteristic, ...]
+
+
+# a directory to scan, and the ignore rules of its parent
+_Task = tuple[pathlib.Path, "_gitignore.IgnoreRules | None"]
+
+
+def walk(
+    root: pathlib.Path,
+    *,
+    respect_gitignore: bool = True,
+    max_workers: int | None = None,
+) -> list[FoundDirectory]:
+    """
+    Find every directory under ``root`` (including ``root``) which has any
+    characteristics, sorted by path.
+
+    With ``max_workers``, directories are scanned in a thread pool of that size,
+    which helps on high-latency filesystems.
+    """
+    parent_rules = (
+        _gitignore.IgnoreRules.for_directory(root.parent) if respect_gitignore else None
+    )
+    # errors for the root are raised, but unreadable subdirectories are skipped
+    found, tasks = _scan((root, parent_rules), respect_gitignore)
+    results = [found] if found else []
+
+    if max_workers is None:
+        while tasks:
+            found, more_tasks = _scan_subdir(tasks.pop(), respect_gitignore)
+            if found:
+                results.append(found)
+            tasks.extend(more_tasks)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            pending = {
+                executor.submit(_scan_subdir, task, respect_gitignore) for task in tasks
+            }
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    found, more_tasks = future.result()
+                    if found:
+                        results.append(found)
+                    pending.update(
+                        executor.submit(_scan_subdir, task, respect_gitignore)
+                        for task in more_tasks
+                    )
+
+    return sorted(results, key=lambda found: found.dirpath)
+
+
+def _scan_subdir(
+    task: _Task, respect_gitignore: bool
+) -> tuple[FoundDirectory | None, list[_Task]]:
+    try:
+        return _scan(task, respect_gitignore)
+    except OSError:
+        return None, []
+
+
+def _scan(
+    task: _Task, respect_gitignore: bool
+) -> tuple[FoundDirectory | None, list[_Task]]:
+    dirpath, parent_rules = task
+    with os.scandir(dirpath) as scanner:
+        entries = list(scanner)
+    names = frozenset(entry.name for entry in entries)
+    if _VIRTUALENV_MARKER in names:
+        return None, []
+
+    rules: _gitignore.IgnoreRules | None = None
+    if respect_gitignore:
+        if ".git" in names:
+            # the root of a repository, which may be nested in another one
+            rules = _gitignore.IgnoreRules.for_directory(dirpath)
+        elif parent_rules is not None:
+            rules = parent_rules.enter(dirpath)
+
+    tasks: list[_Task] = []
+    for entry in entries:
+        # symlinks are not followed, which also avoids cycles
+        if entry.name in PRUNED_NAMES or not entry.is_dir(follow_symlinks=False):
+            continue
+        subdir = dirpath / entry.name
+        if rules is not None and rules.is_ignored(subdir, is_dir=True):
+            continue
+        tasks.append((subdir, rules))
+
+    characteristics = _discovery.detect_characteristics(names)
+    found = FoundDirectory(dirpath, tuple(characteristics)) if characteristics else None
+    return found, tasks
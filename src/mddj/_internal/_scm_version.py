@@ -0,0 +1,197 @@
+"""
+Computation of versions from VCS tags, compatible with ``setuptools-scm`` (and
+therefore ``hatch-vcs``).
+
+Only git repositories and setuptools-scm's default ``guess-next-dev`` version
+scheme are supported. Configuration which changes how the version is computed
+in other ways is reported as unsupported, so that callers can fall back to a
+build.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import os
+import pathlib
+import re
+import typing as t
+
+from packaging.version import InvalidVersion, Version
+
+from . import _core_metadata, _git, _git_describe
+
+DEFAULT_TAG_REGEX = r"^(?:[\w-]+-)?(?P<version>[vV]?\d+(?:\.\d+){0,2}[^\+]*)(?:\+.*)?$"
+
+_LOCAL_SCHEMES = ("node-and-date", "node-and-timestamp", "no-local-version")
+
+# options which do not affect the computed version
+_IGNORED_OPTIONS = frozenset(
+    (
+        "write_to",
+        "write_to_template",
+        "version_file",
+        "version_file_template",
+        "relative_to",
+        "dist_name",
+    )
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ScmConfig:
+    root: str = "."
+    tag_regex: str = DEFAULT_TAG_REGEX
+    local_scheme: str = "node-and-date"
+    fallback_version: str | None = None
+    search_parent_directories: bool = False
+
+    @classmethod
+    def from_options(cls, options: t.Mapping[str, t.Any]) -> ScmConfig | None:
+        """
+        Build a config from setuptools-scm options, or return None if the options
+        are not supported.
+        """
+        kwargs: dict[str, t.Any] = {}
+        for key, value in options.items():
+            key = key.replace("-", "_")
+            if key in _IGNORED_OPTIONS:
+                continue
+            elif key == "version_scheme" and value == "guess-next-dev":
+                continue
+            elif key == "local_scheme" and value in _LOCAL_SCHEMES:
+                kwargs[key] = value
+            elif key in ("root", "tag_regex", "fallback_version"):
+                if not isinstance(value, str):
+                    return None
+                kwargs[key] = value
+            elif key == "search_parent_directories" and isinstance(value, bool):
+                kwargs[key] = value
+            elif key == "normalize" and value is True:
+                continue
+            else:
+                return None
+        return cls(**kwargs)
+
+
+def pretend_version(dist_name: str | None) -> str | None:
+    """Get a version set via ``SETUPTOOLS_SCM_PRETEND_VERSION[_FOR_<NAME>]``."""
+    if dist_name is not None:
+        normalized = re.sub(r"[-_.]+", "-", dist_name).upper().replace("-", "_")
+        if version := os.environ.get(
+            f"SETUPTOOLS_SCM_PRETEND_VERSION_FOR_{normalized}"
+        ):
+            return version
+    return os.environ.get("SETUPTOOLS_SCM_PRETEND_VERSION") or None
+
+
+def version_from_description(
+    description: _git_describe.Description, config: ScmConfig
+) -> str | None:
+    """
+    Format a version with the ``guess-next-dev`` scheme and the configured local
+    scheme. Returns None if the tag can't be parsed as a version.
+    """
+    if description.tag is None:
+        tag = Version("0.0")
+        node = f"g{description.sha[:7]}"
+    else:
+        parsed = _tag_to_version(description.tag, config.tag_regex)
+        if parsed is None:
+            return None
+        tag = parsed
+        node = f"g{description.abbrev}"
+
+    exact = description.distance == 0 and not description.dirty
+    if exact:
+        public = str(tag)
+    else:
+        # setuptools-scm has special cases for post- and dev-release tags, which
+        # are left to a build
+        if tag.is_postrelease or tag.is_devrelease:
+            return None
+        guessed = _guess_next_version(str(tag))
+        if guessed is None:
+            return None
+        public = f"{guessed}.dev{description.distance}"
+
+    return public + _local_version(config.local_scheme, exact, node, description.dirty)
+
+
+def read_pkg_info_version(project_dir: pathlib.Path) -> str | None:
+    """Read the version from ``PKG-INFO``, which is present in unpacked sdists."""
+    try:
+        content = (project_dir / "PKG-INFO").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return _core_metadata.CoreMetadata(content).get("Version")
+
+
+def compute_version(
+    scm_root: pathlib.Path,
+    vcs_root: pathlib.Path | None,
+    config: ScmConfig,
+    *,
+    dist_name: str | None,
+) -> str | None:
+    """
+    Compute a version for the project at ``scm_root``, as setuptools-scm would.
+
+    ``vcs_root`` is the root of the enclosing repository, if any.
+    """
+    if (version := pretend_version(dist_name)) is not None:
+        return version
+
+    if vcs_root is not None and not config.search_parent_directories:
+        if vcs_root != scm_root:
+            vcs_root = None
+
+    if vcs_root is None or _git.find_git_dir(vcs_root) is None:
+        return read_pkg_info_version(scm_root) or config.fallback_version
+
+    description = _git_describe.describe(vcs_root)
+    if description is None:
+        return config.fallback_version
+    return version_from_description(description, config)
+
+
+def _tag_to_version(tag: str, tag_regex: str) -> Version | None:
+    try:
+        match = re.match(tag_regex, tag)
+    except re.error:
+        return None
+    if match is None:
+        return None
+    version = match.group("version") if "version" in match.groupdict() else None
+    if version is None and match.groups():
+        version = match.group(1)
+    if not version:
+        return None
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+def _guess_next_version(version: str) -> str | None:
+    version = version.partition("+")[0]
+    if (match := re.match(r"(.*?)(\d+)$", version)) is None:
+        return None
+    prefix, tail = match.groups()
+    return f"{prefix}{int(tail) + 1}"
+
+
+def _local_version(scheme: str, exact: bool, node: str, dirty: bool) -> str:
+    if scheme == "no-local-version" or exact:
+        return ""
+    if not dirty:
+        return f"+{node}"
+
+    date_format = "%Y%m%d" if scheme == "node-and-date" else "%Y%m%d%H%M%S"
+    return f"+{node}.d{_build_time().strftime(date_format)}"
+
+
+def _build_time() -> datetime.datetime:
+    if epoch := os.environ.get("SOURCE_DATE_EPOCH"):
+        return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc)
+    return datetime.datetime.now(datetime.timezone.utc)
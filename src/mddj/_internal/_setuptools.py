@@ -0,0 +1,452 @@
+"""
+Emulation of setuptools' rules for dynamic metadata.
+
+Two sources of configuration are supported:
+
+- ``[tool.setuptools.dynamic]`` in ``pyproject.toml``, for fields listed in
+  ``project.dynamic``
+- the ``[metadata]`` and ``[options]`` sections of ``setup.cfg``
+
+Values may use the ``attr:`` and ``file:`` directives. As in setuptools, ``attr:``
+is first evaluated by finding a literal assignment in the module's AST. setuptools
+imports the module when that fails, but mddj reports "unknown" instead.
+
+``setup.cfg`` is only used when there is no ``setup.py``, or when ``setup.py``
+does nothing more than call ``setup()`` with no arguments. Otherwise, ``setup.py``
+may override any value, and only a build can tell.
+
+Nothing is resolved for a project which ``build`` would refuse to build, because
+it has neither a ``pyproject.toml`` nor a ``setup.py``.
+"""
+
+from __future__ import annotations
+
+import ast
+import configparser
+import functools
+import pathlib
+import re
+import typing as t
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.utils import canonicalize_name
+
+SETUPTOOLS_BACKENDS: frozenset[str] = frozenset(
+    ("setuptools.build_meta", "setuptools.build_meta:__legacy__")
+)
+
+# setup.cfg option aliases, as understood by setuptools
+_METADATA_ALIASES: dict[str, tuple[str, ...]] = {
+    "classifiers": ("classifiers", "classifier"),
+    "description": ("description", "summary"),
+}
+
+
+class Unresolvable(Exception):
+    """Raised when a value cannot be determined without running setuptools."""
+
+
+class SetuptoolsProject:
+    """
+    The dynamic metadata configuration of a setuptools project.
+
+    Each method returns ``None`` when the value is not configured, or raises
+    ``Unresolvable`` when it is configured in a way which cannot be evaluated
+    statically.
+    """
+
+    def __init__(
+        self, project_dir: pathlib.Path, pyproject: t.Mapping[str, t.Any]
+    ) -> None:
+        self.project_dir = project_dir
+
+        project = pyproject.get("project")
+        self._has_project_table = isinstance(project, t.Mapping)
+        self._project_dynamic: frozenset[str] = frozenset()
+        if self._has_project_table:
+            dynamic = project.get("dynamic", [])  # type: ignore[union-attr]
+            if isinstance(dynamic, list):
+                self._project_dynamic = frozenset(str(x) for x in dynamic)
+
+        tool_setuptools = pyproject.get("tool", {}).get("setuptools", {})
+        if not isinstance(tool_setuptools, t.Mapping):
+            tool_setuptools = {}
+        self._dynamic_cfg: t.Mapping[str, t.Any] = tool_setuptools.get("dynamic", {})
+        self._pyproject_package_dir: t.Mapping[str, str] | None = tool_setuptools.get(
+            "package-dir"
+        )
+
+    # fields
+
+    def name(self) -> str | None:
+        if self._has_project_table:
+            return None
+        value = self._setup_cfg_option("metadata", "name")
+        return None if value is None else safe_name(value)
+
+    def version(self) -> str | None:
+        if (directive := self._pyproject_directive("version")) is not None:
+            return _version_from_value(self._expand_directive(directive))
+
+        value = self._setup_cfg_option("metadata", "version", field="version")
+        if value is None:
+            return None
+        if value.startswith("file:"):
+            return self._read_files(_split_file_directive(value)).strip()
+        if value.startswith("attr:"):
+            return _version_from_value(self._read_attr(value[len("attr:") :]))
+        return value
+
+    def description(self) -> str | None:
+        if (directive := self._pyproject_directive("description")) is not None:
+            value = self._expand_directive(directive)
+        else:
+            value = self._setup_cfg_option("metadata", "description")
+            if value is not None and value.startswith("file:"):
+                value = self._read_files(_split_file_directive(value))
+
+        if value is None:
+            return None
+        if not isinstance(value, str) or "\n" in value.strip():
+            raise Unresolvable("description must be a single line of text")
+        return value.strip()
+
+    def classifiers(self) -> tuple[str, ...] | None:
+        if (directive := self._pyproject_directive("classifiers")) is not None:
+            text = self._expand_directive(directive)
+            return tuple(line for line in text.splitlines() if line.strip())
+
+        value = self._setup_cfg_option("metadata", "classifiers")
+        if value is None:
+            return None
+        if value.startswith("file:"):
+            value = self._read_files(_split_file_directive(value))
+        return tuple(_parse_list(value))
+
+    def keywords(self) -> tuple[str, ...] | None:
+        value = self._setup_cfg_option("metadata", "keywords", field="keywords")
+        if value is None:
+            return None
+        return tuple(_parse_list(value))
+
+    def dependencies(self) -> tuple[str, ...] | None:
+        if (directive := self._pyproject_directive("dependencies")) is not None:
+            return _normalize_requirements(
+                _pyproject_requirements(self._expand_directive(directive))
+            )
+
+        value = self._setup_cfg_option(
+            "options", "install_requires", field="dependencies"
+        )
+        if value is None:
+            return None
+        return _normalize_requirements(self._setup_cfg_requirements(value))
+
+    def optional_dependencies(self) -> dict[str, tuple[str, ...]] | None:
+        result: dict[str, tuple[str, ...]] = {}
+
+        if (table := self._pyproject_directive("optional-dependencies")) is not None:
+            if not isinstance(table, t.Mapping):
+                raise Unresolvable("invalid tool.setuptools.dynamic table")
+            for group, directive in table.items():
+                requirements = _pyproject_requirements(
+                    self._expand_directive(directive)
+                )
+                result[canonicalize_name(group)] = _normalize_requirements(requirements)
+            return result
+
+        if not self._uses_setup_cfg("optional-dependencies"):
+            return None
+        parser = self._setup_cfg
+        if parser is None or not parser.has_section("options.extras_require"):
+            return None
+        for group, value in parser.items("options.extras_require"):
+            result[canonicalize_name(group)] = _normalize_requirements(
+                self._setup_cfg_requirements(value)
+            )
+        return result
+
+    def requires_python(self) -> str | None:
+        value = self._setup_cfg_option(
+            "options", "python_requires", field="requires-python"
+        )
+        if value is None:
+            return None
+        try:
+            return str(SpecifierSet(value))
+        except InvalidSpecifier as e:
+            raise Unresolvable(str(e)) from e
+
+    # pyproject.toml
+
+    def _pyproject_directive(self, field: str) -> t.Any:
+        if not self._has_project_table or field not in self._project_dynamic:
+            return None
+        return self._dynamic_cfg.get(field)
+
+    def _expand_directive(self, directive: t.Any) -> t.Any:
+        if not isinstance(directive, t.Mapping):
+            raise Unresolvable(f"invalid directive: {directive!r}")
+        if "file" in directive:
+            paths = directive["file"]
+            return self._read_files([paths] if isinstance(paths, str) else paths)
+        if "attr" in directive:
+            return self._read_attr(directive["attr"])
+        raise Unresolvable(f"invalid directive: {directive!r}")
+
+    # setup.cfg
+
+    @functools.cached_property
+    def _setup_cfg(self) -> configparser.ConfigParser | None:
+        return _load_setup_cfg(self.project_dir)
+
+    def _uses_setup_cfg(self, field: str) -> bool:
+        # with a [project] table, setup.cfg can only supply fields which are
+        # dynamic and not configured in tool.setuptools.dynamic
+        if self._has_project_table and (
+            field not in self._project_dynamic or field in self._dynamic_cfg
+        ):
+            return False
+        return _setup_py_is_trivial(self.project_dir)
+
+    def _setup_cfg_option(
+        self, section: str, option: str, *, field: str | None = None
+    ) -> str | None:
+        if not self._uses_setup_cfg(field or option):
+            return None
+        if (parser := self._setup_cfg) is None:
+            return None
+        for name in _METADATA_ALIASES.get(option, (option,)):
+            for spelling in (name, name.replace("_", "-")):
+                try:
+                    value = parser.get(section, spelling)
+                except (configparser.NoSectionError, configparser.NoOptionError):
+                    continue
+                except configparser.Error as e:
+                    raise Unresolvable(str(e)) from e
+                return value.strip()
+        return None
+
+    def _setup_cfg_requirements(self, value: str) -> list[str]:
+        if value.startswith("file:"):
+            value = self._read_files(_split_file_directive(value))
+        return [x for x in _parse_list(value, separator=";") if not x.startswith("#")]
+
+    # directives
+
+    @functools.cached_property
+    def _package_dir(self) -> t.Mapping[str, str]:
+        if self._pyproject_package_dir is not None:
+            return self._pyproject_package_dir
+        if (parser := self._setup_cfg) is not None and parser.has_option(
+            "options", "package_dir"
+        ):
+            return _parse_dict(parser.get("options", "package_dir"))
+        # with no explicit configuration, setuptools discovers a src-layout
+        if (self.project_dir / "src").is_dir():
+            return {"": "src"}
+        return {}
+
+    def _read_files(self, filepaths: t.Iterable[str]) -> str:
+        root = self.project_dir.resolve()
+        contents = []
+        for filepath in filepaths:
+            path = (root / filepath).resolve()
+            if root not in path.parents:
+                raise Unresolvable(f"Cannot access {filepath!r}")
+            # setuptools skips missing files with a warning
+            if not path.is_file():
+                continue
+            try:
+                contents.append(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError) as e:
+                raise Unresolvable(str(e)) from e
+        return "\n".join(contents)
+
+    def _read_attr(self, attr_desc: str) -> t.Any:
+        module_name, _, attr_name = attr_desc.strip().rpartition(".")
+        module_path = find_module_file(
+            module_name or "__init__", self._package_dir, self.project_dir
+        )
+        if module_path is None:
+            raise Unresolvable(f"could not find the module for {attr_desc!r}")
+        return read_literal_attr(module_path, attr_name)
+
+
+def is_buildable(project_dir: pathlib.Path) -> bool:
+    """Check whether ``build`` accepts a directory as a project."""
+    return (project_dir / "pyproject.toml").is_file() or (
+        project_dir / "setup.py"
+    ).is_file()
+
+
+def safe_name(name: str) -> str:
+    """
+    Get a name as setuptools writes it to metadata, with each run of characters
+    other than letters, digits, and dots replaced by a hyphen.
+    """
+    return re.sub(r"[^A-Za-z0-9.]+", "-", name)
+
+
+def find_module_file(
+    module_name: str, package_dir: t.Mapping[str, str], root_dir: pathlib.Path
+) -> pathlib.Path | None:
+    """Locate a module's source file in the way that setuptools does."""
+    parent_path = root_dir
+    module_parts = module_name.split(".")
+    if module_parts[0] in package_dir:
+        custom_path = package_dir[module_parts[0]]
+        parent, _, parent_module = custom_path.rpartition("/")
+        if parent:
+            parent_path = root_dir / parent
+        module_parts = [parent_module, *module_parts[1:]]
+    elif "" in package_dir:
+        parent_path = root_dir / package_dir[""]
+
+    path_start = parent_path.joinpath(*module_parts)
+    for candidate in (
+        path_start.with_name(f"{path_start.name}.py"),
+        path_start / "__init__.py",
+    ):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def read_literal_attr(path: pathlib.Path, attr_name: str) -> t.Any:
+    """
+    Read an attribute of a module from its first top-level assignment, which must
+    be a literal.
+    """
+    try:
+        module = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError) as e:
+        raise Unresolvable(str(e)) from e
+
+    for statement in module.body:
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            targets = [statement.target]
+        else:
+            continue
+        if any(isinstance(x, ast.Name) and x.id == attr_name for x in targets):
+            try:
+                return ast.literal_eval(statement.value)  # type: ignore[arg-type]
+            except (ValueError, TypeError, SyntaxError, RecursionError) as e:
+                raise Unresolvable(f"{attr_name} is not a literal") from e
+    raise Unresolvable(f"{attr_name} is not assigned in {path}")
+
+
+def setup_py_is_trivial(path: pathlib.Path) -> bool:
+    """
+    Check whether a ``setup.py`` file does nothing except call ``setup()`` without
+    arguments, so that all of its configuration comes from other files.
+    """
+    try:
+        module = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return False
+    return all(_is_trivial_statement(statement) for statement in module.body)
+
+
+def _setup_py_is_trivial(project_dir: pathlib.Path) -> bool:
+    setup_py = project_dir / "setup.py"
+    return not setup_py.exists() or setup_py_is_trivial(setup_py)
+
+
+def _is_trivial_statement(node: ast.stmt) -> bool:
+    match node:
+        case ast.Import(names=names):
+            return all(alias.name == "setuptools" for alias in names)
+        case ast.ImportFrom(module="setuptools"):
+            return True
+        case ast.Expr(value=ast.Constant(value=str())):
+            return True
+        case ast.Expr(value=ast.Call(func=func, args=[], keywords=[])):
+            return _is_setup_function(func)
+        case ast.If(test=test, body=body, orelse=[]) if _is_main_guard(test):
+            return all(_is_trivial_statement(statement) for statement in body)
+    return False
+
+
+def _is_setup_function(node: ast.expr) -> bool:
+    match node:
+        case ast.Name(id="setup"):
+            return True
+        case ast.Attribute(value=ast.Name(id="setuptools"), attr="setup"):
+            return True
+    return False
+
+
+def _is_main_guard(node: ast.expr) -> bool:
+    match node:
+        case ast.Compare(
+            left=ast.Name(id="__name__"),
+            ops=[ast.Eq()],
+            comparators=[ast.Constant(value="__main__")],
+        ):
+            return True
+    return False
+
+
+def _load_setup_cfg(project_dir: pathlib.Path) -> configparser.ConfigParser | None:
+    path = project_dir / "setup.cfg"
+    if not path.is_file():
+        return None
+    # match setuptools, which uses the default interpolation and case-sensitive keys
+    parser = configparser.ConfigParser()
+    parser.optionxform = str  # type: ignore[assignment,method-assign]
+    try:
+        parser.read(path, encoding="utf-8")
+    except (configparser.Error, UnicodeDecodeError) as e:
+        raise Unresolvable(str(e)) from e
+    return parser
+
+
+def _parse_list(value: str, separator: str = ",") -> list[str]:
+    chunks = value.splitlines() if "\n" in value else value.split(separator)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def _parse_dict(value: str) -> dict[str, str]:
+    result = {}
+    for line in _parse_list(value):
+        key, sep, val = line.partition("=")
+        if not sep:
+            raise Unresolvable(f"Unable to parse option value to dict: {value}")
+        result[key.strip()] = val.strip()
+    return result
+
+
+def _split_file_directive(value: str) -> list[str]:
+    return [path.strip() for path in value[len("file:") :].split(",")]
+
+
+def _pyproject_requirements(text: t.Any) -> list[str]:
+    if not isinstance(text, str):
+        raise Unresolvable("requirements must be read from a file")
+    return [
+        line
+        for line in text.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+def _normalize_requirements(requirements: t.Iterable[str]) -> tuple[str, ...]:
+    # requirements are normalized when written to metadata
+    try:
+        return tuple(str(Requirement(x)) for x in requirements)
+    except InvalidRequirement as e:
+        raise Unresolvable(str(e)) from e
+
+
+def _version_from_value(value: t.Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (tuple, list)):
+        return ".".join(map(str, value))
+    if isinstance(value, (int, float)):
+        return str(value)
+    raise Unresolvable(f"unsupported version value: {value!r}")
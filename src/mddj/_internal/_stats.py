@@ -0,0 +1,89 @@
+"""
+Statistics for the in-memory caches: the number of lookups and misses of each
+cache, and the time spent computing values on misses.
+
+Collection is process-wide and disabled by default. While it is disabled, a cache
+lookup only checks ``enabled``, and a miss gets a shared ``nullcontext``.
+
+Compute times are inclusive: the time of a miss includes the time of any misses
+in other caches which were needed to compute its value.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import threading
+import time
+import typing as t
+
+#: Whether or not statistics are being collected.
+enabled = False
+
+_lock = threading.Lock()
+# for each cache, the number of lookups and misses, and the compute time in ns
+_counters: dict[str, list[int]] = {}
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheCounters:
+    name: str
+    lookups: int
+    misses: int
+    compute_ns: int
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def reset() -> None:
+    """Discard all statistics, and stop collecting them."""
+    global enabled
+    with _lock:
+        enabled = False
+        _counters.clear()
+
+
+def record_lookup(name: str) -> None:
+    if not enabled:
+        return
+    with _lock:
+        _counter(name)[0] += 1
+
+
+def miss(name: str) -> t.ContextManager[object]:
+    """Record a miss, and the time spent computing the value in this context."""
+    if not enabled:
+        return _NULL_CONTEXT
+    return _timed_miss(name)
+
+
+@contextlib.contextmanager
+def _timed_miss(name: str) -> t.Iterator[None]:
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        with _lock:
+            counter = _counter(name)
+            counter[1] += 1
+            counter[2] += elapsed
+
+
+def snapshot() -> tuple[CacheCounters, ...]:
+    """Get the statistics of every cache which has been used, sorted by name."""
+    with _lock:
+        return tuple(
+            CacheCounters(name, *counter) for name, counter in sorted(_counters.items())
+        )
+
+
+def _counter(name: str) -> list[int]:
+    # called with the lock held
+    if name not in _counters:
+        _counters[name] = [0, 0, 0]
+    return _counters[name]
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import itertools
 import pathlib
-import re
+import tempfile
 import types
 import typing as t
 
-from packaging.markers import Marker
-from packaging.requirements import Requirement
+from packaging.utils import canonicalize_name
 
-try:
-    import importlib_metadata as _importlib_metadata
-except ImportError:
-    import importlib.metadata as _importlib_metadata
+from . import _build_envs, _core_metadata, _metadata_cache
+
+if t.TYPE_CHECKING:
+    import build
+    from packaging.markers import Marker
+    from packaging.requirements import Requirement
 
 
 @dataclasses.dataclass
@@ -31,93 +34,387 @@ class WheelDependencyData:
 
 
 def get_package_metadata(
-    source_dir: pathlib.Path, isolated: bool = True, quiet: bool = True
-) -> _importlib_metadata.PackageMetadata:
+    source_dir: pathlib.Path,
+    isolated: bool = True,
+    quiet: bool = True,
+    *,
+    cache: _metadata_cache.MetadataCache | None = None,
+    vcs_root: pathlib.Path | None = None,
+    env_pool: _build_envs.BuildEnvPool | None = None,
+) -> _core_metadata.CoreMetadata:
     """
     Get metadata for wheel, either using the PEP 517 hook or by actually
     doing a wheel build and examining the result.
+
+    If a ``cache`` is given, the result is looked up in (and stored in) the cache,
+    keyed by a fingerprint of the source tree. ``vcs_root`` is used to include the
+    checked out commit in that fingerprint.
+
+    If an ``env_pool`` is given, isolated builds use an environment from the pool
+    rather than creating a new one.
     """
-    import build.util
+    return parse_package_metadata(
+        get_package_metadata_text(
+            source_dir,
+            isolated,
+            quiet,
+            cache=cache,
+            vcs_root=vcs_root,
+            env_pool=env_pool,
+        )
+    )
+
+
+def get_package_metadata_text(
+    source_dir: pathlib.Path,
+    isolated: bool = True,
+    quiet: bool = True,
+    *,
+    cache: _metadata_cache.MetadataCache | None = None,
+    vcs_root: pathlib.Path | None = None,
+    env_pool: _build_envs.BuildEnvPool | None = None,
+) -> str:
+    """Get the text of the METADATA file for a wheel, as ``get_package_metadata``."""
+    if cache is None:
+        return _build_metadata_text(source_dir, isolated, quiet, env_pool)
+
+    key = _metadata_cache.source_fingerprint(
+        source_dir, vcs_root=vcs_root, isolated=isolated
+    )
+    if (text := cache.get(key)) is None:
+        text = _build_metadata_text(source_dir, isolated, quiet, env_pool)
+        cache.put(key, text)
+    return text
+
+
+def parse_package_metadata(text: str) -> _core_metadata.CoreMetadata:
+    """Parse the text of a METADATA file."""
+    return _core_metadata.CoreMetadata(text)
+
+
+def _build_metadata_text(
+    source_dir: pathlib.Path,
+    isolated: bool,
+    quiet: bool,
+    env_pool: _build_envs.BuildEnvPool | None,
+) -> str:
+    """
+    Invoke the build backend to prepare metadata, and return the METADATA content.
+
+    This follows the same procedure as ``build.util.project_wheel_metadata``, but
+    keeps the raw text so that it can be cached.
+    """
+    import build
+    import build.env
     import pyproject_hooks
 
     runner = pyproject_hooks.quiet_subprocess_runner
     if not quiet:
         runner = pyproject_hooks.default_subprocess_runner
-    return build.util.project_wheel_metadata(
-        source_dir, isolated=isolated, runner=runner
-    )
+
+    if isolated and env_pool is not None:
+        # a builder for the current interpreter is only used to read requirements
+        requires = build.ProjectBuilder(source_dir).build_system_requires
+        with env_pool.acquire(requires, quiet=quiet) as pooled_env:
+            builder = build.ProjectBuilder.from_isolated_env(
+                pooled_env, source_dir, runner=runner
+            )
+            full_requires = {*requires, *builder.get_requires_for_build("wheel")}
+            if _build_envs.normalize_requirements(full_requires) == (
+                pooled_env.requirements
+            ):
+                return _read_metadata_text(builder)
+            # pooled environments are shared, so requirements which the backend
+            # adds are never installed into them, but use an environment of their own
+            with env_pool.acquire(full_requires, quiet=quiet) as full_env:
+                return _read_metadata_text(
+                    build.ProjectBuilder.from_isolated_env(
+                        full_env, source_dir, runner=runner
+                    )
+                )
+    elif isolated:
+        with build.env.DefaultIsolatedEnv() as env:
+            builder = build.ProjectBuilder.from_isolated_env(
+                env, source_dir, runner=runner
+            )
+            env.install(builder.build_system_requires)
+            env.install(builder.get_requires_for_build("wheel"))
+            return _read_metadata_text(builder)
+    else:
+        return _read_metadata_text(build.ProjectBuilder(source_dir, runner=runner))
+
+
+def _read_metadata_text(builder: build.ProjectBuilder) -> str:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dist_info = pathlib.Path(builder.metadata_path(tmpdir))
+        return (dist_info / "METADATA").read_text(encoding="utf-8")
 
 
 def load_wheel_dependency_data(
-    metadata: _importlib_metadata.PackageMetadata,
+    metadata: _core_metadata.CoreMetadata,
 ) -> WheelDependencyData:
     provides_extra = metadata.get_all("Provides-Extra", [])
     requires_dist = metadata.get_all("Requires-Dist", [])
 
-    extras_map: dict[str, tuple[str, ...]] = {}
-    cleaned_extras_map: dict[str, tuple[str, ...]] = {}
-    for extra_name in provides_extra:
-        original_dists: list[str] = []
-        cleaned_dists: list[str] = []
-        for original, cleaned in _read_extra_from_dists(extra_name, requires_dist):
-            original_dists.append(original)
-            cleaned_dists.append(cleaned)
-        extras_map[extra_name] = tuple(original_dists)
-        cleaned_extras_map[extra_name] = tuple(cleaned_dists)
-
-    extra_deps = [dep for extra_deps in extras_map.values() for dep in extra_deps]
-    non_extra_deps = tuple(dep for dep in requires_dist if dep not in extra_deps)
-
+    partition = _DependencyPartition(provides_extra, requires_dist)
     return WheelDependencyData(
-        types.MappingProxyType(extras_map),
-        types.MappingProxyType(cleaned_extras_map),
-        non_extra_deps,
+        types.MappingProxyType(partition.original_extras()),
+        types.MappingProxyType(_CleanedExtras(partition)),
+        partition.dependencies,
     )
 
 
-def _read_extra_from_dists(
-    extra_name: str, requires_dist: t.Iterable[str]
-) -> t.Iterator[tuple[str, str]]:
+# a marker AST, as found in `Marker._markers`: a list of atoms (comparison tuples, or
+# nested lists for parenthesized groups) separated by the strings "and" and "or"
+# this attribute is private to packaging, so its shape is checked before it is used
+_MarkerList: t.TypeAlias = list[t.Any]
+
+
+@dataclasses.dataclass
+class _ExtraRequirement:
+    """A ``Requires-Dist`` entry which is attributed to one or more extras."""
+
+    original: str
+    # the requirement, without its marker
+    requirement: Requirement
+    # for each canonicalized extra name, the conjunctions under which the entry
+    # applies to that extra, with the `extra == ...` comparisons removed
+    # (a conjunction may also hold a whole marker string, which is kept as it is)
+    clauses: dict[str, list[list[t.Any]]]
+
+    @functools.cached_property
+    def unmarked(self) -> str:
+        return str(self.requirement)
+
+    def cleaned(self, extra: str) -> str:
+        if not (marker := _format_disjunction(self.clauses[extra])):
+            return self.unmarked
+        # a space is needed to separate a marker from a URL
+        separator = " ; " if self.requirement.url else "; "
+        return f"{self.unmarked}{separator}{marker}"
+
+
+class _DependencyPartition:
     """
-    Given an extra name, find all of the matching dependency dist strings.
+    Split ``Requires-Dist`` entries into dependencies and optional dependencies.
+
+    Each entry is parsed once. Its marker is expanded into a disjunction of
+    conjunctions wherever an ``extra`` comparison is nested in a group, and every
+    conjunction which requires exactly one extra attributes the entry to that extra.
+    Entries which apply without any extra, or only to extras which are not in
+    ``Provides-Extra``, are dependencies.
 
-    Return them as pairs of (original_value, interpreted_value) where
-    the interpreted value is an attempt to strip off the extra name.
+    If a marker's syntax tree does not have the expected shape, the marker is
+    instead evaluated for each extra (and in the current environment), and is kept
+    whole in the cleaned entries.
     """
-    subpattern = _extra_pattern(extra_name)
-    exact_pattern = re.compile(rf"^\s*{subpattern}\s*$")
-    trailing_pattern = re.compile(rf"^\s*(.*)\s+and\s+{subpattern}\s*$")
-    leading_pattern = re.compile(rf"^\s*{subpattern}\s+and\s+(.*)\s*$")
-
-    for dist_string in requires_dist:
-        # substring matching to reject most things very quickly, without regex matching
-        if "extra" not in dist_string or extra_name not in dist_string:
-            continue
-        req = Requirement(dist_string)
-        marker_string = str(req.marker)
 
-        # if an exact match works, strip markers entirely
-        if exact_pattern.search(marker_string):
+    def __init__(
+        self, provides_extra: t.Iterable[str], requires_dist: t.Iterable[str]
+    ) -> None:
+        self.extra_names: dict[str, str] = {
+            canonicalize_name(name): name for name in provides_extra
+        }
+        self.by_extra: dict[str, list[_ExtraRequirement]] = {
+            name: [] for name in self.extra_names
+        }
+
+        # parsing requirements is rarely needed, and importing the parser is slow
+        from packaging.requirements import Requirement
+
+        dependencies: list[str] = []
+        for dist_string in requires_dist:
+            # reject most entries quickly, without parsing
+            if "extra" not in dist_string:
+                dependencies.append(dist_string)
+                continue
+            req = Requirement(dist_string)
+            if req.marker is not None and _marker_list(req.marker) is None:
+                clauses = self._clauses_by_evaluation(req.marker)
+            else:
+                clauses = _clauses_by_extra(req.marker)
+            if clauses is None or not clauses.keys() & self.by_extra.keys():
+                dependencies.append(dist_string)
+                continue
             req.marker = None
-            yield (dist_string, str(req))
+            entry = _ExtraRequirement(dist_string, req, clauses)
+            for extra in clauses:
+                if extra in self.by_extra:
+                    self.by_extra[extra].append(entry)
+        self.dependencies = tuple(dependencies)
+
+    def _clauses_by_evaluation(
+        self, marker: Marker
+    ) -> dict[str, list[list[t.Any]]] | None:
+        if marker.evaluate({"extra": ""}):
+            return None
+        return {
+            extra: [[str(marker)]]
+            for extra, name in self.extra_names.items()
+            if marker.evaluate({"extra": name})
+        }
+
+    def original_extras(self) -> dict[str, tuple[str, ...]]:
+        return {
+            self.extra_names[extra]: tuple(entry.original for entry in entries)
+            for extra, entries in self.by_extra.items()
+        }
+
+    def cleaned(self, extra: str) -> tuple[str, ...]:
+        """
+        Get the entries for an extra, with the markers which select the extra
+        removed.
+        """
+        extra = canonicalize_name(extra)
+        return tuple(entry.cleaned(extra) for entry in self.by_extra[extra])
+
+
+class _CleanedExtras(t.Mapping[str, tuple[str, ...]]):
+    """A mapping of extras to cleaned requirements, computed on first access."""
+
+    def __init__(self, partition: _DependencyPartition) -> None:
+        self._partition = partition
+        self._cache: dict[str, tuple[str, ...]] = {}
+
+    def __getitem__(self, key: str) -> tuple[str, ...]:
+        if key not in self._partition.extra_names.values():
+            raise KeyError(key)
+        if key not in self._cache:
+            self._cache[key] = self._partition.cleaned(key)
+        return self._cache[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._partition.extra_names.values())
+
+    def __len__(self) -> int:
+        return len(self._partition.extra_names)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _clauses_by_extra(marker: Marker | None) -> dict[str, list[list[t.Any]]] | None:
+    """
+    Group the conjunctions of a marker by the extra which they require.
+
+    Returns None if the marker can be satisfied without any extra. Conjunctions
+    which require two different extras can never be satisfied, and are dropped.
+    """
+    if marker is None:
+        return None
+    result: dict[str, list[list[t.Any]]] = {}
+    markers = _marker_list(marker)
+    assert markers is not None
+    for conjunction in _disjuncts(markers):
+        extras = set()
+        rest = []
+        for atom in conjunction:
+            if (extra := _extra_value(atom)) is not None:
+                extras.add(canonicalize_name(extra))
+            else:
+                rest.append(atom)
+        if not extras:
+            return None
+        if len(extras) == 1:
+            result.setdefault(extras.pop(), []).append(rest)
+    return result
+
+
+def _marker_list(marker: Marker) -> _MarkerList | None:
+    """Get the syntax tree of a marker, or None if it has an unexpected shape."""
+    markers = getattr(marker, "_markers", None)
+    return markers if _is_marker_list(markers) else None
+
+
+def _is_marker_list(value: t.Any) -> bool:
+    if not isinstance(value, list):
+        return False
+    for item in value:
+        if isinstance(item, str):
+            if item not in ("and", "or"):
+                return False
+        elif isinstance(item, tuple):
+            if len(item) != 3 or not all(
+                hasattr(node, "serialize") and hasattr(node, "value") for node in item
+            ):
+                return False
+        elif not _is_marker_list(item):
+            return False
+    return True
+
+
+def _disjuncts(markers: _MarkerList) -> list[list[t.Any]]:
+    """
+    Expand a marker list into a list of conjunctions (lists of atoms).
+
+    Only groups which mention ``extra`` are expanded, so that other groups are kept
+    intact in the output.
+    """
+    result: list[list[t.Any]] = []
+    conjunction: list[list[list[t.Any]]] = []
+    for item in [*markers, "or"]:
+        if item == "and":
             continue
+        elif item == "or":
+            result.extend(
+                [atom for part in combination for atom in part]
+                for combination in itertools.product(*conjunction)
+            )
+            conjunction = []
+        elif isinstance(item, list) and _mentions_extra(item):
+            conjunction.append(_disjuncts(item))
+        else:
+            conjunction.append([[item]])
+    return result
+
+
+def _mentions_extra(markers: _MarkerList) -> bool:
+    return any(
+        _mentions_extra(item) if isinstance(item, list) else _extra_value(item)
+        for item in markers
+    )
+
+
+def _extra_value(atom: t.Any) -> str | None:
+    """If an atom is an ``extra == "..."`` comparison, get the extra name."""
+    if not isinstance(atom, tuple):
+        return None
+    lhs, op, rhs = atom
+    if op.serialize() != "==":
+        return None
+    # variables serialize as bare names, values as quoted strings
+    if lhs.serialize() == "extra":
+        return str(rhs.value)
+    if rhs.serialize() == "extra":
+        return str(lhs.value)
+    return None
+
+
+def _format_disjunction(clauses: list[list[t.Any]]) -> str:
+    """Format clauses as a marker string, or an empty string for "always true"."""
+    if any(not clause for clause in clauses):
+        return ""
+    formatted: list[str] = []
+    for clause in clauses:
+        # drop the parens around a group which is all that is left of a clause
+        if len(clause) == 1 and isinstance(clause[0], list):
+            text = _format_markers(clause[0])
+        else:
+            text = " and ".join(_format_atom(atom) for atom in clause)
+        if text not in formatted:
+            formatted.append(text)
+    return " or ".join(formatted)
+
+
+def _format_markers(markers: _MarkerList) -> str:
+    return " ".join(
+        item if isinstance(item, str) else _format_atom(item) for item in markers
+    )
+
 
-        # if the leading or trailing pattern matches, the modified marker is the
-        # matched group, with parens stripped if possible
-        if (re_match := leading_pattern.search(marker_string)) or (
-            re_match := trailing_pattern.search(marker_string)
-        ):
-            new_marker = re_match.group(1)
-            if new_marker is None:
-                print(f"{marker_string=} {leading_pattern=} {trailing_pattern=}")
-            # remove parens, and potentially extraneous whitespace within
-            if new_marker.startswith("(") and new_marker.endswith(")"):
-                new_marker = new_marker[1:-1].strip()
-            req.marker = Marker(new_marker)
-            yield (dist_string, str(req))
-
-
-def _extra_pattern(extra_name: str) -> str:
-    escaped_extra_name = re.escape(extra_name)
-    quoted_extra_name = f"(?:(?:'{escaped_extra_name}')|(?:\"{escaped_extra_name}\"))"
-    return r"extra\s*==\s*" + quoted_extra_name
+def _format_atom(atom: t.Any) -> str:
+    if isinstance(atom, str):
+        return atom
+    if isinstance(atom, list):
+        return f"({_format_markers(atom)})"
+    return " ".join(node.serialize() for node in atom)
@@ -0,0 +1,115 @@
+"""
+Reading of workspaces, which list the projects of a repository in the
+``pyproject.toml`` at its root.
+
+uv workspaces (``[tool.uv.workspace]``) and hatch workspaces (``workspace`` in
+any environment under ``[tool.hatch.envs]``) are supported. Members are found by
+expanding their globs, without walking the directory tree.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import glob
+import os
+import pathlib
+import typing as t
+
+from . import _cached_toml, _types
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkspaceDeclaration:
+    # the tool which declares the workspace, "uv" or "hatch"
+    tool: str
+    members: tuple[str, ...]
+    exclude: tuple[str, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class Workspace:
+    root: pathlib.Path
+    declarations: tuple[WorkspaceDeclaration, ...]
+    members: tuple[pathlib.Path, ...]
+
+    @classmethod
+    def load(
+        cls, root: pathlib.Path, document_cache: _cached_toml.TomlDocumentCache
+    ) -> Workspace | None:
+        """Load the workspace declared in ``root``, or None if there is none."""
+        pyproject_path = root / "pyproject.toml"
+        declarations = read_declarations(pyproject_path, document_cache)
+        if not declarations:
+            return None
+
+        members = set(_expand_members(root, declarations))
+        # the root is a member when it is also a project
+        if _types.is_toml_table(document_cache.load_table(pyproject_path, "project")):
+            members.add(root)
+        return cls(root, declarations, tuple(sorted(members)))
+
+
+def read_declarations(
+    pyproject_path: pathlib.Path, document_cache: _cached_toml.TomlDocumentCache
+) -> tuple[WorkspaceDeclaration, ...]:
+    declarations = []
+
+    uv_workspace = document_cache.load_table(pyproject_path, "tool", "uv", "workspace")
+    if _types.is_toml_table(uv_workspace):
+        declarations.append(
+            WorkspaceDeclaration(
+                "uv",
+                _strings(uv_workspace.get("members")),
+                _strings(uv_workspace.get("exclude")),
+            )
+        )
+
+    hatch_envs = document_cache.load_table(pyproject_path, "tool", "hatch", "envs")
+    if _types.is_toml_table(hatch_envs):
+        for env in hatch_envs.values():
+            if not _types.is_toml_table(env):
+                continue
+            hatch_workspace = env.get("workspace")
+            if not _types.is_toml_table(hatch_workspace):
+                continue
+            # hatch members may also be tables, like `{path = "...", features = []}`
+            members = [
+                member.get("path") if _types.is_toml_table(member) else member
+                for member in _list(hatch_workspace.get("members"))
+            ]
+            declarations.append(
+                WorkspaceDeclaration(
+                    "hatch",
+                    _strings(members),
+                    _strings(hatch_workspace.get("exclude")),
+                )
+            )
+
+    return tuple(declarations)
+
+
+def _expand_members(
+    root: pathlib.Path, declarations: t.Iterable[WorkspaceDeclaration]
+) -> t.Iterator[pathlib.Path]:
+    for declaration in declarations:
+        excluded = {
+            path for pattern in declaration.exclude for path in _glob(root, pattern)
+        }
+        for pattern in declaration.members:
+            for path in _glob(root, pattern):
+                if path not in excluded and (path / "pyproject.toml").is_file():
+                    yield path
+
+
+def _glob(root: pathlib.Path, pattern: str) -> t.Iterator[pathlib.Path]:
+    # only the directories which match each part of the pattern are listed
+    for match in glob.glob(pattern, root_dir=root, recursive=True):
+        yield pathlib.Path(os.path.normpath(root / match))
+
+
+def _list(value: t.Any) -> list[t.Any]:
+    return value if _types.is_toml_array(value) else []
+
+
+def _strings(value: t.Any) -> tuple[str, ...]:
+    return tuple(item for item in _list(value) if isinstance(item, str))
@@ -99,9 +99,7 @@ def write_toml_value(
         else:
             write_value = tomlkit.string(value)
 
-        # mypy flags this, but we've validated the key type against the container type
-        # above -- the narrowed type info is simply not retained
-        write_container[key] = write_value  # type: ignore[index]
+        write_container[key] = write_value
         with path.open("w", encoding="utf-8") as write_file_descriptor:
             tomlkit.dump(doc, write_file_descriptor)
         return old_value.value
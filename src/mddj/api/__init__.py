@@ -1,7 +1,59 @@
-from ._config import DJConfig
-from ._dj import DJ
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from ._async import AsyncDJ, MetadataBuildError
+    from ._batch import ReadResult, read_many, read_stream
+    from ._cache import CacheInfo, CacheManager, CacheStats
+    from ._config import DJConfig
+    from ._dj import DJ
+    from ._walk import walk_projects
+    from ._workspace import Workspace
+    from .reader._snapshot import FIELDS
 
 __all__ = (
+    "AsyncDJ",
+    "FIELDS",
+    "CacheInfo",
+    "CacheManager",
+    "CacheStats",
     "DJConfig",
     "DJ",
+    "MetadataBuildError",
+    "ReadResult",
+    "read_many",
+    "read_stream",
+    "walk_projects",
+    "Workspace",
 )
+
+# the module which defines each name, which is only imported when the name is used
+_LAZY_EXPORTS = {
+    "AsyncDJ": "._async",
+    "MetadataBuildError": "._async",
+    "ReadResult": "._batch",
+    "read_many": "._batch",
+    "read_stream": "._batch",
+    "CacheInfo": "._cache",
+    "CacheManager": "._cache",
+    "CacheStats": "._cache",
+    "DJConfig": "._config",
+    "DJ": "._dj",
+    "walk_projects": "._walk",
+    "Workspace": "._workspace",
+    "FIELDS": ".reader._snapshot",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted((*globals(), *__all__))
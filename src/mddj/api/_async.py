@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import pathlib
+import signal
+import tempfile
+import types
+import typing as t
+
+from .._internal import _metadata_worker
+from ._config import DJConfig
+from ._dj import DJ
+from .reader import Reader, _errors
+
+_T = t.TypeVar("_T")
+
+
+class MetadataBuildError(RuntimeError):
+    """Raised by an ``AsyncDJ`` when a build of package metadata fails."""
+
+
+class AsyncDJ:
+    """
+    An AsyncDJ provides the reading capabilities of a DJ to ``asyncio`` code.
+
+    Reads which need a build run the build in a subprocess, which is killed if the
+    read is cancelled or times out. Other reads, including those of ``tox`` data,
+    run in the event loop's default executor, one at a time for each AsyncDJ.
+
+    Concurrent reads of the same field share one read, and every field which needs
+    a build shares one build.
+
+    .. code-block:: python
+
+        async def handle(project_dir):
+            dj = AsyncDJ(DJConfig(discovery_start_dir=project_dir), build_timeout=60)
+            return await dj.read.version()
+    """
+
+    def __init__(
+        self, config: DJConfig | None = None, *, build_timeout: float | None = None
+    ) -> None:
+        self.config = config or DJConfig()
+        #: The maximum time, in seconds, for a build, after which reads which need it
+        #: raise ``TimeoutError``. Defaults to None, meaning no limit.
+        self.build_timeout = build_timeout
+        self._dj = DJ(self.config)
+
+    @functools.cached_property
+    def read(self) -> AsyncReader:
+        """An AsyncReader configured via this AsyncDJ."""
+        return AsyncReader(
+            self._dj._make_reader(allow_builds=False), build_timeout=self.build_timeout
+        )
+
+
+class _SharedTask(t.Generic[_T]):
+    """
+    A task which is shared by concurrent awaiters, and cancelled only when all of
+    them have been cancelled. Results are kept, but a failed or cancelled task is
+    started again by the next awaiter.
+    """
+
+    def __init__(self, factory: t.Callable[[], t.Awaitable[_T]]) -> None:
+        self._factory = factory
+        self._task: asyncio.Future[_T] | None = None
+        self._waiters = 0
+
+    async def get(self) -> _T:
+        task = self._task
+        if task is None or (
+            task.done() and (task.cancelled() or task.exception() is not None)
+        ):
+            task = self._task = asyncio.ensure_future(self._factory())
+
+        self._waiters += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters == 1:
+                task.cancel()
+            raise
+        finally:
+            self._waiters -= 1
+
+
+class AsyncReader:
+    """
+    An AsyncReader provides the fields of a :class:`Reader` as coroutines.
+
+    Construction is private.
+    Users should create an AsyncDJ and then access the reader built by it.
+    """
+
+    def __init__(self, reader: Reader, *, build_timeout: float | None) -> None:
+        self._reader = reader
+        self._build_timeout = build_timeout
+        # sync reads are not thread-safe, so they run one at a time
+        self._lock = asyncio.Lock()
+        self._reads: dict[tuple[t.Any, ...], _SharedTask[t.Any]] = {}
+        self._build = _SharedTask(self._run_build)
+
+    async def authors(self) -> tuple[types.MappingProxyType[str, str], ...]:
+        return await self._read("authors")  # type: ignore[no-any-return]
+
+    async def classifiers(self, *, python_versions: bool = False) -> tuple[str, ...]:
+        return await self._read(  # type: ignore[no-any-return]
+            "classifiers", python_versions=python_versions
+        )
+
+    async def dependencies(self) -> tuple[str, ...]:
+        return await self._read("dependencies")  # type: ignore[no-any-return]
+
+    async def description(self) -> str | None:
+        return await self._read("description")  # type: ignore[no-any-return]
+
+    async def import_names(self) -> tuple[str, ...]:
+        return await self._read("import_names")  # type: ignore[no-any-return]
+
+    async def import_namespaces(self) -> tuple[str, ...]:
+        return await self._read("import_namespaces")  # type: ignore[no-any-return]
+
+    async def keywords(self) -> tuple[str, ...]:
+        return await self._read("keywords")  # type: ignore[no-any-return]
+
+    async def maintainers(self) -> tuple[types.MappingProxyType[str, str], ...]:
+        return await self._read("maintainers")  # type: ignore[no-any-return]
+
+    async def name(self) -> str:
+        return await self._read("name")  # type: ignore[no-any-return]
+
+    async def optional_dependencies(
+        self, *, exact_wheel_metadata: bool = False
+    ) -> types.MappingProxyType[str, tuple[str, ...]]:
+        return await self._read(  # type: ignore[no-any-return]
+            "optional_dependencies", exact_wheel_metadata=exact_wheel_metadata
+        )
+
+    async def requires_python(self, *, lower_bound: bool = False) -> str | None:
+        return await self._read(  # type: ignore[no-any-return]
+            "requires_python", lower_bound=lower_bound
+        )
+
+    async def version(self) -> str:
+        return await self._read("version")  # type: ignore[no-any-return]
+
+    async def tox_list_python_versions(self) -> tuple[str, ...]:
+        """Read ``tox.list_python_versions()``, which runs ``tox``."""
+        return await self._read("tox.list_python_versions")  # type: ignore[no-any-return]  # noqa: E501
+
+    async def tox_min_python_version(self) -> str:
+        """Read ``tox.min_python_version()``, which runs ``tox``."""
+        return await self._read("tox.min_python_version")  # type: ignore[no-any-return]  # noqa: E501
+
+    async def _read(self, method: str, **kwargs: t.Any) -> t.Any:
+        key = (method, *sorted(kwargs.items()))
+        if key not in self._reads:
+            self._reads[key] = _SharedTask(
+                functools.partial(self._read_with_build, method, kwargs)
+            )
+        return await self._reads[key].get()
+
+    async def _read_with_build(self, method: str, kwargs: dict[str, t.Any]) -> t.Any:
+        target: t.Any = self._reader
+        for name in method.split("."):
+            target = getattr(target, name)
+        try:
+            return await self._run_sync(functools.partial(target, **kwargs))
+        except _errors.BuildRequired:
+            await self._build.get()
+        return await self._run_sync(functools.partial(target, **kwargs))
+
+    async def _run_sync(self, func: t.Callable[[], _T]) -> _T:
+        await self._lock.acquire()
+        future = asyncio.get_running_loop().run_in_executor(None, func)
+        # the thread can't be interrupted, so the lock is held until it finishes,
+        # even if the caller is cancelled
+        future.add_done_callback(lambda _: self._lock.release())
+        return await asyncio.shield(future)
+
+    async def _run_build(self) -> None:
+        arguments = await self._run_sync(self._reader.dynamic._build_arguments)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = pathlib.Path(temp_dir) / "METADATA"
+            quiet = arguments["quiet"]
+            process = await asyncio.create_subprocess_exec(
+                *_metadata_worker.command(output, **arguments),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL if quiet else None,
+                stderr=asyncio.subprocess.PIPE if quiet else None,
+                # a session of its own, so that the backend's processes can be killed
+                start_new_session=True,
+            )
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(), self._build_timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"The metadata build did not finish in {self._build_timeout}s."
+                ) from None
+            finally:
+                if process.returncode is None:
+                    _kill(process)
+                    # drain the pipes as well, so that their transports are closed
+                    await process.communicate()
+
+            if process.returncode != 0:
+                message = (stderr or b"").decode(errors="replace").strip()
+                last_line = message.splitlines()[-1] if message else ""
+                raise MetadataBuildError(
+                    f"The metadata build failed. {last_line}".strip()
+                )
+            text = output.read_text(encoding="utf-8")
+
+        await self._run_sync(
+            functools.partial(self._reader.dynamic._use_metadata_text, text)
+        )
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import dataclasses
+import os
+import pathlib
+import pickle
+import types
+import typing as t
+
+from ._config import DJConfig
+from ._dj import DJ
+from .reader import _errors
+from .reader._snapshot import DEFAULT_FIELDS, FIELDS, check_fields
+
+
+@dataclasses.dataclass(frozen=True)
+class ReadResult:
+    """The fields read from one project by ``read_many`` or ``read_stream``."""
+
+    #: The path which was read, as it was passed in.
+    path: pathlib.Path
+    #: The value of each field which was read successfully, as it would be returned
+    #: by the method of the same name on ``DJ.read``.
+    values: types.MappingProxyType[str, t.Any]
+    #: The error raised when reading each field which failed.
+    errors: types.MappingProxyType[str, BaseException]
+    #: Whether or not a build was used to read any of the fields.
+    built: bool
+    #: The tag of the request, if it was given one (see ``read_stream``).
+    tag: t.Any = None
+
+
+def read_many(
+    paths: t.Iterable[pathlib.Path],
+    fields: t.Iterable[str] = DEFAULT_FIELDS,
+    *,
+    workers: int | None = None,
+    config: DJConfig | None = None,
+) -> t.Iterator[ReadResult]:
+    """
+    Read metadata fields from many projects, yielding a result for each project as
+    it completes.
+
+    Fields which can be read without a build are read in the calling process.
+    Projects which need a build are read by a process pool, so that builds run in
+    parallel, and their results are yielded as the builds complete. At most
+    ``2 * workers`` builds are pending at once, so that ``paths`` is consumed no
+    faster than the builds can keep up with.
+
+    An error reading a field is recorded in the project's result and does not stop
+    the batch. If a build fails, every field which needed it has the build error.
+
+    .. code-block:: python
+
+        for result in read_many(walk_projects(pathlib.Path.cwd()), workers=4):
+            print(result.path, result.values.get("version"), dict(result.errors))
+
+    :param paths: The directories of the projects, each of which is used as the
+        ``discovery_start_dir`` of a DJ.
+    :param fields: The fields to read, from ``mddj.api.FIELDS``. Defaults to
+        ``name``, ``version``, ``requires-python``, and ``dependencies``.
+    :param workers: The maximum number of processes used for builds. Defaults to
+        the number of CPUs.
+    :param config: A template for the configuration of each DJ. Its
+        ``discovery_start_dir`` is replaced with each path.
+    :raises ValueError: if any of the fields are not supported
+    """
+    fields = check_fields(fields, caller="read_many")
+    config = config or DJConfig()
+    # builds which are in progress, or complete but not yet yielded
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+
+    # for each build, the path, the fields which need the build, and the results
+    # of reading without builds
+    pending: dict[
+        concurrent.futures.Future[_FieldResults],
+        tuple[pathlib.Path, tuple[str, ...], _FieldResults],
+    ] = {}
+
+    def _pop_completed(*, wait: bool) -> t.Iterator[ReadResult]:
+        done, _ = concurrent.futures.wait(
+            pending,
+            timeout=None if wait else 0,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            path, needs_build, (values, errors) = pending.pop(future)
+            try:
+                build_values, build_errors = future.result()
+            except Exception as e:
+                # the worker failed, or its results could not be sent back
+                build_values = {}
+                build_errors = {field: e for field in needs_build}
+            yield _make_result(
+                path,
+                fields,
+                {**values, **_unpack(build_values)},
+                {**errors, **build_errors},
+                built=True,
+            )
+
+    executor: concurrent.futures.ProcessPoolExecutor | None = None
+    try:
+        for path in paths:
+            project_config = dataclasses.replace(config, discovery_start_dir=path)
+            reader = DJ(project_config)._make_reader(allow_builds=False)
+            values, errors = _read_fields(reader, fields)
+            needs_build = tuple(
+                field
+                for field, error in errors.items()
+                if isinstance(error, _errors.BuildRequired)
+            )
+            if needs_build:
+                for field in needs_build:
+                    del errors[field]
+                if executor is None:
+                    executor = concurrent.futures.ProcessPoolExecutor(workers)
+                future = executor.submit(_read_with_builds, project_config, needs_build)
+                pending[future] = (path, needs_build, (values, errors))
+            else:
+                yield _make_result(path, fields, values, errors, built=False)
+            yield from _pop_completed(wait=len(pending) >= max_pending)
+        while pending:
+            yield from _pop_completed(wait=True)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def read_stream(
+    requests: t.Iterable[
+        tuple[pathlib.Path, t.Iterable[str]]
+        | tuple[pathlib.Path, t.Iterable[str], t.Any]
+    ],
+    *,
+    workers: int | None = None,
+    ordered: bool = True,
+    config: DJConfig | None = None,
+) -> t.Iterator[ReadResult]:
+    """
+    Read the fields requested for each project in a stream of requests, with up to
+    ``workers`` projects read at once by a thread pool.
+
+    Requests are consumed as they are needed, so ``requests`` may be a long-running
+    or unbounded iterator, and results are yielded as soon as they are available.
+    Projects share the process-wide document cache, which re-parses files when they
+    change (as with ``DJConfig.share_document_cache``), and one discovery cache,
+    in which each directory is listed once for the life of the stream.
+
+    As with ``read_many``, an error reading a field is recorded in the project's
+    result and does not stop the stream. Unsupported fields are recorded as a
+    ValueError.
+
+    .. code-block:: python
+
+        requests = [(path, ["name", "version"]) for path in walk_projects(root)]
+        for result in read_stream(requests, workers=8, ordered=False):
+            print(result.path, dict(result.values))
+
+    :param requests: Pairs of the directory of a project, which is used as the
+        ``discovery_start_dir`` of a DJ, and the fields to read from it. A request
+        may have a third item, a tag of any type, which is set as the ``tag`` of its
+        result, so that results can be matched to requests.
+    :param workers: The maximum number of projects read at once. Defaults to the
+        number of CPUs.
+    :param ordered: Whether results are yielded in the order of the requests. If
+        False, they are yielded in the order in which they complete.
+    :param config: A template for the configuration of each DJ. Its
+        ``discovery_start_dir`` is replaced with each path.
+    """
+    root = DJ(dataclasses.replace(config or DJConfig(), share_document_cache=True))
+    workers = workers or os.cpu_count() or 1
+    # reads which are in progress, or complete but not yet yielded
+    max_pending = 2 * workers
+    pending: collections.deque[concurrent.futures.Future[ReadResult]] = (
+        collections.deque()
+    )
+
+    def _pop_completed(*, wait: bool) -> t.Iterator[ReadResult]:
+        if ordered:
+            while pending and (wait or pending[0].done()):
+                yield pending.popleft().result()
+                wait = False
+            return
+        done, _ = concurrent.futures.wait(
+            pending,
+            timeout=None if wait else 0,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in [f for f in pending if f in done]:
+            pending.remove(future)
+            yield future.result()
+
+    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    try:
+        for path, fields, *tag in requests:
+            # DJs are created here, so that the shared caches are created only once
+            dj = root._with_start_dir(path.absolute())
+            pending.append(
+                executor.submit(
+                    _read_request, dj, path, tuple(fields), tag[0] if tag else None
+                )
+            )
+            yield from _pop_completed(wait=len(pending) >= max_pending)
+        while pending:
+            yield from _pop_completed(wait=True)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _read_request(
+    dj: DJ, path: pathlib.Path, fields: tuple[str, ...], tag: t.Any
+) -> ReadResult:
+    fields = tuple(dict.fromkeys(fields))
+    reader = dj.read
+    values, errors = _read_fields(reader, tuple(f for f in fields if f in FIELDS))
+    for field in fields:
+        if field not in FIELDS:
+            errors[field] = ValueError(f"Unsupported field: {field}")
+
+    # the dynamic reader is only created when a field falls back to it, and it
+    # stores the built metadata when it is first used
+    dynamic = reader.__dict__.get("dynamic")
+    built = dynamic is not None and "_wheel_package_metadata" in dynamic.__dict__
+    return _make_result(path, fields, values, errors, built=built, tag=tag)
+
+
+_FieldResults = tuple[dict[str, t.Any], dict[str, BaseException]]
+
+
+def _read_fields(reader: t.Any, fields: tuple[str, ...]) -> _FieldResults:
+    values: dict[str, t.Any] = {}
+    errors: dict[str, BaseException] = {}
+    for field in fields:
+        try:
+            values[field] = getattr(reader, field.replace("-", "_"))()
+        except Exception as e:
+            errors[field] = e
+    return values, errors
+
+
+def _read_with_builds(config: DJConfig, fields: tuple[str, ...]) -> _FieldResults:
+    """Read fields with builds allowed, in a worker process."""
+    values, errors = _read_fields(DJ(config).read, fields)
+    # mapping proxies can't be sent between processes
+    return _pack(values), {
+        field: _portable_error(error) for field, error in errors.items()
+    }
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """
+    Get an error which can be sent to the parent process.
+
+    Some errors (like those of ``build``) can be pickled but not unpickled, which
+    would break the process pool. These are replaced with a RuntimeError.
+    """
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(
+            f"{type(error).__module__}.{type(error).__qualname__}: {error}"
+        )
+    return error
+
+
+def _pack(values: dict[str, t.Any]) -> dict[str, t.Any]:
+    packed = {}
+    for field, value in values.items():
+        if isinstance(value, types.MappingProxyType):
+            value = dict(value)
+        elif isinstance(value, tuple) and value and isinstance(value[0], t.Mapping):
+            value = tuple(dict(item) for item in value)
+        packed[field] = value
+    return packed
+
+
+def _unpack(values: dict[str, t.Any]) -> dict[str, t.Any]:
+    unpacked = {}
+    for field, value in values.items():
+        if isinstance(value, dict):
+            value = types.MappingProxyType(value)
+        elif isinstance(value, tuple) and value and isinstance(value[0], dict):
+            value = tuple(types.MappingProxyType(item) for item in value)
+        unpacked[field] = value
+    return unpacked
+
+
+def _make_result(
+    path: pathlib.Path,
+    fields: tuple[str, ...],
+    values: dict[str, t.Any],
+    errors: dict[str, BaseException],
+    *,
+    built: bool,
+    tag: t.Any = None,
+) -> ReadResult:
+    # present the fields in the order in which they were requested
+    return ReadResult(
+        path=path,
+        values=types.MappingProxyType({f: values[f] for f in fields if f in values}),
+        errors=types.MappingProxyType({f: errors[f] for f in fields if f in errors}),
+        built=built,
+        tag=tag,
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import pathlib
+import time
+import typing as t
+
+from .._internal import _build_envs, _metadata_cache
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheInfo:
+    """A summary of the contents of one of the persistent caches."""
+
+    #: The name of the cache, either ``"metadata"`` or ``"build-envs"``.
+    name: str
+    #: The location of the cache on disk.
+    path: pathlib.Path
+    #: The number of entries in the cache.
+    entries: int
+    #: The total size of the cache entries, in bytes.
+    size: int
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    """Statistics for one of the in-memory caches, as returned by ``DJ.stats()``."""
+
+    #: The name of the cache, which is the qualified name of the cached method or
+    #: property, like ``"StaticPyprojectReader.version"``.
+    name: str
+    #: The number of lookups which found a cached value.
+    hits: int
+    #: The number of lookups which computed a value.
+    misses: int
+    #: The total time spent computing values, in seconds. This includes the time
+    #: of misses in other caches which were needed to compute each value.
+    compute_time: float
+
+
+class CacheManager:
+    """
+    A CacheManager provides inspection and maintenance for mddj's persistent caches,
+    which are stored under ``DJConfig.cache_dir``.
+
+    There are two caches: ``"metadata"`` holds metadata produced by builds, and
+    ``"build-envs"`` holds reusable isolated build environments.
+
+    Construction is private.
+    Users should create a DJ and then access the manager built by it, as in:
+
+    .. code-block:: pycon
+
+        >>> from mddj.api import DJ
+        >>> dj = DJ()
+        >>> [(info.name, info.entries) for info in dj.cache.info()]
+        [('metadata', 3), ('build-envs', 1)]
+    """
+
+    def __init__(self, cache_dir: pathlib.Path) -> None:
+        self._metadata_cache = _metadata_cache.MetadataCache(cache_dir)
+        self._build_env_pool = _build_envs.BuildEnvPool(cache_dir)
+
+    def info(self) -> tuple[CacheInfo, ...]:
+        """Summarize the contents of each cache."""
+        return (
+            self._summarize_metadata(self._metadata_cache.entries()),
+            self._summarize_build_envs(self._build_env_pool.entries()),
+        )
+
+    def prune(
+        self,
+        *,
+        max_age: float | None = _metadata_cache.DEFAULT_MAX_AGE,
+        max_size: int | None = _metadata_cache.DEFAULT_MAX_SIZE,
+    ) -> tuple[CacheInfo, ...]:
+        """
+        Evict entries unused for longer than ``max_age`` seconds.
+        Then, evict the least recently used metadata entries until the metadata
+        cache is no larger than ``max_size`` bytes.
+
+        Build environments which are in use by another process are not evicted.
+
+        Returns a summary of the evicted entries.
+        """
+        # environment sizes must be measured before they are deleted
+        env_sizes = {
+            entry.path: _tree_size(entry.path)
+            for entry in self._build_env_pool.entries()
+            if max_age is None or entry.last_used < time.time() - max_age
+        }
+        evicted_envs = self._build_env_pool.prune(max_age=max_age)
+
+        return (
+            self._summarize_metadata(
+                self._metadata_cache.prune(max_age=max_age, max_size=max_size)
+            ),
+            CacheInfo(
+                "build-envs",
+                self._build_env_pool.envs_dir,
+                len(evicted_envs),
+                sum(env_sizes.get(entry.path, 0) for entry in evicted_envs),
+            ),
+        )
+
+    def clear(self) -> tuple[CacheInfo, ...]:
+        """
+        Remove all cache entries, except for build environments which are in use.
+
+        Returns a summary of the removed entries.
+        """
+        return self.prune(max_age=0, max_size=0)
+
+    def _summarize_metadata(
+        self, entries: t.Iterable[_metadata_cache.CacheEntry]
+    ) -> CacheInfo:
+        count, size = _metadata_cache.summarize(entries)
+        return CacheInfo("metadata", self._metadata_cache.entries_dir, count, size)
+
+    def _summarize_build_envs(
+        self, entries: t.Iterable[_build_envs.PoolEntry]
+    ) -> CacheInfo:
+        count, size = 0, 0
+        for entry in entries:
+            count += 1
+            size += _tree_size(entry.path)
+        return CacheInfo("build-envs", self._build_env_pool.envs_dir, count, size)
+
+
+def _tree_size(path: pathlib.Path) -> int:
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                pass
+    return size
@@ -5,6 +5,8 @@ import os
 import pathlib
 import typing as t
 
+from .._internal import _cache_dir
+
 
 def _bool_env_var_default_factory(varname: str, default: bool) -> t.Callable[[], bool]:
     def factory() -> bool:
@@ -15,6 +17,16 @@ def _bool_env_var_default_factory(varname: str, default: bool) -> t.Callable[[],
     return factory
 
 
+def _path_list_env_var_default_factory(
+    varname: str,
+) -> t.Callable[[], tuple[pathlib.Path, ...]]:
+    def factory() -> tuple[pathlib.Path, ...]:
+        value = os.environ.get(varname, "")
+        return tuple(pathlib.Path(p) for p in value.split(os.pathsep) if p)
+
+    return factory
+
+
 @dataclasses.dataclass
 class DJConfig:
     """
@@ -24,12 +36,36 @@ class DJConfig:
 
     - ``isolated_builds``: ``MDDJ_ISOLATED_BUILDS``
     - ``capture_build_output``: ``MDDJ_CAPTURE_BUILD_OUTPUT``
+    - ``cache_dir``: ``MDDJ_CACHE_DIR``
+    - ``cache_metadata``: ``MDDJ_CACHE_METADATA``
+    - ``pool_build_envs``: ``MDDJ_POOL_BUILD_ENVS``
+    - ``trust_project_dynamic``: ``MDDJ_TRUST_PROJECT_DYNAMIC``
+    - ``share_document_cache``: ``MDDJ_SHARE_DOCUMENT_CACHE``
+    - ``verify_document_hashes``: ``MDDJ_VERIFY_DOCUMENT_HASHES``
+    - ``probe_discovery``: ``MDDJ_PROBE_DISCOVERY``
+    - ``ceiling_directories``: ``MDDJ_CEILING_DIRECTORIES``
+    - ``collect_stats``: ``MDDJ_COLLECT_STATS``
     """
 
     #: The starting directory for discovery. Defaults to cwd.
     discovery_start_dir: pathlib.Path = dataclasses.field(
         default_factory=pathlib.Path.cwd
     )
+    #: Whether or not discovery should check each directory for the specific files
+    #: which it looks for, rather than listing the directory. This is faster on slow
+    #: or network filesystems, and for directories with many entries.
+    #: Defaults to False.
+    probe_discovery: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory("MDDJ_PROBE_DISCOVERY", False)
+    )
+    #: Directories which discovery will not move up into when searching upwards from
+    #: ``discovery_start_dir``, like ``GIT_CEILING_DIRECTORIES``.
+    #: The environment variable is a list of absolute paths, separated by
+    #: ``os.pathsep``. Relative paths are ignored.
+    #: Defaults to no directories.
+    ceiling_directories: tuple[pathlib.Path, ...] = dataclasses.field(
+        default_factory=_path_list_env_var_default_factory("MDDJ_CEILING_DIRECTORIES")
+    )
     #: Whether or not to use isolated builds when getting metadata from build backends.
     #: Defaults to True.
     isolated_builds: bool = dataclasses.field(
@@ -40,3 +76,56 @@ class DJConfig:
     capture_build_output: bool = dataclasses.field(
         default_factory=_bool_env_var_default_factory("MDDJ_CAPTURE_BUILD_OUTPUT", True)
     )
+    #: Whether or not to trust ``project.dynamic`` in ``pyproject.toml`` to list
+    #: every field which a build can provide. When True, fields which are neither
+    #: set nor listed as dynamic are read as empty, without running a build.
+    #: Disable this for projects which use a ``[project]`` table but don't follow
+    #: the ``pyproject.toml`` specification's rules for ``dynamic``.
+    #: Defaults to True.
+    trust_project_dynamic: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory(
+            "MDDJ_TRUST_PROJECT_DYNAMIC", True
+        )
+    )
+    #: The directory used for persistent caches, shared between processes.
+    #: Defaults to the platform's user cache location.
+    cache_dir: pathlib.Path = dataclasses.field(
+        default_factory=_cache_dir.default_cache_dir
+    )
+    #: Whether or not to store metadata from builds in ``cache_dir`` and reuse it
+    #: when the project's build inputs have not changed.
+    #: Defaults to False.
+    cache_metadata: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory("MDDJ_CACHE_METADATA", False)
+    )
+    #: Whether or not to keep isolated build environments in ``cache_dir`` and
+    #: reuse them for later builds with the same ``build-system.requires``.
+    #: Defaults to False.
+    pool_build_envs: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory("MDDJ_POOL_BUILD_ENVS", False)
+    )
+    #: Whether or not to use a process-wide cache of parsed TOML files, shared by
+    #: every DJ which enables it. Files are checked for changes (by mtime, size,
+    #: and inode) whenever they are read, and only changed files are re-parsed.
+    #: Defaults to False, in which case each DJ has its own cache.
+    share_document_cache: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory(
+            "MDDJ_SHARE_DOCUMENT_CACHE", False
+        )
+    )
+    #: Whether or not the shared document cache should also compare the SHA-256
+    #: digests of files, to detect changes which keep the same mtime and size.
+    #: Has no effect unless ``share_document_cache`` is enabled.
+    #: Defaults to False.
+    verify_document_hashes: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory(
+            "MDDJ_VERIFY_DOCUMENT_HASHES", False
+        )
+    )
+    #: Whether or not to collect statistics for the in-memory caches, which are
+    #: returned by ``DJ.stats()``. Collection is process-wide, and continues for
+    #: the rest of the process once any DJ enables it.
+    #: Defaults to False.
+    collect_stats: bool = dataclasses.field(
+        default_factory=_bool_env_var_default_factory("MDDJ_COLLECT_STATS", False)
+    )
@@ -0,0 +1,179 @@
+"""
+A JSON protocol for reading metadata through a ``mddj serve`` daemon, and the
+client for it.
+
+Each message is one line of JSON. A request names a method of ``DJ.read``, as a
+list of attribute names, along with its arguments and the directory to read in:
+
+.. code-block:: json
+
+    {"cwd": "/src/foo", "method": ["tox", "min_python_version"], "args": [],
+     "kwargs": {}}
+
+A response holds the result of the call, or the type and message of the error
+which it raised. A ``Snapshot`` is sent as the mapping from its fields to their
+values:
+
+.. code-block:: json
+
+    {"result": "3.10"}
+    {"snapshot": {"name": "foo", "version": "1.0"}}
+    {"error": {"type": "builtins.LookupError", "message": "No tox config found"}}
+
+Tuples are sent as arrays and mappings as objects. Clients restore them, so
+results have the same types as those of a local reader.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import os
+import pathlib
+import socket
+import types
+import typing as t
+
+from .reader._snapshot import Snapshot
+
+#: The largest message which is accepted, in bytes.
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+class DaemonError(RuntimeError):
+    """An error from the daemon which can't be raised as its original type."""
+
+
+def encode_result(value: t.Any) -> bytes:
+    if isinstance(value, Snapshot):
+        return _encode({"snapshot": value.as_dict()})
+    return _encode({"result": value})
+
+
+def encode_error(error: BaseException) -> bytes:
+    error_type = f"{type(error).__module__}.{type(error).__qualname__}"
+    return _encode({"error": {"type": error_type, "message": str(error)}})
+
+
+def decode_response(line: bytes) -> t.Any:
+    """Get the result from a response, or raise the error which it holds."""
+    response = json.loads(line)
+    if "error" in response:
+        raise _decode_error(response["error"])
+    if "snapshot" in response:
+        values = response["snapshot"]
+        return Snapshot(
+            fields=tuple(values),
+            **{
+                field.replace("-", "_"): _restore(value)
+                for field, value in values.items()
+            },
+        )
+    return _restore(response["result"])
+
+
+class DaemonClient:
+    """A connection to a daemon, which sends requests one at a time."""
+
+    def __init__(self, socket_path: pathlib.Path) -> None:
+        self.socket_path = socket_path
+        self._socket: socket.socket | None = None
+        self._reader: io.BufferedReader | None = None
+
+    def connect(self) -> bool:
+        """Connect to the daemon, returning False if none is listening."""
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(os.fspath(self.socket_path))
+        except OSError:
+            sock.close()
+            return False
+        self._socket = sock
+        self._reader = sock.makefile("rb")
+        return True
+
+    def call(
+        self,
+        cwd: pathlib.Path,
+        method: tuple[str, ...],
+        args: tuple[t.Any, ...] = (),
+        kwargs: dict[str, t.Any] | None = None,
+    ) -> t.Any:
+        if self._socket is None or self._reader is None:
+            raise DaemonError("The client is not connected.")
+        request = {
+            "cwd": os.fspath(cwd),
+            "method": list(method),
+            "args": list(args),
+            "kwargs": kwargs or {},
+        }
+        self._socket.sendall(_encode(request))
+        line = self._reader.readline(MAX_MESSAGE_SIZE)
+        if not line.endswith(b"\n"):
+            raise DaemonError("The daemon closed the connection.")
+        return decode_response(line)
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._socket is not None:
+            self._socket.close()
+        self._reader = None
+        self._socket = None
+
+
+class RemoteReader:
+    """
+    A stand-in for ``DJ.read`` which forwards each call to a daemon.
+
+    Attribute access builds up the name of a method, as in
+    ``RemoteReader(...).tox.min_python_version()``.
+    """
+
+    def __init__(
+        self, client: DaemonClient, cwd: pathlib.Path, method: tuple[str, ...] = ()
+    ) -> None:
+        self._client = client
+        self._cwd = cwd
+        self._method = method
+
+    def __getattr__(self, name: str) -> RemoteReader:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return RemoteReader(self._client, self._cwd, (*self._method, name))
+
+    def __call__(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        return self._client.call(self._cwd, self._method, args, kwargs)
+
+
+def _encode(message: dict[str, t.Any]) -> bytes:
+    # mapping proxies are encoded as objects
+    return json.dumps(message, default=dict).encode("utf-8") + b"\n"
+
+
+def _restore(value: t.Any) -> t.Any:
+    if isinstance(value, list):
+        return tuple(_restore(item) for item in value)
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: _restore(v) for k, v in value.items()})
+    return value
+
+
+def _decode_error(error: dict[str, str]) -> Exception:
+    # only builtin and mddj errors are re-created, since others may not be
+    # importable by the client
+    module_name, _, name = error["type"].rpartition(".")
+    if module_name == "builtins" or module_name.startswith("mddj."):
+        try:
+            error_class = getattr(importlib.import_module(module_name), name)
+        except (ImportError, AttributeError):
+            error_class = None
+        if isinstance(error_class, type) and issubclass(error_class, Exception):
+            try:
+                return error_class(error["message"])
+            except Exception:
+                pass
+    return DaemonError(f"{error['type']}: {error['message']}")
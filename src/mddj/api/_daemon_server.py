@@ -0,0 +1,160 @@
+"""
+The ``mddj serve`` daemon, which reads metadata for clients over a Unix socket.
+
+Each request is read by a new ``DJ``, so that discovery and static reads always
+see the current files. The DJs share the process-wide document cache, which
+re-parses only the files which have changed (by mtime, size, and inode).
+
+Build results are only kept when ``cache_metadata`` is set, in memory in front of
+the persistent metadata cache. Their keys only cover the project's config files
+and VCS state, so they are subject to the same opt-in as the persistent cache.
+
+Clients are handled concurrently, by a thread for each connection. The daemon
+exits once it has had no connections for ``idle_timeout`` seconds.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import pathlib
+import socketserver
+import stat
+import threading
+import time
+import typing as t
+
+from .._internal import _metadata_cache
+from . import _daemon
+from ._config import DJConfig
+from ._dj import DJ
+
+
+def serve(socket_path: pathlib.Path, *, config: DJConfig, idle_timeout: float) -> None:
+    """
+    Serve requests on a socket until the daemon is idle.
+
+    :raises FileExistsError: if a daemon is already listening on the socket, or
+        the path exists and is not a socket
+    """
+    _remove_stale_socket(socket_path)
+    with DaemonServer(socket_path, config=config, idle_timeout=idle_timeout) as server:
+        try:
+            server.serve_until_idle()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    # wait for requests in progress when the server is closed
+    daemon_threads = False
+    block_on_close = True
+
+    def __init__(
+        self, socket_path: pathlib.Path, *, config: DJConfig, idle_timeout: float
+    ) -> None:
+        self.config = dataclasses.replace(config, share_document_cache=True)
+        self.idle_timeout = idle_timeout
+        self.metadata_cache = (
+            _metadata_cache.MemoryMetadataCache(config.cache_dir, persistent=True)
+            if config.cache_metadata
+            else None
+        )
+
+        self._lock = threading.Lock()
+        self._connections = 0
+        self._last_active = time.monotonic()
+
+        # only the owner may connect, since requests can run builds
+        umask = os.umask(0o177)
+        try:
+            super().__init__(os.fspath(socket_path), _RequestHandler)
+        finally:
+            os.umask(umask)
+        # how often to check whether or not the daemon is idle
+        self.timeout = min(idle_timeout, 1.0)
+
+    def serve_until_idle(self) -> None:
+        while not self._is_idle():
+            self.handle_request()
+
+    def respond(self, line: bytes) -> bytes:
+        try:
+            request = json.loads(line)
+            return _daemon.encode_result(
+                self._call(
+                    pathlib.Path(request["cwd"]),
+                    request["method"],
+                    request.get("args", []),
+                    request.get("kwargs", {}),
+                )
+            )
+        except Exception as e:
+            return _daemon.encode_error(e)
+
+    def _call(
+        self,
+        cwd: pathlib.Path,
+        method: list[str],
+        args: list[t.Any],
+        kwargs: dict[str, t.Any],
+    ) -> t.Any:
+        dj = DJ(dataclasses.replace(self.config, discovery_start_dir=cwd))
+        # the reader must outlive the call, as bound cached methods only hold a
+        # weak reference to it
+        reader = dj._make_reader(allow_builds=True, metadata_cache=self.metadata_cache)
+        target: t.Any = reader
+        for name in method:
+            if not isinstance(name, str) or name.startswith("_"):
+                raise ValueError(f"Unsupported method: {method}")
+            target = getattr(target, name)
+        return target(*args, **kwargs)
+
+    def process_request(self, request: t.Any, client_address: t.Any) -> None:
+        with self._lock:
+            self._connections += 1
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: t.Any) -> None:
+        super().shutdown_request(request)
+        with self._lock:
+            self._connections -= 1
+            self._last_active = time.monotonic()
+
+    def _is_idle(self) -> bool:
+        with self._lock:
+            return (
+                self._connections == 0
+                and time.monotonic() - self._last_active >= self.idle_timeout
+            )
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        while line := self.rfile.readline(_daemon.MAX_MESSAGE_SIZE):
+            if not line.endswith(b"\n"):
+                # the message is too large, or the client went away mid-message
+                break
+            try:
+                self.wfile.write(self.server.respond(line))
+            except (BrokenPipeError, ConnectionResetError):
+                break
+
+
+def _remove_stale_socket(socket_path: pathlib.Path) -> None:
+    """Remove a socket which was left behind by a daemon which has exited."""
+    try:
+        mode = socket_path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+
+    client = _daemon.DaemonClient(socket_path)
+    if client.connect():
+        client.close()
+        raise FileExistsError(f"A daemon is already listening on {socket_path}")
+    socket_path.unlink()
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import dataclasses
 import functools
+import pathlib
+import typing as t
 
-from .._internal import _cached_toml, _discovery
+from .._internal import _cached_toml, _discovery, _stats
 from ._config import DJConfig
-from .reader import Reader, _ReaderImplementation
-from .writer import Writer, _WriterImplementation
+
+# readers and writers (and their dependencies) are imported when they are first used
+if t.TYPE_CHECKING:
+    from .._internal import _metadata_cache
+    from ._cache import CacheManager, CacheStats
+    from ._workspace import Workspace
+    from .reader import Reader
+    from .writer import Writer
 
 
 class DJ:
@@ -15,35 +24,125 @@ class DJ:
     It provides programmatic access to the capabilities of MDDJ.
 
     Note that DJs and their components aggressively cache data so that it can be read
-    many times quickly. In order to refresh state, instantiate a new DJ.
+    many times quickly. In order to refresh state, instantiate a new DJ. With
+    ``DJConfig.share_document_cache``, new DJs only re-parse files which have changed.
     """
 
     def __init__(self, config: DJConfig | None = None) -> None:
         self.config = config or DJConfig()
-        self._document_cache = _cached_toml.TomlDocumentCache()
+        if self.config.collect_stats:
+            _stats.enable()
+        self._document_cache = (
+            _cached_toml.shared_cache(verify_hashes=self.config.verify_document_hashes)
+            if self.config.share_document_cache
+            else _cached_toml.TomlDocumentCache()
+        )
 
     @functools.cached_property
     def _dir_explorer(self) -> _discovery.DirExplorer:
         return _discovery.DirExplorer(
-            self.config.discovery_start_dir, document_cache=self._document_cache
+            self.config.discovery_start_dir,
+            document_cache=self._document_cache,
+            probe=self.config.probe_discovery,
+            ceiling_directories=self.config.ceiling_directories,
         )
 
+    def _with_start_dir(self, start_dir: pathlib.Path) -> DJ:
+        """
+        Get a DJ for another discovery start dir, which shares the document and
+        discovery caches of this DJ.
+        """
+        dj = DJ(dataclasses.replace(self.config, discovery_start_dir=start_dir))
+        dj._document_cache = self._document_cache
+        dj.__dict__["_dir_explorer"] = self._dir_explorer.with_start_dir(start_dir)
+        return dj
+
     @functools.cached_property
     def read(self) -> Reader:
         """A Reader configured via this DJ."""
+        return self._make_reader(allow_builds=True)
+
+    def _make_reader(
+        self,
+        *,
+        allow_builds: bool,
+        metadata_cache: _metadata_cache.MetadataCache | None = None,
+    ) -> Reader:
+        from .reader import _ReaderImplementation
+
+        if metadata_cache is None and self.config.cache_metadata:
+            from .._internal import _metadata_cache
+
+            metadata_cache = _metadata_cache.MetadataCache(self.config.cache_dir)
+        build_env_pool = None
+        if self.config.pool_build_envs:
+            from .._internal import _build_envs
+
+            build_env_pool = _build_envs.BuildEnvPool(self.config.cache_dir)
+
         config = _ReaderImplementation._ConfigClass(
             dir_explorer=self._dir_explorer,
             document_cache=self._document_cache,
             isolated_builds=self.config.isolated_builds,
             capture_build_output=self.config.capture_build_output,
+            metadata_cache=metadata_cache,
+            trust_project_dynamic=self.config.trust_project_dynamic,
+            build_env_pool=build_env_pool,
+            allow_builds=allow_builds,
         )
         return _ReaderImplementation(config)
 
     @functools.cached_property
     def write(self) -> Writer:
         """A Writer configured via this DJ."""
+        from .writer import _WriterImplementation
+
         config = _WriterImplementation._ConfigClass.load_from_toml(
             dir_explorer=self._dir_explorer,
             document_cache=self._document_cache,
         )
         return _WriterImplementation(config)
+
+    def find_workspace(self) -> Workspace:
+        """
+        Find the workspace which contains the current project, and list its members.
+
+        The workspace is declared by the nearest ``pyproject.toml`` with a
+        ``[tool.uv.workspace]`` table, or a ``workspace`` table in one of its
+        ``[tool.hatch.envs]``. Member globs are expanded without walking the
+        directory tree.
+
+        :raises LookupError: if no workspace is found
+        """
+        from ._workspace import Workspace
+
+        return Workspace._from_internal(self._dir_explorer.find_workspace())
+
+    @functools.cached_property
+    def cache(self) -> CacheManager:
+        """A CacheManager for the persistent caches used by this DJ."""
+        from ._cache import CacheManager
+
+        return CacheManager(self.config.cache_dir)
+
+    def stats(self) -> tuple[CacheStats, ...]:
+        """
+        Get statistics for each of the in-memory caches which has been used since
+        collection was enabled with ``DJConfig.collect_stats``, sorted by name.
+
+        Statistics are collected for the whole process, so they include the caches
+        of every DJ. Builds are counted as misses of
+        ``DynamicPackageReader._wheel_package_metadata``.
+        """
+        from ._cache import CacheStats
+
+        return tuple(
+            CacheStats(
+                name=counters.name,
+                # a lookup can start before collection is enabled, and end after
+                hits=max(counters.lookups - counters.misses, 0),
+                misses=counters.misses,
+                compute_time=counters.compute_ns / 1e9,
+            )
+            for counters in _stats.snapshot()
+        )
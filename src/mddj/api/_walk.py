@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pathlib
+
+from .._internal import _project_walk
+
+
+def walk_projects(
+    root: pathlib.Path,
+    *,
+    respect_gitignore: bool = True,
+    max_workers: int | None = None,
+) -> list[pathlib.Path]:
+    """
+    Find the directory of every Python project under ``root``, including ``root``
+    itself, in one walk of the directory tree.
+
+    VCS directories, virtualenvs, ``node_modules``, and ``tox`` and ``nox``
+    environments are skipped, as are paths which are ignored by git unless
+    ``respect_gitignore`` is False. Symlinks to directories are not followed.
+
+    Each directory can then be read by a DJ, as in:
+
+    .. code-block:: python
+
+        for project_dir in walk_projects(pathlib.Path.cwd()):
+            dj = DJ(DJConfig(discovery_start_dir=project_dir))
+
+    :param root: The directory to search.
+    :param respect_gitignore: Whether or not to skip paths which are ignored by
+        the ``.gitignore`` files and ``info/exclude`` of a git repository.
+    :param max_workers: If set, directories are scanned by a pool of this many
+        threads, which is faster on high-latency filesystems.
+    """
+    return [
+        found.dirpath
+        for found in _project_walk.walk(
+            root.absolute(),
+            respect_gitignore=respect_gitignore,
+            max_workers=max_workers,
+        )
+        if "python-package" in found.characteristics
+    ]
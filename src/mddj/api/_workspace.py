@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+
+from .._internal import _workspace
+
+
+@dataclasses.dataclass(frozen=True)
+class Workspace:
+    """A workspace of projects, declared in the ``pyproject.toml`` of its root."""
+
+    #: The directory which declares the workspace.
+    root: pathlib.Path
+    #: The tools which declare the workspace, ``"uv"`` and/or ``"hatch"``.
+    tools: tuple[str, ...]
+    #: The directories of the member projects, sorted. This includes the root if it
+    #: is also a project.
+    members: tuple[pathlib.Path, ...]
+
+    @classmethod
+    def _from_internal(cls, workspace: _workspace.Workspace) -> Workspace:
+        tools = tuple(dict.fromkeys(d.tool for d in workspace.declarations))
+        return cls(root=workspace.root, tools=tools, members=workspace.members)
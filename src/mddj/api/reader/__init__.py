@@ -1,9 +1,11 @@
 from ._errors import MissingRequiredField, NotALowerBound
 from ._main_reader import Reader, _ReaderImplementation
+from ._snapshot import Snapshot
 
 __all__ = (
     "MissingRequiredField",
     "NotALowerBound",
     "Reader",
+    "Snapshot",
     "_ReaderImplementation",
 )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import dataclasses
+import typing as t
 
-from ..._internal import _cached_toml, _discovery
+if t.TYPE_CHECKING:
+    from ..._internal import _build_envs, _cached_toml, _discovery, _metadata_cache
 
 
 @dataclasses.dataclass
@@ -15,3 +17,8 @@ class ReaderConfig:
     document_cache: _cached_toml.TomlDocumentCache
     isolated_builds: bool
     capture_build_output: bool
+    metadata_cache: _metadata_cache.MetadataCache | None = None
+    trust_project_dynamic: bool = True
+    build_env_pool: _build_envs.BuildEnvPool | None = None
+    # when False, reads which need a build raise BuildRequired instead
+    allow_builds: bool = True
@@ -4,3 +4,7 @@ class MissingRequiredField(LookupError):
 
 class NotALowerBound(ValueError):
     pass
+
+
+class BuildRequired(RuntimeError):
+    pass
@@ -7,20 +7,16 @@ import typing as t
 
 from ..._internal import _cached_methods
 from . import _config as _reader_config
-from . import _errors
-from .dynamic_package import (
-    DynamicPackageReader,
-    _DynamicpackageReaderImplementation,
-)
-from .readthedocs import ReadthedocsReader
-from .readthedocs import _config as _readthedocs_config
-from .readthedocs import _ReadthedocsReaderImplementation
-from .static_pyproject import (
-    StaticPyprojectReader,
-    _StaticPyprojectReaderImplementation,
-)
-from .system_info import SystemInfoReader, _SystemInfoReaderImplementation
-from .tox import ToxReader, _ToxReaderImplementation
+from . import _errors, _snapshot
+
+# each sub-reader is imported when it is first used, as some have heavy dependencies
+if t.TYPE_CHECKING:
+    from .dynamic_package import DynamicPackageReader
+    from .readthedocs import ReadthedocsReader
+    from .static_backend import StaticBackendReader
+    from .static_pyproject import StaticPyprojectReader
+    from .system_info import SystemInfoReader
+    from .tox import ToxReader
 
 
 class Reader(t.Protocol):
@@ -31,6 +27,13 @@ class Reader(t.Protocol):
     dynamic data (which requires a build). Use ``static`` or ``dynamic`` to explicitly
     choose one or the other.
 
+    For some fields, before building, the reader tries to resolve dynamic values by
+    applying the rules of the project's build backend (see ``static_backend``).
+
+    Failover only happens for fields which may be dynamic. When a project has a
+    ``[project]`` table, a field which is neither set nor listed in
+    ``project.dynamic`` is read as empty, without a build.
+
     Construction is private.
     Users should create a DJ and then access the reader built by it, as in:
 
@@ -51,14 +54,21 @@ class Reader(t.Protocol):
     @functools.cached_property
     def tox(self) -> ToxReader:
         """a :class:`ToxReader` provided by this reader"""
+        from .tox import _ToxReaderImplementation
+
         return _ToxReaderImplementation()
 
     @functools.cached_property
     def sys(self) -> SystemInfoReader:
+        from .system_info import _SystemInfoReaderImplementation
+
         return _SystemInfoReaderImplementation()
 
     @functools.cached_property
     def readthedocs(self) -> ReadthedocsReader:
+        from .readthedocs import _config as _readthedocs_config
+        from .readthedocs import _ReadthedocsReaderImplementation
+
         return _ReadthedocsReaderImplementation(
             _readthedocs_config.ReadthedocsConfig.load_from_toml(
                 dir_explorer=self._config.dir_explorer,
@@ -69,17 +79,33 @@ class Reader(t.Protocol):
     @functools.cached_property
     def static(self) -> StaticPyprojectReader:
         """a :class:`StaticPyprojectReader` provided by this reader"""
+        from .static_pyproject import _StaticPyprojectReaderImplementation
+
         return _StaticPyprojectReaderImplementation(
             self._config.dir_explorer, document_cache=self._config.document_cache
         )
 
+    @functools.cached_property
+    def static_backend(self) -> StaticBackendReader:
+        """a :class:`StaticBackendReader` provided by this reader"""
+        from .static_backend import _StaticBackendReaderImplementation
+
+        return _StaticBackendReaderImplementation(
+            self._config.dir_explorer, document_cache=self._config.document_cache
+        )
+
     @functools.cached_property
     def dynamic(self) -> DynamicPackageReader:
         """a :class:`DynamicPackageReader` provided by this reader"""
+        from .dynamic_package import _DynamicpackageReaderImplementation
+
         return _DynamicpackageReaderImplementation(
             self._config.dir_explorer,
             isolated_builds=self._config.isolated_builds,
             capture_build_output=self._config.capture_build_output,
+            metadata_cache=self._config.metadata_cache,
+            build_env_pool=self._config.build_env_pool,
+            allow_builds=self._config.allow_builds,
         )
 
     # supported metadata APIs, in alphabetical order
@@ -88,7 +114,7 @@ class Reader(t.Protocol):
     def authors(self) -> tuple[types.MappingProxyType[str, str], ...]:
         value = self.static.authors()
         if value is None:
-            value = self.dynamic.authors()
+            value = self.dynamic.authors() if self._is_dynamic("authors") else ()
         return value
 
     @_cached_methods.cached_method
@@ -102,8 +128,12 @@ class Reader(t.Protocol):
         Note that ``python_versions`` skips major-version-only classifiers.
         """
         value = self.static.classifiers()
+        if value is None and self._is_dynamic("classifiers"):
+            value = self.static_backend.classifiers()
+            if value is None:
+                value = self.dynamic.classifiers()
         if value is None:
-            value = self.dynamic.classifiers()
+            value = ()
 
         if python_versions:
             return _extract_python_versions_from_classifiers(value)
@@ -119,43 +149,61 @@ class Reader(t.Protocol):
         optional-dependencies.
         """
         value = self.static.dependencies()
+        if value is None and self._is_dynamic("dependencies"):
+            value = self.static_backend.dependencies()
+            if value is None:
+                value = self.dynamic.dependencies()
         if value is None:
-            value = self.dynamic.dependencies()
+            value = ()
         return value
 
     @_cached_methods.cached_method
     def description(self) -> str | None:
         value = self.static.description()
-        if value is None:
-            value = self.dynamic.description()
+        if value is None and self._is_dynamic("description"):
+            value = self.static_backend.description()
+            if value is None:
+                value = self.dynamic.description()
         return value
 
     @_cached_methods.cached_method
     def import_names(self) -> tuple[str, ...]:
         value = self.static.import_names()
         if value is None:
-            value = self.dynamic.import_names()
+            value = (
+                self.dynamic.import_names() if self._is_dynamic("import-names") else ()
+            )
         return value
 
     @_cached_methods.cached_method
     def import_namespaces(self) -> tuple[str, ...]:
         value = self.static.import_namespaces()
         if value is None:
-            value = self.dynamic.import_namespaces()
+            value = (
+                self.dynamic.import_namespaces()
+                if self._is_dynamic("import-namespaces")
+                else ()
+            )
         return value
 
     @_cached_methods.cached_method
     def keywords(self) -> tuple[str, ...]:
         value = self.static.keywords()
+        if value is None and self._is_dynamic("keywords"):
+            value = self.static_backend.keywords()
+            if value is None:
+                value = self.dynamic.keywords()
         if value is None:
-            value = self.dynamic.keywords()
+            value = ()
         return value
 
     @_cached_methods.cached_method
     def maintainers(self) -> tuple[types.MappingProxyType[str, str], ...]:
         value = self.static.maintainers()
         if value is None:
-            value = self.dynamic.maintainers()
+            value = (
+                self.dynamic.maintainers() if self._is_dynamic("maintainers") else ()
+            )
         return value
 
     @_cached_methods.cached_method
@@ -179,6 +227,12 @@ class Reader(t.Protocol):
         """
         if (static := self.static.optional_dependencies()) is not None:
             return static
+        if not self._is_dynamic("optional-dependencies"):
+            return types.MappingProxyType({})
+        # resolved values carry no markers, so they can't stand in for exact data
+        if not exact_wheel_metadata:
+            if (resolved := self.static_backend.optional_dependencies()) is not None:
+                return resolved
 
         return self.dynamic.optional_dependencies(
             exact_wheel_metadata=exact_wheel_metadata
@@ -187,8 +241,10 @@ class Reader(t.Protocol):
     @_cached_methods.cached_method
     def name(self) -> str:
         value = self.static.name()
-        if value is None:
-            value = self.dynamic.name()
+        if value is None and self._is_dynamic("name"):
+            value = self.static_backend.name()
+            if value is None:
+                value = self.dynamic.name()
         if value is None:
             raise _errors.MissingRequiredField(
                 "No 'name' found in static or dynamic metadata. "
@@ -213,16 +269,20 @@ class Reader(t.Protocol):
     @functools.cached_property
     def _requires_python(self) -> str | None:
         value = self.static.requires_python()
-        if value is None:
-            value = self.dynamic.requires_python()
+        if value is None and self._is_dynamic("requires-python"):
+            value = self.static_backend.requires_python()
+            if value is None:
+                value = self.dynamic.requires_python()
         return value
 
     @_cached_methods.cached_method
     def version(self) -> str:
         """Get the version of the project."""
         value = self.static.version()
-        if value is None:
-            value = self.dynamic.version()
+        if value is None and self._is_dynamic("version"):
+            value = self.static_backend.version()
+            if value is None:
+                value = self.dynamic.version()
         if value is None:
             raise _errors.MissingRequiredField(
                 "No 'version' found in static or dynamic metadata. "
@@ -230,6 +290,37 @@ class Reader(t.Protocol):
             )
         return value
 
+    def snapshot(
+        self, fields: t.Iterable[str] = _snapshot.DEFAULT_FIELDS
+    ) -> _snapshot.Snapshot:
+        """
+        Read several fields at once.
+
+        The fields share one discovery of the project, one parse of each file, and
+        at most one build.
+
+        .. code-block:: pycon
+
+            >>> snapshot = dj.read.snapshot(["name", "version"])
+            >>> snapshot.name, snapshot.version
+            ('foo', '0.1.0')
+
+        :param fields: The fields to read, from ``mddj.api.FIELDS``. Defaults to
+            ``name``, ``version``, ``requires-python``, and ``dependencies``.
+        :raises ValueError: if any of the fields are not supported
+        """
+        fields = _snapshot.check_fields(fields, caller="snapshot")
+        return _snapshot.take_snapshot(self, fields)
+
+    def _is_dynamic(self, field: str) -> bool:
+        """
+        Check whether or not a field which is missing from static metadata should be
+        read from a build.
+        """
+        if not self._config.trust_project_dynamic:
+            return True
+        return self.static.is_dynamic(field)
+
 
 class _ReaderImplementation(Reader):
     _ConfigClass: t.ClassVar[type[_reader_config.ReaderConfig]] = (
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import dataclasses
+import types
+import typing as t
+
+if t.TYPE_CHECKING:
+    from ._main_reader import Reader
+
+#: The fields which can be read together, named as in ``pyproject.toml``.
+FIELDS: tuple[str, ...] = (
+    "authors",
+    "classifiers",
+    "dependencies",
+    "description",
+    "import-names",
+    "import-namespaces",
+    "keywords",
+    "maintainers",
+    "name",
+    "optional-dependencies",
+    "requires-python",
+    "version",
+)
+DEFAULT_FIELDS: tuple[str, ...] = ("name", "version", "requires-python", "dependencies")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Snapshot:
+    """
+    The fields read from a project by ``Reader.snapshot``.
+
+    Each field has an attribute with its name in snake case, holding the value as it
+    would be returned by the method of the same name on the reader. Fields which were
+    not requested are ``None``.
+    """
+
+    #: The fields which were read, in the order in which they were requested.
+    fields: tuple[str, ...] = ()
+    authors: tuple[types.MappingProxyType[str, str], ...] | None = None
+    classifiers: tuple[str, ...] | None = None
+    dependencies: tuple[str, ...] | None = None
+    description: str | None = None
+    import_names: tuple[str, ...] | None = None
+    import_namespaces: tuple[str, ...] | None = None
+    keywords: tuple[str, ...] | None = None
+    maintainers: tuple[types.MappingProxyType[str, str], ...] | None = None
+    name: str | None = None
+    optional_dependencies: types.MappingProxyType[str, tuple[str, ...]] | None = None
+    requires_python: str | None = None
+    version: str | None = None
+
+    def as_dict(self) -> dict[str, t.Any]:
+        """Get the fields which were read, keyed by their ``pyproject.toml`` names."""
+        return {field: getattr(self, _attribute(field)) for field in self.fields}
+
+
+def check_fields(fields: t.Iterable[str], *, caller: str) -> tuple[str, ...]:
+    """
+    Check that fields are supported, and remove any duplicates.
+
+    :raises ValueError: if any of the fields are not supported
+    """
+    fields = tuple(dict.fromkeys(fields))
+    if unknown := [field for field in fields if field not in FIELDS]:
+        raise ValueError(f"Unsupported fields for {caller}: {', '.join(unknown)}")
+    return fields
+
+
+def take_snapshot(reader: Reader, fields: tuple[str, ...]) -> Snapshot:
+    # every field is read through the same reader, so project discovery, parsed
+    # documents, and any build are shared between them
+    values = {
+        _attribute(field): getattr(reader, _attribute(field))() for field in fields
+    }
+    return Snapshot(fields=fields, **values)
+
+
+def _attribute(field: str) -> str:
+    return field.replace("-", "_")
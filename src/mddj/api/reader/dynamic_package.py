@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-import email.utils
-import functools
+import pathlib
 import types
 import typing as t
 
 from ..._internal import _cached_methods, _discovery, _wheel_metadata
+from . import _errors
 
-try:
-    import importlib_metadata as _importlib_metadata
-except ImportError:
-    import importlib.metadata as _importlib_metadata
+if t.TYPE_CHECKING:
+    from ..._internal import _build_envs, _core_metadata, _metadata_cache
 
 
 class DynamicPackageReader(t.Protocol):
     _dir_explorer: _discovery.DirExplorer
     _isolated_builds: bool
     _capture_build_output: bool
+    _metadata_cache: _metadata_cache.MetadataCache | None
+    _build_env_pool: _build_envs.BuildEnvPool | None
+    _allow_builds: bool
 
     # supported public APIs follow, in alphabetical order
 
@@ -64,10 +65,10 @@ class DynamicPackageReader(t.Protocol):
         Retrieve the optional dependencies for the project.
 
         The fields in metadata must be interpreted in order to find optional
-        dependencies based on markers. ``mddj`` checks dependencies which start or end
-        with an ``extra`` marker to find the optional dependencies.
-        This heuristic is correct for typical cases but could be inaccurate with very
-        unusual package builds.
+        dependencies based on markers. ``mddj`` examines the ``extra`` comparisons
+        in each marker, including ones combined with ``or`` or nested in groups, to
+        find the extras which a dependency belongs to. A dependency which applies
+        without any extra is not optional.
 
         :param exact_wheel_metadata: After finding optional dependencies, ``mddj``
             will attempt to remove the markers which associate a dependency with an
@@ -93,20 +94,42 @@ class DynamicPackageReader(t.Protocol):
 
     # internal lookup APIs
 
-    @functools.cached_property
-    def _wheel_package_metadata(self) -> _importlib_metadata.PackageMetadata:
-        return _wheel_metadata.get_package_metadata(
-            self._dir_explorer.search_for("python-package").dirpath,
+    @_cached_methods.cached_property
+    def _wheel_package_metadata(self) -> _core_metadata.CoreMetadata:
+        if not self._allow_builds:
+            raise _errors.BuildRequired("Reading this field requires a build.")
+        return _wheel_metadata.get_package_metadata(**self._build_arguments())
+
+    def _build_arguments(self) -> dict[str, t.Any]:
+        """Get the arguments for ``get_package_metadata`` for this project."""
+        vcs_root: pathlib.Path | None = None
+        if self._metadata_cache is not None:
+            try:
+                vcs_root = self._dir_explorer.search_for("vcs-root").dirpath
+            except LookupError:
+                pass
+
+        return dict(
+            source_dir=self._dir_explorer.search_for("python-package").dirpath,
             isolated=self._isolated_builds,
             quiet=self._capture_build_output,
+            cache=self._metadata_cache,
+            vcs_root=vcs_root,
+            env_pool=self._build_env_pool,
         )
 
-    @functools.cached_property
+    def _use_metadata_text(self, text: str) -> None:
+        """Use METADATA which was built elsewhere, in place of running a build."""
+        self.__dict__["_wheel_package_metadata"] = (
+            _wheel_metadata.parse_package_metadata(text)
+        )
+
+    @_cached_methods.cached_property
     def _parsed_wheel_dependency_data(self) -> _wheel_metadata.WheelDependencyData:
         return _wheel_metadata.load_wheel_dependency_data(self._wheel_package_metadata)
 
     def _read(self, key: str) -> str | None:
-        return self._wheel_package_metadata.get(key)  # type: ignore[no-any-return]
+        return self._wheel_package_metadata.get(key)
 
     def _read_string_array(
         self,
@@ -119,9 +142,9 @@ class DynamicPackageReader(t.Protocol):
                     str(x) for x in self._wheel_package_metadata.get_all(key, ())
                 )
             case "commasep":
-                value = self._wheel_package_metadata.get(key)
-                if isinstance(value, str):
-                    value = tuple(value.split(","))
+                raw_value = self._wheel_package_metadata.get(key)
+                if isinstance(raw_value, str):
+                    value = tuple(raw_value.split(","))
                 else:
                     value = ()
             case _ as unreachable:
@@ -160,13 +183,21 @@ class _DynamicpackageReaderImplementation(DynamicPackageReader):
         *,
         isolated_builds: bool = True,
         capture_build_output: bool = True,
+        metadata_cache: _metadata_cache.MetadataCache | None = None,
+        build_env_pool: _build_envs.BuildEnvPool | None = None,
+        allow_builds: bool = True,
     ) -> None:
         self._dir_explorer = dir_explorer
         self._isolated_builds = isolated_builds
         self._capture_build_output = capture_build_output
+        self._metadata_cache = metadata_cache
+        self._build_env_pool = build_env_pool
+        self._allow_builds = allow_builds
 
 
 def _parse_emails_to_contact_info(emails: str) -> list[dict[str, str]]:
+    import email.utils
+
     ret = []
     for name, address in email.utils.getaddresses([emails]):
         item: dict[str, str] = {}
@@ -4,9 +4,6 @@ import pathlib
 import shlex
 import typing as t
 
-# for some reason, mypy flags 'loads' as not explicitly exported
-from ryaml import loads as _ryaml_loads  # type: ignore[attr-defined]
-
 from ...._internal import _cached_methods, _toml_path
 from ._config import ReadthedocsConfig
 
@@ -47,6 +44,9 @@ class ReadthedocsReader(t.Protocol):
 
     @_cached_methods.cached_method
     def _load_data(self) -> dict[str, t.Any]:
+        # for some reason, mypy flags 'loads' as not explicitly exported
+        from ryaml import loads as _ryaml_loads  # type: ignore[attr-defined]
+
         content = self._config_path.read_text()
 
         data = _ryaml_loads(content)
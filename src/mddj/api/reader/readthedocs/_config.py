@@ -4,7 +4,7 @@ import dataclasses
 import sys
 import typing as t
 
-from ...._internal import _cached_toml, _discovery
+from ...._internal import _cached_toml, _discovery, _types
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -28,23 +28,19 @@ class ReadthedocsConfig:
         dir_explorer: _discovery.DirExplorer,
         document_cache: _cached_toml.TomlDocumentCache,
     ) -> Self:
-        import tomlkit
-
         if not dir_explorer.pyproject_path:
             return cls(dir_explorer)
 
-        data = document_cache.load(dir_explorer.pyproject_path)
+        mddj_data = document_cache.load_table(
+            dir_explorer.pyproject_path, "tool", "mddj"
+        )
 
         try:
-            tool_table = data["tool"]
-            if not isinstance(tool_table, tomlkit.items.Table):
-                raise KeyError("'tool' was not a table")
-            mddj_data = tool_table["mddj"]
-            if not isinstance(mddj_data, tomlkit.items.Table):
+            if not _types.is_toml_table(mddj_data):
                 raise KeyError("'tool.mddj' was not a table")
 
             readthedocs_conf = mddj_data["readthedocs"]
-            if not isinstance(readthedocs_conf, tomlkit.items.Table):
+            if not _types.is_toml_table(readthedocs_conf):
                 raise KeyError("'tool.mddj.readthedocs' was not a table")
 
             py_ver_path = "build.tools.python"
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import functools
+import pathlib
+import types
+import typing as t
+
+from packaging.version import InvalidVersion, Version
+
+from ..._internal import (
+    _cached_methods,
+    _cached_toml,
+    _discovery,
+    _flit,
+    _hatch,
+    _scm_version,
+    _setuptools,
+    _types,
+)
+
+_FLIT_BACKEND = "flit_core.buildapi"
+# the backend used by build frontends when none is declared
+_DEFAULT_BACKEND = "setuptools.build_meta:__legacy__"
+
+T = t.TypeVar("T")
+
+
+class StaticBackendReader(t.Protocol):
+    """
+    A StaticBackendReader resolves dynamic metadata by applying the rules of a
+    known build backend to the source tree, without running a build.
+
+    Each method returns ``None`` when the value cannot be determined this way,
+    either because the backend is not recognized, the field is not dynamic, or the
+    backend's rules for the field are not supported.
+    """
+
+    _dir_explorer: _discovery.DirExplorer
+    _document_cache: _cached_toml.TomlDocumentCache
+
+    # supported public APIs follow, in alphabetical order
+
+    @_cached_methods.cached_method
+    def build_backend(self) -> str | None:
+        """Get the ``build-system.build-backend`` of the project."""
+        build_system = self._read_table("build-system")
+        if not _types.is_toml_mapping(build_system):
+            return None
+        backend = build_system.get("build-backend")
+        return str(backend) if isinstance(backend, str) else None
+
+    @_cached_methods.cached_method
+    def classifiers(self) -> tuple[str, ...] | None:
+        return self._from_setuptools(_setuptools.SetuptoolsProject.classifiers)
+
+    @_cached_methods.cached_method
+    def dependencies(self) -> tuple[str, ...] | None:
+        return self._from_setuptools(_setuptools.SetuptoolsProject.dependencies)
+
+    @_cached_methods.cached_method
+    def description(self) -> str | None:
+        if self._backend == _FLIT_BACKEND:
+            if not self._declares_dynamic("description"):
+                return None
+            info = self._flit_module_info
+            if info is None or info.docstring is None:
+                return None
+            return _flit.summary_from_docstring(info.docstring)
+        return self._from_setuptools(_setuptools.SetuptoolsProject.description)
+
+    @_cached_methods.cached_method
+    def keywords(self) -> tuple[str, ...] | None:
+        return self._from_setuptools(_setuptools.SetuptoolsProject.keywords)
+
+    @_cached_methods.cached_method
+    def name(self) -> str | None:
+        return self._from_setuptools(_setuptools.SetuptoolsProject.name)
+
+    @_cached_methods.cached_method
+    def optional_dependencies(
+        self,
+    ) -> types.MappingProxyType[str, tuple[str, ...]] | None:
+        value = self._from_setuptools(
+            _setuptools.SetuptoolsProject.optional_dependencies
+        )
+        return None if value is None else types.MappingProxyType(value)
+
+    @_cached_methods.cached_method
+    def requires_python(self) -> str | None:
+        return self._from_setuptools(_setuptools.SetuptoolsProject.requires_python)
+
+    @_cached_methods.cached_method
+    def version(self) -> str | None:
+        if self._backend == _FLIT_BACKEND:
+            if not self._declares_dynamic("version"):
+                return None
+            info = self._flit_module_info
+            if info is None or info.version is None:
+                return None
+            return _normalize_version(info.version)
+
+        if self._backend == _hatch.HATCH_BACKEND:
+            value = self._hatch_version
+        elif self._uses_setuptools_scm:
+            value = self._scm_version(self._read_tool_table("setuptools_scm"))
+        else:
+            value = self._from_setuptools(_setuptools.SetuptoolsProject.version)
+        return None if value is None else _normalize_version(value)
+
+    # internal lookup APIs
+
+    @functools.cached_property
+    def _project_dir(self) -> pathlib.Path | None:
+        try:
+            return self._dir_explorer.search_for("python-package").dirpath
+        except LookupError:
+            return None
+
+    def _read_table(self, *path: str) -> t.Any:
+        """Read a value from the project's ``pyproject.toml``, if there is one."""
+        if self._project_dir is None:
+            return None
+        try:
+            return self._document_cache.load_table(
+                self._project_dir / "pyproject.toml", *path
+            )
+        except FileNotFoundError:
+            return None
+
+    @functools.cached_property
+    def _backend(self) -> str:
+        return self.build_backend() or _DEFAULT_BACKEND
+
+    def _read_tool_table(self, *path: str) -> _types.TomlMapping | None:
+        value = self._read_table("tool", *path)
+        return value if _types.is_toml_mapping(value) else None
+
+    def _declares_dynamic(self, field: str) -> bool:
+        project = self._read_table("project")
+        if not _types.is_toml_mapping(project):
+            return False
+        dynamic = project.get("dynamic")
+        return _types.is_toml_array(dynamic) and field in dynamic
+
+    @functools.cached_property
+    def _flit_module_info(self) -> _flit.ModuleInfo | None:
+        if (project_dir := self._project_dir) is None:
+            return None
+
+        module_name: object = None
+        if (module_table := self._read_tool_table("flit", "module")) is not None:
+            module_name = module_table.get("name")
+        if module_name is None:
+            project = self._read_table("project")
+            if _types.is_toml_mapping(project):
+                if isinstance(name := project.get("name"), str):
+                    module_name = name.replace("-", "_")
+        if not isinstance(module_name, str):
+            return None
+
+        if (path := _flit.find_module_file(project_dir, module_name)) is None:
+            return None
+        return _flit.read_module_info(path)
+
+    @functools.cached_property
+    def _hatch_config(self) -> t.Mapping[str, t.Any]:
+        config: dict[str, t.Any] = dict(self._read_tool_table("hatch") or {})
+        # hatchling merges the top-level tables of hatch.toml over [tool.hatch]
+        if self._project_dir is not None:
+            try:
+                config.update(
+                    self._document_cache.load(self._project_dir / "hatch.toml")
+                )
+            except FileNotFoundError:
+                pass
+        return config
+
+    @functools.cached_property
+    def _hatch_version(self) -> str | None:
+        if self._project_dir is None or not self._declares_dynamic("version"):
+            return None
+
+        # metadata hooks may set any dynamic field, including the version
+        metadata = self._hatch_config.get("metadata")
+        if _types.is_toml_mapping(metadata) and metadata.get("hooks"):
+            return None
+
+        version_config = self._hatch_config.get("version")
+        if not _types.is_toml_mapping(version_config):
+            return None
+        match version_config.get("source", "regex"):
+            case "regex":
+                path = version_config.get("path")
+                if not isinstance(path, str) or not path:
+                    return None
+                return _hatch.read_regex_version(
+                    self._project_dir, path, version_config.get("pattern")
+                )
+            case "env":
+                return _hatch.read_env_version(version_config)
+            case "vcs":
+                return self._scm_version(_hatch.vcs_scm_options(version_config))
+        return None
+
+    @functools.cached_property
+    def _uses_setuptools_scm(self) -> bool:
+        if self._backend not in _setuptools.SETUPTOOLS_BACKENDS:
+            return False
+        if self._read_tool_table("setuptools_scm") is None:
+            return False
+        project = self._read_table("project")
+        return not _types.is_toml_mapping(project) or self._declares_dynamic("version")
+
+    def _scm_version(self, options: t.Mapping[str, t.Any] | None) -> str | None:
+        if self._project_dir is None or options is None:
+            return None
+        if (config := _scm_version.ScmConfig.from_options(options)) is None:
+            return None
+
+        scm_root = (self._project_dir / config.root).resolve()
+        try:
+            vcs_root: pathlib.Path | None = self._dir_explorer.search_for(
+                "vcs-root", start_dir=scm_root
+            ).dirpath.resolve()
+        except LookupError:
+            vcs_root = None
+
+        project = self._read_table("project")
+        dist_name = project.get("name") if _types.is_toml_mapping(project) else None
+        return _scm_version.compute_version(
+            scm_root,
+            vcs_root,
+            config,
+            dist_name=dist_name if isinstance(dist_name, str) else None,
+        )
+
+    @functools.cached_property
+    def _setuptools_project(self) -> _setuptools.SetuptoolsProject | None:
+        if self._project_dir is None:
+            return None
+        if self._backend not in _setuptools.SETUPTOOLS_BACKENDS:
+            return None
+        if not _setuptools.is_buildable(self._project_dir):
+            return None
+        pyproject: dict[str, t.Any] = {"project": self._read_table("project")}
+        if (tool_setuptools := self._read_tool_table("setuptools")) is not None:
+            pyproject["tool"] = {"setuptools": tool_setuptools}
+        return _setuptools.SetuptoolsProject(self._project_dir, pyproject)
+
+    def _from_setuptools(
+        self, getter: t.Callable[[_setuptools.SetuptoolsProject], T | None]
+    ) -> T | None:
+        if (project := self._setuptools_project) is None:
+            return None
+        try:
+            return getter(project)
+        except _setuptools.Unresolvable:
+            return None
+
+
+class _StaticBackendReaderImplementation(StaticBackendReader):
+    def __init__(
+        self,
+        dir_explorer: _discovery.DirExplorer,
+        document_cache: _cached_toml.TomlDocumentCache | None = None,
+    ) -> None:
+        self._dir_explorer = dir_explorer
+        self._document_cache = document_cache or _cached_toml.TomlDocumentCache()
+
+
+def _normalize_version(version: str) -> str | None:
+    """
+    Normalize a version string, as build backends do when writing metadata.
+    An invalid version can't be resolved statically; the build will report it.
+    """
+    try:
+        return str(Version(version))
+    except InvalidVersion:
+        return None
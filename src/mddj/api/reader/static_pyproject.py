@@ -5,9 +5,6 @@ import functools
 import types
 import typing as t
 
-import tomlkit
-from packaging.utils import canonicalize_name
-
 from ..._internal import _cached_methods, _cached_toml, _discovery, _types
 
 
@@ -41,6 +38,21 @@ class StaticPyprojectReader(t.Protocol):
     def dynamic(self) -> tuple[str, ...] | None:
         return self._read_string_array("dynamic")
 
+    @_cached_methods.cached_method
+    def is_dynamic(self, field: str) -> bool:
+        """
+        Check whether a field may be provided by the build backend.
+
+        Under the ``pyproject.toml`` specification, a field which is not set in the
+        ``[project]`` table and not listed in ``project.dynamic`` is known to be
+        empty. If there is no ``[project]`` table, every field may be dynamic.
+
+        :param field: The name of the field, as it appears in ``pyproject.toml``.
+        """
+        if not self._has_project_table:
+            return True
+        return field in (self.dynamic() or ())
+
     @_cached_methods.cached_method
     def import_names(self) -> tuple[str, ...] | None:
         return self._read_string_array("import-names")
@@ -78,10 +90,20 @@ class StaticPyprojectReader(t.Protocol):
     # internal lookup APIs
 
     @functools.cached_property
-    def _document(self) -> tomlkit.TOMLDocument:
+    def _document(self) -> dict[str, t.Any]:
+        """The parts of ``pyproject.toml`` which are read: only ``[project]``."""
         if (path := self._dir_explorer.pyproject_path) is None:
             raise LookupError("no pyproject.toml found")
-        return self._document_cache.load(path)
+        project = self._document_cache.load_table(path, "project")
+        return {} if project is None else {"project": project}
+
+    @functools.cached_property
+    def _has_project_table(self) -> bool:
+        try:
+            document = self._document
+        except (FileNotFoundError, LookupError):
+            return False
+        return _types.is_toml_mapping(document.get("project"))
 
     def _read(self, key: str) -> object | None:
         try:
@@ -167,6 +189,9 @@ class StaticPyprojectReader(t.Protocol):
 
         # static data is not already normalized, so it must be done by mddj or it
         # won't be any good for lookups/comparisons
+        # (packaging.utils is imported here, as it is slow to import)
+        from packaging.utils import canonicalize_name
+
         canonicalized_map: dict[str, tuple[str, ...]] = {}
         for name, value in map.items():
             canonical = canonicalize_name(name)
@@ -202,7 +227,7 @@ def _is_well_formed_contact_info_entry(entry: object) -> bool:
 
 
 def _read_pyproject_toml_value(
-    pyproject_data: tomlkit.TOMLDocument, *path: str | int
+    pyproject_data: dict[str, t.Any], *path: str | int
 ) -> object:
     """
     Read an arbitrary value from 'pyproject.toml'
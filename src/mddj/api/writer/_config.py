@@ -6,7 +6,7 @@ import pathlib
 import sys
 import typing as t
 
-from ..._internal import _cached_toml, _discovery
+from ..._internal import _cached_toml, _discovery, _types
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -33,19 +33,15 @@ class WriterConfig:
         dir_explorer: _discovery.DirExplorer,
         document_cache: _cached_toml.TomlDocumentCache,
     ) -> Self:
-        import tomlkit
-
         if dir_explorer.pyproject_path is None:
             return cls(dir_explorer=dir_explorer, document_cache=document_cache)
 
-        data = document_cache.load(dir_explorer.pyproject_path)
+        mddj_data = document_cache.load_table(
+            dir_explorer.pyproject_path, "tool", "mddj"
+        )
 
         try:
-            tool_table = data["tool"]
-            if not isinstance(tool_table, tomlkit.items.Table):
-                raise KeyError("'tool' was not a table")
-            mddj_data = tool_table["mddj"]
-            if not isinstance(mddj_data, tomlkit.items.Table):
+            if not _types.is_toml_table(mddj_data):
                 raise KeyError("'tool.mddj' was not a table")
 
             write_version = mddj_data["write_version"]
@@ -62,12 +62,16 @@ class Writer(t.Protocol):
                 file_path, write_version_settings.key, new_version
             )
         elif isinstance(write_version_settings, _config.WriteVersionTomlSettings):
-            return _writers.write_toml_value(
-                file_path,
-                write_version_settings.toml_path,
-                new_version,
-                loaded_document=self._config.document_cache.load(file_path),
-            )
+            document_cache = self._config.document_cache
+            try:
+                return _writers.write_toml_value(
+                    file_path,
+                    write_version_settings.toml_path,
+                    new_version,
+                    loaded_document=document_cache.load_for_write(file_path),
+                )
+            finally:
+                document_cache.invalidate(file_path)
         else:
             raise NotImplementedError(
                 "Unrecognized write_version_config. "
@@ -0,0 +1,77 @@
+import json
+import subprocess
+from textwrap import dedent as d
+
+import pytest
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        d("""\
+            [project]
+            name = "mypkg"
+            version = "1.2.4"
+            description = "it's my package"
+            requires-python = ">=3.10"
+            dependencies = ["foo", "bar>=1"]
+
+            [project.optional-dependencies]
+            cli = ["click"]
+            """),
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_read_fields_as_json(chdir, project, run_line):
+    with chdir(project):
+        result = run_line("mddj read fields")
+
+    assert json.loads(result.stdout) == {
+        "name": "mypkg",
+        "version": "1.2.4",
+        "requires-python": ">=3.10",
+        "dependencies": ["foo", "bar>=1"],
+    }
+
+
+def test_read_chosen_fields_as_json(chdir, project, run_line):
+    with chdir(project):
+        result = run_line("mddj read fields optional-dependencies name")
+
+    data = json.loads(result.stdout)
+    assert list(data) == ["optional-dependencies", "name"]
+    assert data == {"optional-dependencies": {"cli": ["click"]}, "name": "mypkg"}
+
+
+def test_read_fields_rejects_unknown_fields(chdir, project, run_line):
+    with chdir(project):
+        run_line(
+            "mddj read fields name license",
+            assert_exit_code=2,
+            search_stderr="Invalid value",
+        )
+
+
+def test_read_fields_as_shell_exports(chdir, project, run_line):
+    with chdir(project):
+        result = run_line(
+            "mddj read fields --format shell "
+            "name description dependencies optional-dependencies"
+        )
+
+    assert result.stdout.splitlines()[:2] == [
+        "export MDDJ_NAME=mypkg",
+        "export MDDJ_DESCRIPTION='it'\"'\"'s my package'",
+    ]
+
+    # the exports can be evaluated by a shell
+    script = result.stdout + d("""\
+        printf '%s|' "$MDDJ_NAME" "$MDDJ_DESCRIPTION" "$MDDJ_DEPENDENCIES" \\
+            "$MDDJ_OPTIONAL_DEPENDENCIES"
+        """)
+    output = subprocess.run(
+        ["sh", "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    assert output == 'mypkg|it\'s my package|foo\nbar>=1|{"cli": ["click"]}|'
@@ -0,0 +1,121 @@
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal import _build_envs, _wheel_metadata
+
+
+@pytest.fixture
+def setupcfg_project(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "setup.cfg").write_text(
+        d("""\
+            [metadata]
+            name = foopkg
+            """),
+        encoding="utf-8",
+    )
+    # setting metadata in setup.py ensures that reading it requires a build
+    (project_dir / "setup.py").write_text(
+        "from setuptools import setup; setup(version='1.0.0')\n", encoding="utf-8"
+    )
+    (project_dir / "foopkg.py").touch()
+    return project_dir
+
+
+def test_cached_metadata_is_reused(
+    chdir, tmp_path, setupcfg_project, run_line, monkeypatch
+):
+    env = {
+        "MDDJ_CACHE_DIR": str(tmp_path / "cache"),
+        "MDDJ_CACHE_METADATA": "1",
+    }
+
+    with chdir(setupcfg_project):
+        run_line("mddj read version", search_stdout=r"^1\.0\.0$", env=env)
+        run_line(
+            "mddj self cache info",
+            search_stdout=r"^metadata:\n.*\n    entries: 1$",
+            env=env,
+        )
+
+        # a second read must not build
+        def _fail_build(*args, **kwargs):
+            raise AssertionError("metadata was rebuilt")
+
+        monkeypatch.setattr(_wheel_metadata, "_build_metadata_text", _fail_build)
+        run_line("mddj read version", search_stdout=r"^1\.0\.0$", env=env)
+
+
+def test_cache_clear(chdir, tmp_path, setupcfg_project, run_line):
+    env = {
+        "MDDJ_CACHE_DIR": str(tmp_path / "cache"),
+        "MDDJ_CACHE_METADATA": "1",
+    }
+
+    with chdir(setupcfg_project):
+        run_line("mddj read name", env=env)
+        run_line(
+            "mddj self cache clear",
+            search_stdout=r"^metadata: removed 1 entries",
+            env=env,
+        )
+        run_line(
+            "mddj self cache info",
+            search_stdout=r"^metadata:\n.*\n    entries: 0$",
+            env=env,
+        )
+
+
+def test_cache_is_unused_by_default(chdir, tmp_path, setupcfg_project, run_line):
+    env = {"MDDJ_CACHE_DIR": str(tmp_path / "cache")}
+
+    with chdir(setupcfg_project):
+        run_line("mddj read name", env=env)
+        run_line(
+            "mddj self cache info",
+            search_stdout=[
+                r"^metadata:\n.*\n    entries: 0$",
+                r"^build-envs:\n.*\n    entries: 0$",
+            ],
+            env=env,
+        )
+
+
+def test_cache_prune_on_empty_cache(tmp_path, run_line):
+    env = {"MDDJ_CACHE_DIR": str(tmp_path / "cache")}
+    run_line(
+        "mddj self cache prune --max-age 0",
+        search_stdout=[
+            r"^metadata: removed 0 entries",
+            r"^build-envs: removed 0 entries",
+        ],
+        env=env,
+    )
+
+
+def test_pooled_build_env_is_reused(
+    chdir, tmp_path, setupcfg_project, run_line, monkeypatch
+):
+    env = {
+        "MDDJ_CACHE_DIR": str(tmp_path / "cache"),
+        "MDDJ_POOL_BUILD_ENVS": "1",
+    }
+
+    with chdir(setupcfg_project):
+        run_line("mddj read version", search_stdout=r"^1\.0\.0$", env=env)
+        # one environment for build-system.requires, and one which adds the
+        # requirements that setuptools' backend reports for the build
+        run_line(
+            "mddj self cache info",
+            search_stdout=r"^build-envs:\n.*\n    entries: 2$",
+            env=env,
+        )
+
+        # a second read must build, but must not create a new environment
+        def _fail_create(*args, **kwargs):
+            raise AssertionError("build environment was recreated")
+
+        monkeypatch.setattr(_build_envs.BuildEnvPool, "_create", _fail_create)
+        run_line("mddj read name", search_stdout=r"^foopkg$", env=env)
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def projects(tmp_path):
+    for name, version in (("foo", "1.0"), ("bar", "2.0")):
+        project_dir = tmp_path / name
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text(
+            f'[project]\nname = "{name}"\nversion = "{version}"\n'
+            'dependencies = ["click"]\n',
+            encoding="utf-8",
+        )
+    return tmp_path
+
+
+def test_batch_writes_a_result_for_each_request(chdir, projects, run_line):
+    requests = [
+        {"path": "foo", "fields": ["name", "version"], "id": 1},
+        {"path": "bar"},
+        {"path": "foo", "fields": ["license"]},
+    ]
+    stdin = "".join(json.dumps(r) + "\n" for r in requests)
+
+    with chdir(projects):
+        result = run_line("mddj batch -j 2", stdin=stdin)
+
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        {
+            "id": 1,
+            "path": "foo",
+            "values": {"name": "foo", "version": "1.0"},
+            "errors": {},
+            "built": False,
+        },
+        {
+            "path": "bar",
+            "values": {
+                "name": "bar",
+                "version": "2.0",
+                "requires-python": None,
+                "dependencies": ["click"],
+            },
+            "errors": {},
+            "built": False,
+        },
+        {
+            "path": "foo",
+            "values": {},
+            "errors": {
+                "license": {
+                    "type": "ValueError",
+                    "message": "Unsupported field: license",
+                }
+            },
+            "built": False,
+        },
+    ]
+
+
+def test_batch_in_completion_order(chdir, projects, run_line):
+    stdin = '{"path": "foo", "id": "a"}\n{"path": "bar", "id": "b"}\n'
+
+    with chdir(projects):
+        result = run_line("mddj batch --order completion", stdin=stdin)
+
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(r["id"] for r in results) == ["a", "b"]
+
+
+def test_batch_reports_invalid_requests(chdir, projects, run_line):
+    stdin = 'not json\n{"path": "foo", "fields": ["name"]}\n{"fields": "name"}\n'
+
+    with chdir(projects):
+        result = run_line(
+            "mddj batch",
+            stdin=stdin,
+            assert_exit_code=1,
+            search_stderr=r"line 3: invalid request: 'path' must be a string",
+        )
+
+    assert "line 1: invalid request" in result.stderr
+    (line,) = result.stdout.splitlines()
+    assert json.loads(line)["values"] == {"name": "foo"}
@@ -0,0 +1,80 @@
+import json
+import pathlib
+import socket
+import tempfile
+import threading
+from unittest import mock
+
+import pytest
+
+from mddj.api import DJConfig
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # socket paths are limited to around 100 characters, so keep them short
+    with tempfile.TemporaryDirectory(prefix="mddj-") as tmpdir:
+        yield pathlib.Path(tmpdir) / "d.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    from mddj.api._daemon_server import DaemonServer
+
+    server = DaemonServer(socket_path, config=DJConfig(), idle_timeout=3600)
+    server.timeout = 0.05
+    server.respond = mock.Mock(wraps=server.respond)
+    thread = threading.Thread(target=server.serve_until_idle)
+    thread.start()
+    yield server
+
+    server.idle_timeout = 0
+    thread.join(timeout=10)
+    server.server_close()
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "mypkg"\nversion = "1.2.4"\nrequires-python = ">=3.10"\n',
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_read_commands_use_the_daemon(chdir, project, socket_path, daemon, run_line):
+    env = {"MDDJ_DAEMON": str(socket_path)}
+    with chdir(project):
+        run_line("mddj read name", search_stdout=r"^mypkg$", env=env)
+        run_line(
+            "mddj read requires-python --lower-bound", search_stdout=r"^3.10$", env=env
+        )
+        result = run_line("mddj read fields name version", env=env)
+
+    assert json.loads(result.stdout) == {"name": "mypkg", "version": "1.2.4"}
+    assert daemon.respond.call_count == 3
+
+
+def test_read_commands_work_without_a_daemon(chdir, project, socket_path, run_line):
+    with chdir(project):
+        run_line(
+            "mddj read version",
+            search_stdout=r"^1.2.4$",
+            env={"MDDJ_DAEMON": str(socket_path)},
+        )
+
+
+def test_serve_refuses_to_replace_other_files(tmp_path, run_line):
+    path = tmp_path / "not-a-socket"
+    path.touch()
+
+    run_line(
+        ["mddj", "serve", "--socket", str(path)],
+        assert_exit_code=1,
+        search_stderr="is not a socket",
+    )
+    assert path.exists()
@@ -0,0 +1,24 @@
+import pytest
+
+from mddj._internal import _stats
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    yield
+    _stats.reset()
+
+
+def test_stats_flag_prints_table_to_stderr(chdir, tmp_path, run_line):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "foo"\nversion = "1"\n')
+
+    with chdir(tmp_path):
+        result = run_line(
+            "mddj --stats read version",
+            search_stderr=[
+                r"cache\s+hits\s+misses\s+time \(s\)",
+                r"Reader\.version\s+0\s+1",
+            ],
+        )
+
+    assert result.stdout == "1\n"
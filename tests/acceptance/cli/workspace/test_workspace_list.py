@@ -0,0 +1,30 @@
+from textwrap import dedent as d
+
+
+def test_workspace_list(chdir, tmp_path, run_line):
+    (tmp_path / "pyproject.toml").write_text(d("""\
+        [tool.uv.workspace]
+        members = ["packages/*"]
+        """))
+    for name in ("b", "a"):
+        package_dir = tmp_path / "packages" / name
+        package_dir.mkdir(parents=True)
+        (package_dir / "pyproject.toml").write_text(f"[project]\nname = '{name}'\n")
+
+    with chdir(tmp_path / "packages" / "b"):
+        result = run_line("mddj workspace list")
+
+    packages = tmp_path / "packages"
+    assert result.stdout == f"{packages / 'a'}\n{packages / 'b'}\n"
+
+
+def test_workspace_list_without_workspace(chdir, tmp_path, run_line):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'a'\n")
+
+    with chdir(tmp_path):
+        run_line(
+            "mddj workspace list",
+            assert_exit_code=1,
+            search_stderr="matched the 'workspace' rule",
+        )
@@ -14,14 +14,13 @@ def test_read_python_requires_with_full_build_output_shows_all_data(
 
             author = Foo
             author_email = foo@example.org
-
-            [options]
-            python_requires = >=3.10
             """),
         encoding="utf-8",
     )
+    # setting metadata in setup.py ensures that reading it requires a build
     (tmp_path / "setup.py").write_text(
-        "from setuptools import setup; setup()\n", encoding="utf-8"
+        "from setuptools import setup; setup(python_requires='>=3.10')\n",
+        encoding="utf-8",
     )
     (tmp_path / "foopkg.py").touch()
 
@@ -0,0 +1,46 @@
+"""
+Benchmark the startup of the CLI, by running ``mddj read name`` on a project
+with a static name in a new process.
+
+Run with ``tox -e benchmark`` or ``python tests/benchmarks/<this file>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import subprocess
+import sys
+import tempfile
+import timeit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = pathlib.Path(tmp)
+        (project_dir / "pyproject.toml").write_text(
+            '[project]\nname = "foo"\nversion = "1.0"\n'
+        )
+
+        for label, command in (
+            ("python -c pass", [sys.executable, "-c", "pass"]),
+            ("mddj --help", [sys.executable, "-m", "mddj", "--help"]),
+            ("mddj read name", [sys.executable, "-m", "mddj", "read", "name"]),
+        ):
+
+            def run() -> None:
+                subprocess.run(
+                    command, cwd=project_dir, check=True, stdout=subprocess.DEVNULL
+                )
+
+            best = min(timeit.repeat(run, repeat=args.repeat, number=args.number))
+            print(f"{label}: {best / args.number * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
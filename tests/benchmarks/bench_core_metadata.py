@@ -0,0 +1,84 @@
+"""
+Benchmark reading fields from a large METADATA file with mddj's Core Metadata
+parser, compared with the ``email`` based parser of ``importlib.metadata``.
+
+Run with ``tox -e benchmark`` or ``python tests/benchmarks/<this file>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.metadata
+import os
+import pathlib
+import timeit
+import typing as t
+
+from mddj._internal._core_metadata import CoreMetadata
+
+
+class _TextDistribution(importlib.metadata.Distribution):
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    def read_text(self, filename: str) -> str | None:
+        return self._text if filename == "METADATA" else None
+
+    def locate_file(self, path: str | os.PathLike[str]) -> pathlib.Path:
+        raise NotImplementedError
+
+
+def make_metadata(num_requires: int, description_kb: int) -> str:
+    lines = ["Metadata-Version: 2.4", "Name: big-package", "Version: 1.0"]
+    lines.append("Summary: a package with a lot of metadata")
+    lines.extend(f"Classifier: Topic :: Topic {i}" for i in range(50))
+    lines.extend(f"Provides-Extra: extra-{i}" for i in range(40))
+    lines.extend(
+        f"Requires-Dist: dep-{i}>=1.0; extra == 'extra-{i % 40}'"
+        for i in range(num_requires)
+    )
+    lines.append("Description-Content-Type: text/markdown")
+    paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 16
+    body = "\n\n".join(
+        paragraph for _ in range(description_kb * 1024 // len(paragraph))
+    )
+    return "\n".join(lines) + "\n\n" + body + "\n"
+
+
+def read_fields(metadata: t.Any) -> None:
+    metadata.get("Name")
+    metadata.get("Version")
+    metadata.get("Summary")
+    metadata.get("Requires-Python")
+    metadata.get("Keywords")
+    metadata.get("Author")
+    metadata.get("Author-email")
+    metadata.get_all("Classifier", ())
+    metadata.get_all("Provides-Extra", ())
+    metadata.get_all("Requires-Dist", ())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requires", type=int, default=600)
+    parser.add_argument("--description-kb", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    text = make_metadata(args.requires, args.description_kb)
+    print(f"{len(text) // 1024} KB of METADATA, {args.requires} Requires-Dist entries")
+    for label, parse in (
+        ("importlib.metadata", lambda: _TextDistribution(text).metadata),
+        ("CoreMetadata", lambda: CoreMetadata(text)),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda: read_fields(parse()), repeat=args.repeat, number=args.number
+            )
+        )
+        print(f"  {label}: {best / args.number * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
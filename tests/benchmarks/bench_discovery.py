@@ -0,0 +1,56 @@
+"""
+Benchmark discovery through ancestor directories which hold many entries, by
+listing each directory and by probing it for specific names.
+
+Run with ``tox -e benchmark`` or ``python tests/benchmarks/<this file>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import tempfile
+import timeit
+
+from mddj._internal._discovery import DirExplorer
+
+
+def make_tree(root: pathlib.Path, entries: int) -> pathlib.Path:
+    """
+    Build ``root/.git`` and ``root/big/project/src/pkg``, where ``root`` and
+    ``big`` hold ``entries`` files, and return the ``pkg`` dir.
+    """
+    (root / ".git").mkdir()
+    big = root / "big"
+    start_dir = big / "project" / "src" / "pkg"
+    start_dir.mkdir(parents=True)
+    (big / "project" / "pyproject.toml").touch()
+    for d in (root, big):
+        for i in range(entries):
+            (d / f"entry{i}").touch()
+    return start_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start_dir = make_tree(pathlib.Path(tmp), args.entries)
+        print(f"{args.entries} entries in each of 2 ancestor directories")
+        for label, probe in (("listing", False), ("probing", True)):
+
+            def search() -> None:
+                explorer = DirExplorer(start_dir, probe=probe)
+                explorer.search_for("python-package")
+                explorer.search_for("vcs-root")
+
+            best = min(timeit.repeat(search, repeat=args.repeat, number=args.number))
+            print(f"  {label}: {best / args.number * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark parsing a large pyproject.toml with ``tomllib`` (used for reads) and
+with ``tomlkit`` (used for writes), reporting parse time and the peak RSS of a
+process which holds the parsed document.
+
+Run with ``tox -e benchmark`` or ``python tests/benchmarks/<this file>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import subprocess
+import sys
+import tempfile
+import textwrap
+import timeit
+
+# (setup, statement) pairs, where the statement reads the file at `path`
+_PARSERS = {
+    "tomllib": (
+        "import tomllib",
+        "data = tomllib.loads(path.read_text(encoding='utf-8'))",
+    ),
+    "tomlkit": (
+        "import tomlkit",
+        "data = tomlkit.loads(path.read_text(encoding='utf-8'))",
+    ),
+    "mddj, [project] only": (
+        "from mddj._internal._cached_toml import TomlDocumentCache",
+        "data = TomlDocumentCache().load_table(path, 'project')",
+    ),
+}
+
+# measure the RSS of a process before and after parsing, holding the parsed data
+# (this reads /proc, so it only works on Linux)
+_RSS_SCRIPT = textwrap.dedent("""\
+    import pathlib, sys
+    {setup}
+
+    def rss():
+        with open("/proc/self/status") as fp:
+            for line in fp:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+
+    path = pathlib.Path(sys.argv[1])
+    before = rss()
+    {statement}
+    print(rss() - before)
+    """)
+
+
+def make_pyproject(num_rules: int) -> str:
+    lines = [
+        "[project]",
+        'name = "big-project"',
+        'version = "1.0.0"',
+        'dependencies = ["requests>=2", "click>=8"]',
+        "",
+        "[tool.ruff.lint]",
+        "select = [",
+        *(f'    "X{i:04d}",  # rule {i}' for i in range(num_rules)),
+        "]",
+        "",
+        "[tool.ruff.lint.per-file-ignores]",
+        *(f'"src/pkg/mod_{i}.py" = ["E501", "F401"]' for i in range(num_rules)),
+        "",
+    ]
+    for i in range(num_rules // 10):
+        lines.extend(
+            [
+                f"[tool.ruff.lint.pylint.section-{i}]",
+                f"max-args = {i}",
+                f'allow-magic-value-types = ["str", "bytes", "int-{i}"]',
+                "",
+            ]
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    content = make_pyproject(args.rules)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "pyproject.toml"
+        path.write_text(content, encoding="utf-8")
+
+        print(f"{len(content) // 1024} KB pyproject.toml")
+        for label, (setup, statement) in _PARSERS.items():
+            best = min(
+                timeit.repeat(
+                    statement,
+                    setup,
+                    repeat=args.repeat,
+                    number=args.number,
+                    globals={"path": path},
+                )
+            )
+            rss_growth = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    _RSS_SCRIPT.format(setup=setup, statement=statement),
+                    str(path),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            print(
+                f"  {label}: {best / args.number * 1000:.2f} ms, "
+                f"RSS growth {rss_growth} KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
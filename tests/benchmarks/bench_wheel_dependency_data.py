@@ -0,0 +1,70 @@
+"""
+Benchmark the partitioning of ``Requires-Dist`` into dependencies and extras,
+over synthetic METADATA for a large meta-package.
+
+Run with ``tox -e benchmark`` or ``python tests/benchmarks/<this file>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from mddj._internal._wheel_metadata import (
+    load_wheel_dependency_data,
+    parse_package_metadata,
+)
+
+_MARKERS = (
+    "extra == '{extra}'",
+    'python_version < "3.12" and extra == "{extra}"',
+    'extra == "{extra}" and (os_name == "nt" or sys_platform == "darwin")',
+    "extra == '{extra}' or extra == '{other}'",
+    '(extra == "{extra}" or extra == "{other}") and python_version >= "3.10"',
+)
+
+
+def make_metadata(num_extras: int, num_requires: int) -> str:
+    extras = [f"extra-{i}" for i in range(num_extras)]
+    lines = ["Metadata-Version: 2.4", "Name: meta-package", "Version: 1.0"]
+    lines.extend(f"Provides-Extra: {extra}" for extra in extras)
+    for i in range(num_requires):
+        if i % 10 == 0:
+            lines.append(f"Requires-Dist: dep-{i}>=1.0")
+            continue
+        marker = _MARKERS[i % len(_MARKERS)].format(
+            extra=extras[i % num_extras], other=extras[(i * 7) % num_extras]
+        )
+        lines.append(f"Requires-Dist: dep-{i}[feature]>={i}.0; {marker}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--extras", type=int, default=40)
+    parser.add_argument("--requires", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    metadata = parse_package_metadata(make_metadata(args.extras, args.requires))
+
+    def _partition() -> None:
+        load_wheel_dependency_data(metadata)
+
+    def _partition_and_clean() -> None:
+        data = load_wheel_dependency_data(metadata)
+        for extra in data.cleaned_extras:
+            data.cleaned_extras[extra]
+
+    print(f"{args.extras} extras, {args.requires} Requires-Dist entries")
+    for label, func in (
+        ("partition", _partition),
+        ("partition + cleaned extras", _partition_and_clean),
+    ):
+        best = min(timeit.repeat(func, repeat=args.repeat, number=args.number))
+        print(f"  {label}: {best / args.number * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
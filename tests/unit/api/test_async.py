@@ -0,0 +1,171 @@
+import asyncio
+import os
+import pathlib
+import time
+from textwrap import dedent as d
+
+import pytest
+
+import mddj
+from mddj.api import AsyncDJ, DJConfig, MetadataBuildError
+
+BUILD_SYSTEM = d("""\
+    [build-system]
+    requires = ["setuptools"]
+    build-backend = "setuptools.build_meta"
+    [project]
+    name = "foo"
+    dynamic = ["version", "dependencies"]
+    """)
+
+
+@pytest.fixture
+def make_dj(tmp_path):
+    def func(setup_py=None, pyproject=BUILD_SYSTEM, **kwargs):
+        (tmp_path / "pyproject.toml").write_text(pyproject)
+        if setup_py is not None:
+            pytest.importorskip("setuptools")
+            (tmp_path / "setup.py").write_text(setup_py)
+            (tmp_path / "foo.py").touch()
+        config = DJConfig(
+            discovery_start_dir=tmp_path,
+            isolated_builds=False,
+            cache_dir=tmp_path / "cache",
+            cache_metadata=False,
+        )
+        return AsyncDJ(config, **kwargs)
+
+    return func
+
+
+def _pid_is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # killed processes whose parent has exited may linger until they are reaped
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return True
+
+
+def _wait_for_exit(pid):
+    deadline = time.monotonic() + 5
+    while _pid_is_running(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return not _pid_is_running(pid)
+
+
+def test_async_read_of_static_fields(make_dj):
+    dj = make_dj(
+        pyproject='[project]\nname = "foo"\nversion = "1.0"\nkeywords = ["a"]\n'
+    )
+
+    async def main():
+        return await asyncio.gather(
+            dj.read.name(), dj.read.version(), dj.read.keywords(), dj.read.version()
+        )
+
+    assert asyncio.run(main()) == ["foo", "1.0", ("a",), "1.0"]
+
+
+def test_async_reads_share_one_build(make_dj, tmp_path):
+    counter = tmp_path / "builds.txt"
+    dj = make_dj(d(f"""\
+        import pathlib
+        from setuptools import setup
+        with pathlib.Path({str(counter)!r}).open("a") as f:
+            f.write("build\\n")
+        setup(version="2." + "0", install_requires=["bar"])
+        """))
+
+    async def main():
+        return await asyncio.gather(
+            dj.read.version(), dj.read.dependencies(), dj.read.name()
+        )
+
+    assert asyncio.run(main()) == ["2.0", ("bar",), "foo"]
+    # setuptools runs setup.py once per build hook
+    builds = counter.read_text().count("build")
+    assert builds >= 1
+
+    # later reads use the built metadata
+    assert asyncio.run(dj.read.version()) == "2.0"
+    assert counter.read_text().count("build") == builds
+
+
+def test_async_builds_do_not_inherit_the_mddj_import_path(make_dj, tmp_path):
+    seen = tmp_path / "pythonpath.txt"
+    dj = make_dj(d(f"""\
+        import os, pathlib
+        from setuptools import setup
+        pathlib.Path({str(seen)!r}).write_text(os.environ.get("PYTHONPATH", ""))
+        setup(version="2." + "0")
+        """))
+
+    assert asyncio.run(dj.read.version()) == "2.0"
+    package_parent = str(pathlib.Path(mddj.__file__).parent.parent)
+    assert package_parent not in seen.read_text().split(os.pathsep)
+
+
+def test_async_build_failure(make_dj):
+    dj = make_dj("raise RuntimeError('broken build')\n")
+
+    with pytest.raises(MetadataBuildError, match="The metadata build failed"):
+        asyncio.run(dj.read.version())
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="requires process groups")
+def test_async_build_timeout_kills_build(make_dj, tmp_path):
+    pid_file = tmp_path / "pid.txt"
+    dj = make_dj(
+        d(f"""\
+            import os, pathlib, time
+            pathlib.Path({str(pid_file)!r} + ".tmp").write_text(str(os.getpid()))
+            os.replace({str(pid_file)!r} + ".tmp", {str(pid_file)!r})
+            time.sleep(60)
+            """),
+        build_timeout=10,
+    )
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        asyncio.run(dj.read.version())
+    assert time.monotonic() - start < 40
+
+    # the build backend, which is a grandchild of the worker, was killed too
+    assert _wait_for_exit(int(pid_file.read_text()))
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="requires process groups")
+def test_async_cancellation_kills_build(make_dj, tmp_path):
+    pid_file = tmp_path / "pid.txt"
+    dj = make_dj(d(f"""\
+        import os, pathlib, time
+        pathlib.Path({str(pid_file)!r} + ".tmp").write_text(str(os.getpid()))
+        os.replace({str(pid_file)!r} + ".tmp", {str(pid_file)!r})
+        time.sleep(60)
+        """))
+
+    async def main():
+        first = asyncio.ensure_future(dj.read.version())
+        second = asyncio.ensure_future(dj.read.dependencies())
+        while not pid_file.exists():
+            await asyncio.sleep(0.05)
+        pid = int(pid_file.read_text())
+
+        # the build continues while any read is waiting for it
+        first.cancel()
+        await asyncio.sleep(0.2)
+        assert _pid_is_running(pid)
+
+        second.cancel()
+        for task in (first, second):
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        return pid
+
+    pid = asyncio.run(asyncio.wait_for(main(), 30))
+    assert _wait_for_exit(pid)
@@ -0,0 +1,257 @@
+import itertools
+import threading
+import time
+import types
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal import _stats, _wheel_metadata
+from mddj.api import DJConfig, _batch, read_many, read_stream
+from mddj.api.reader import MissingRequiredField
+from mddj.api.reader._errors import BuildRequired
+
+BUILD_SYSTEM = d("""\
+    [build-system]
+    requires = ["setuptools"]
+    build-backend = "setuptools.build_meta"
+    """)
+
+
+@pytest.fixture
+def make_project(tmp_path):
+    def func(name, pyproject, setup_py=None):
+        project_dir = tmp_path / name
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text(pyproject)
+        if setup_py is not None:
+            (project_dir / "setup.py").write_text(setup_py)
+            (project_dir / f"{name}.py").touch()
+        return project_dir
+
+    return func
+
+
+@pytest.fixture
+def config(tmp_path):
+    return DJConfig(
+        isolated_builds=False, cache_dir=tmp_path / "cache", cache_metadata=False
+    )
+
+
+def test_read_many_static_projects_collects_errors(make_project, config):
+    static = make_project(
+        "static",
+        '[project]\nname = "static"\nversion = "1.0"\nauthors = [{name = "A"}]\n',
+    )
+    unversioned = make_project("unversioned", '[project]\nname = "unversioned"\n')
+
+    results = list(
+        read_many([static, unversioned], ["version", "name", "authors"], config=config)
+    )
+
+    assert [r.path for r in results] == [static, unversioned]
+    assert not any(r.built for r in results)
+    assert list(results[0].values) == ["version", "name", "authors"]
+    assert results[0].values["authors"] == (types.MappingProxyType({"name": "A"}),)
+    assert dict(results[1].values) == {"name": "unversioned", "authors": ()}
+    assert isinstance(results[1].errors["version"], MissingRequiredField)
+
+
+def test_read_many_builds_in_worker_processes(make_project, config):
+    pytest.importorskip("setuptools")
+    static = make_project("static", '[project]\nname = "static"\nversion = "1.0"\n')
+    built = make_project(
+        "built",
+        BUILD_SYSTEM + '[project]\nname = "built"\ndynamic = ["version"]\n',
+        setup_py='from setuptools import setup\nsetup(version="2." + "0")\n',
+    )
+    broken = make_project(
+        "broken",
+        BUILD_SYSTEM + '[project]\nname = "broken"\ndynamic = ["version"]\n',
+        setup_py="raise RuntimeError('broken build')\n",
+    )
+
+    results = {
+        r.path: r
+        for r in read_many(
+            [built, broken, static], ["name", "version"], workers=2, config=config
+        )
+    }
+
+    assert not results[static].built
+    assert results[built].built
+    assert dict(results[built].values) == {"name": "built", "version": "2.0"}
+    assert not results[built].errors
+    assert dict(results[broken].values) == {"name": "broken"}
+    error = results[broken].errors["version"]
+    assert not isinstance(error, BuildRequired)
+    assert "BuildBackendException" in str(error)
+
+
+def test_read_many_yields_builds_before_reading_every_path(make_project, config):
+    pytest.importorskip("setuptools")
+    static = make_project("static", '[project]\nname = "static"\nversion = "1.0"\n')
+    built = make_project(
+        "built",
+        BUILD_SYSTEM + '[project]\nname = "built"\ndynamic = ["version"]\n',
+        setup_py='from setuptools import setup\nsetup(version="2." + "0")\n',
+    )
+    build_yielded = threading.Event()
+    paths_exhausted_after_build = []
+
+    def paths():
+        yield built
+        # static projects are read until the build's result has been yielded
+        deadline = time.monotonic() + 60
+        while not build_yielded.is_set() and time.monotonic() < deadline:
+            yield static
+        paths_exhausted_after_build.append(build_yielded.is_set())
+
+    for result in read_many(paths(), ["version"], workers=1, config=config):
+        if result.built:
+            assert result.values["version"] == "2.0"
+            build_yielded.set()
+
+    assert paths_exhausted_after_build == [True]
+
+
+def test_read_many_rejects_unknown_fields(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported fields for read_many: bogus"):
+        list(read_many([tmp_path], ["name", "bogus"]))
+
+
+def test_read_stream_reads_the_fields_of_each_request(make_project, config):
+    foo = make_project("foo", '[project]\nname = "foo"\nversion = "1.0"\n')
+    bar = make_project("bar", '[project]\nname = "bar"\n')
+
+    results = list(
+        read_stream(
+            [(foo, ["version", "name"]), (bar, ["version", "license"]), (foo, [])],
+            workers=2,
+            config=config,
+        )
+    )
+
+    assert [r.path for r in results] == [foo, bar, foo]
+    assert dict(results[0].values) == {"version": "1.0", "name": "foo"}
+    assert isinstance(results[1].errors["version"], MissingRequiredField)
+    assert isinstance(results[1].errors["license"], ValueError)
+    assert results[2].values == {} and results[2].errors == {}
+    assert not any(r.built for r in results)
+    assert all(r.tag is None for r in results)
+
+
+def test_read_stream_returns_the_tag_of_each_request(make_project, config):
+    foo = make_project("foo", '[project]\nname = "foo"\n')
+    # equal paths are told apart by their tags, even when results are unordered
+    requests = [(foo, ["name"], {"id": n}) for n in range(8)]
+
+    results = read_stream(
+        [*requests, (foo, ["name"])], workers=4, ordered=False, config=config
+    )
+    tags = [r.tag for r in results]
+    assert sorted(tag["id"] for tag in tags if tag is not None) == list(range(8))
+    assert tags.count(None) == 1
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+def test_read_stream_result_order(make_project, config, monkeypatch, ordered):
+    slow = make_project("slow", '[project]\nname = "slow"\n')
+    fast = make_project("fast", '[project]\nname = "fast"\n')
+
+    # the slow project is held until the fast one has been yielded, or, if results
+    # are ordered, until the fast one has been read
+    release_slow = threading.Event()
+    read_request = _batch._read_request
+
+    def fake_read_request(dj, path, fields, tag):
+        if path == slow:
+            assert release_slow.wait(timeout=10)
+        result = read_request(dj, path, fields, tag)
+        if path == fast and ordered:
+            release_slow.set()
+        return result
+
+    monkeypatch.setattr(_batch, "_read_request", fake_read_request)
+
+    results = read_stream(
+        [(slow, ["name"]), (fast, ["name"])], workers=2, ordered=ordered, config=config
+    )
+    paths = [next(results).path]
+    release_slow.set()
+    paths.extend(r.path for r in results)
+    assert paths == ([slow, fast] if ordered else [fast, slow])
+
+
+def test_read_stream_consumes_requests_as_needed(make_project, config):
+    foo = make_project("foo", '[project]\nname = "foo"\n')
+
+    results = read_stream(itertools.repeat((foo, ["name"])), workers=2, config=config)
+    for result in itertools.islice(results, 5):
+        assert result.values == {"name": "foo"}
+    results.close()
+
+
+def test_read_stream_shares_discovery_between_projects(make_project, config, tmp_path):
+    (tmp_path / ".git").mkdir()
+    names = [f"pkg{i}" for i in range(16)]
+    projects = [make_project(name, f'[project]\nname = "{name}"\n') for name in names]
+
+    _stats.reset()
+    try:
+        config.collect_stats = True
+        results = list(
+            read_stream(
+                [(project, ["name"]) for project in projects],
+                workers=8,
+                ordered=False,
+                config=config,
+            )
+        )
+        listings = {c.name: c for c in _stats.snapshot()}["DiscoveryNode._dir_contents"]
+    finally:
+        _stats.reset()
+    assert sorted(r.values["name"] for r in results) == sorted(names)
+    # the common parent is listed once, even by concurrent reads
+    assert listings.misses == len(projects) + 1
+
+
+def test_read_stream_sees_changed_files(make_project, config, monkeypatch):
+    foo = make_project("foo", '[project]\nname = "foo"\nversion = "1.0"\n')
+    first_read = threading.Event()
+    read_request = _batch._read_request
+
+    def fake_read_request(dj, path, fields, tag):
+        result = read_request(dj, path, fields, tag)
+        first_read.set()
+        return result
+
+    monkeypatch.setattr(_batch, "_read_request", fake_read_request)
+
+    def requests():
+        yield foo, ["version"]
+        assert first_read.wait(timeout=10)
+        (foo / "pyproject.toml").write_text(
+            '[project]\nname = "foo"\nversion = "10.0"\n'
+        )
+        yield foo, ["version"]
+
+    results = read_stream(requests(), workers=1, config=config)
+    assert [r.values["version"] for r in results] == ["1.0", "10.0"]
+
+
+def test_read_stream_records_builds(make_project, config, monkeypatch):
+    dynamic = make_project(
+        "dynamic",
+        '[project]\nname = "dynamic"\ndynamic = ["version"]\n' + BUILD_SYSTEM,
+    )
+    monkeypatch.setattr(
+        _wheel_metadata,
+        "_build_metadata_text",
+        lambda *args: "Metadata-Version: 2.1\nName: dynamic\nVersion: 2.0\n",
+    )
+
+    (result,) = read_stream([(dynamic, ["name", "version"])], config=config)
+    assert result.built
+    assert dict(result.values) == {"name": "dynamic", "version": "2.0"}
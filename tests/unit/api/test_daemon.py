@@ -0,0 +1,206 @@
+import concurrent.futures
+import pathlib
+import socket
+import tempfile
+import threading
+import types
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal import _wheel_metadata
+from mddj.api import DJConfig
+from mddj.api._daemon import DaemonClient
+from mddj.api.reader import MissingRequiredField, Snapshot
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # socket paths are limited to around 100 characters, so keep them short
+    with tempfile.TemporaryDirectory(prefix="mddj-") as tmpdir:
+        yield pathlib.Path(tmpdir) / "d.sock"
+
+
+@pytest.fixture
+def cache_metadata():
+    return False
+
+
+@pytest.fixture
+def daemon(socket_path, tmp_path, cache_metadata):
+    from mddj.api._daemon_server import DaemonServer
+
+    config = DJConfig(cache_dir=tmp_path / "cache", cache_metadata=cache_metadata)
+    server = DaemonServer(socket_path, config=config, idle_timeout=3600)
+    server.timeout = 0.05
+    thread = threading.Thread(target=server.serve_until_idle)
+    thread.start()
+    yield server
+
+    server.idle_timeout = 0
+    thread.join(timeout=10)
+    server.server_close()
+
+
+@pytest.fixture
+def connect(socket_path, daemon):
+    clients = []
+
+    def func():
+        client = DaemonClient(socket_path)
+        assert client.connect()
+        clients.append(client)
+        return client
+
+    yield func
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def project(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "pyproject.toml").write_text(
+        d("""\
+            [project]
+            name = "mypkg"
+            version = "1.0"
+            dependencies = ["foo", "bar"]
+
+            [project.optional-dependencies]
+            cli = ["click"]
+            """),
+        encoding="utf-8",
+    )
+    return project_dir
+
+
+def test_daemon_returns_values_with_the_types_of_a_local_reader(connect, project):
+    client = connect()
+
+    assert client.call(project, ("name",)) == "mypkg"
+    assert client.call(project, ("dependencies",)) == ("foo", "bar")
+    optional_dependencies = client.call(project, ("optional_dependencies",))
+    assert isinstance(optional_dependencies, types.MappingProxyType)
+    assert dict(optional_dependencies) == {"cli": ("click",)}
+    assert client.call(project, ("static", "version")) == "1.0"
+
+    snapshot = client.call(project, ("snapshot",), (["version", "dependencies"],))
+    assert snapshot == Snapshot(
+        fields=("version", "dependencies"), version="1.0", dependencies=("foo", "bar")
+    )
+
+
+def test_daemon_sees_changed_files(connect, project):
+    client = connect()
+    assert client.call(project, ("version",)) == "1.0"
+
+    pyproject = project / "pyproject.toml"
+    pyproject.write_text(
+        pyproject.read_text(encoding="utf-8").replace("1.0", "10.0"),
+        encoding="utf-8",
+    )
+    assert client.call(project, ("version",)) == "10.0"
+
+
+def test_daemon_raises_errors_in_the_client(connect, tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "mypkg"\n', encoding="utf-8"
+    )
+    client = connect()
+
+    with pytest.raises(MissingRequiredField, match="No 'version' found"):
+        client.call(tmp_path, ("version",))
+    with pytest.raises(ValueError, match="Unsupported method"):
+        client.call(tmp_path, ("_is_dynamic",), ("version",))
+    # the connection is still usable after an error
+    assert client.call(tmp_path, ("name",)) == "mypkg"
+
+
+@pytest.fixture
+def versioned_project(tmp_path, monkeypatch):
+    """A project whose setup.py reads its version from a file, and a list of builds."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "setup.py").write_text(
+        d("""\
+            from setuptools import setup
+            setup(name="foopkg", version=open("VERSION").read().strip())
+            """),
+        encoding="utf-8",
+    )
+    (project_dir / "VERSION").write_text("1.0\n", encoding="utf-8")
+    builds = []
+
+    def fake_build(source_dir, *args):
+        builds.append(source_dir)
+        version = (source_dir / "VERSION").read_text(encoding="utf-8").strip()
+        return f"Metadata-Version: 2.1\nName: foopkg\nVersion: {version}\n"
+
+    monkeypatch.setattr(_wheel_metadata, "_build_metadata_text", fake_build)
+    return project_dir, builds
+
+
+def test_daemon_rebuilds_when_build_inputs_change(connect, versioned_project):
+    project_dir, builds = versioned_project
+    assert connect().call(project_dir, ("version",)) == "1.0"
+
+    # a file which only setup.py reads, and which no cache key covers
+    (project_dir / "VERSION").write_text("2.0\n", encoding="utf-8")
+    assert connect().call(project_dir, ("version",)) == "2.0"
+    assert builds == [project_dir, project_dir]
+
+
+@pytest.mark.parametrize("cache_metadata", [True])
+def test_daemon_keeps_build_results_when_caching_metadata(connect, versioned_project):
+    project_dir, builds = versioned_project
+
+    assert connect().call(project_dir, ("name",)) == "foopkg"
+    assert connect().call(project_dir, ("version",)) == "1.0"
+    assert builds == [project_dir]
+
+
+def test_daemon_serves_concurrent_clients(connect, project):
+    clients = [connect() for _ in range(8)]
+
+    with concurrent.futures.ThreadPoolExecutor(len(clients)) as executor:
+        names = list(
+            executor.map(lambda client: client.call(project, ("name",)), clients)
+        )
+    assert names == ["mypkg"] * len(clients)
+
+
+def test_serve_exits_when_idle(socket_path):
+    from mddj.api._daemon_server import serve
+
+    # a socket left behind by a daemon which has exited is replaced
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    serve(socket_path, config=DJConfig(), idle_timeout=0.2)
+    assert not socket_path.exists()
+
+
+def test_serve_refuses_to_start_twice(socket_path, daemon):
+    from mddj.api._daemon_server import serve
+
+    with pytest.raises(FileExistsError, match="already listening"):
+        serve(socket_path, config=DJConfig(), idle_timeout=0.1)
+    assert socket_path.exists()
+
+
+def test_serve_does_not_replace_other_files(tmp_path):
+    from mddj.api._daemon_server import serve
+
+    path = tmp_path / "not-a-socket"
+    path.write_text("keep me", encoding="utf-8")
+
+    with pytest.raises(FileExistsError, match="is not a socket"):
+        serve(path, config=DJConfig(), idle_timeout=0.1)
+    assert path.read_text(encoding="utf-8") == "keep me"
@@ -3,8 +3,8 @@ from unittest import mock
 
 import pytest
 
-from mddj._internal import _cached_toml, _discovery
-from mddj.api.reader import _ReaderImplementation
+from mddj._internal import _cached_toml, _discovery, _wheel_metadata
+from mddj.api.reader import MissingRequiredField, _ReaderImplementation
 from mddj.api.reader.dynamic_package import DynamicPackageReader
 
 
@@ -162,3 +162,151 @@ def test_metadata_reader_pulls_dynamic_dependencies_and_handles_extras(
         "better-tracebacks; extra == 'cli'",
     }
     assert set(extras_exact["pretty"]) == {"better-tracebacks; extra == 'pretty'"}
+
+
+def _forbid_builds(monkeypatch):
+    class _NoBuild:
+        def __get__(self, instance, owner):
+            pytest.fail("a build was attempted")
+
+    monkeypatch.setattr(DynamicPackageReader, "_wheel_package_metadata", _NoBuild())
+
+
+@pytest.mark.parametrize(
+    ("read_method", "expect_result"),
+    [
+        ("authors", ()),
+        ("classifiers", ()),
+        ("dependencies", ()),
+        ("description", None),
+        ("import_names", ()),
+        ("import_namespaces", ()),
+        ("keywords", ()),
+        ("maintainers", ()),
+        ("optional_dependencies", {}),
+        ("requires_python", None),
+    ],
+)
+def test_metadata_reader_does_not_build_for_fields_which_are_not_dynamic(
+    pyproject_path, reader_config, monkeypatch, read_method, expect_result
+):
+    pyproject_path.write_text(
+        d("""\
+            [project]
+            name = "foopkg"
+            dynamic = ["version"]
+            """),
+        encoding="utf-8",
+    )
+    _forbid_builds(monkeypatch)
+
+    reader = _make_reader(reader_config)
+    assert getattr(reader, read_method)() == expect_result
+
+
+def test_metadata_reader_missing_required_field_which_is_not_dynamic(
+    pyproject_path, reader_config, monkeypatch
+):
+    pyproject_path.write_text('[project]\nname = "foopkg"\n', encoding="utf-8")
+    _forbid_builds(monkeypatch)
+
+    reader = _make_reader(reader_config)
+    with pytest.raises(MissingRequiredField, match="No 'version' found"):
+        reader.version()
+
+
+@pytest.mark.parametrize(
+    "pyproject_content",
+    (
+        pytest.param('[project]\nname = "foopkg"\n', id="not-dynamic"),
+        pytest.param("[tool.foo]\nbar = 1\n", id="no-project-table"),
+    ),
+)
+@pytest.mark.parametrize("trust_project_dynamic", (True, False))
+def test_metadata_reader_builds_when_dynamic_cannot_be_trusted(
+    pyproject_path,
+    reader_config,
+    monkeypatch,
+    pyproject_content,
+    trust_project_dynamic,
+):
+    pyproject_path.write_text(pyproject_content, encoding="utf-8")
+    monkeypatch.setattr(
+        DynamicPackageReader, "_wheel_package_metadata", make_fake_package_metadata()
+    )
+
+    reader_config.trust_project_dynamic = trust_project_dynamic
+    reader = _make_reader(reader_config)
+
+    expect_build = not trust_project_dynamic or "[project]" not in pyproject_content
+    if expect_build:
+        assert reader.keywords() == ("networking", "cli", "big data")
+    else:
+        assert reader.keywords() == ()
+
+
+def test_snapshot_reads_requested_fields_in_order(pyproject_path, reader_config):
+    pyproject_path.write_text(
+        d("""\
+            [project]
+            name = "foopkg"
+            version = "1.0.0"
+            requires-python = ">=3.10"
+            dependencies = ["bar"]
+            """),
+        encoding="utf-8",
+    )
+
+    snapshot = _make_reader(reader_config).snapshot(
+        ["version", "name", "keywords", "version"]
+    )
+    assert snapshot.fields == ("version", "name", "keywords")
+    assert snapshot.as_dict() == {"version": "1.0.0", "name": "foopkg", "keywords": ()}
+    # fields which were not requested are not read
+    assert snapshot.dependencies is None
+
+    default_snapshot = _make_reader(reader_config).snapshot()
+    assert default_snapshot.as_dict() == {
+        "name": "foopkg",
+        "version": "1.0.0",
+        "requires-python": ">=3.10",
+        "dependencies": ("bar",),
+    }
+
+
+def test_snapshot_is_immutable(pyproject_path, reader_config):
+    pyproject_path.write_text('[project]\nname = "foopkg"\n', encoding="utf-8")
+
+    snapshot = _make_reader(reader_config).snapshot(["name"])
+    assert not hasattr(snapshot, "__dict__")
+    with pytest.raises(AttributeError):
+        snapshot.name = "other"
+
+
+def test_snapshot_rejects_unknown_fields(reader_config):
+    with pytest.raises(ValueError, match="Unsupported fields for snapshot: license"):
+        _make_reader(reader_config).snapshot(["name", "license"])
+
+
+def test_snapshot_builds_at_most_once(pyproject_path, reader_config, monkeypatch):
+    pyproject_path.write_text(
+        d("""\
+            [project]
+            dynamic = [
+                "name", "version", "keywords", "dependencies", "optional-dependencies"
+            ]
+            """),
+        encoding="utf-8",
+    )
+    build = mock.Mock(return_value=make_fake_package_metadata())
+    monkeypatch.setattr(_wheel_metadata, "get_package_metadata", build)
+
+    snapshot = _make_reader(reader_config).snapshot(
+        ["name", "version", "keywords", "dependencies", "optional-dependencies"]
+    )
+    assert snapshot.name == "foo"
+    assert snapshot.version == "0.0.1"
+    assert snapshot.keywords == ("networking", "cli", "big data")
+    assert snapshot.dependencies == ("bar", "baz")
+    assert dict(snapshot.optional_dependencies) == {"cli": ("colorama",)}
+    assert build.call_count == 1
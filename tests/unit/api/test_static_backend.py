@@ -0,0 +1,510 @@
+import os
+import shutil
+import subprocess
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal import _cached_toml, _discovery
+from mddj.api.reader import _ReaderImplementation
+from mddj.api.reader.dynamic_package import DynamicPackageReader
+from mddj.api.reader.static_backend import _StaticBackendReaderImplementation
+
+FLIT_PYPROJECT = d("""\
+    [build-system]
+    requires = ["flit-core"]
+    build-backend = "flit_core.buildapi"
+
+    [project]
+    name = "foo-pkg"
+    dynamic = ["version", "description"]
+    """)
+
+
+@pytest.fixture
+def make_static_backend_reader(tmp_path):
+    def _make():
+        return _StaticBackendReaderImplementation(_discovery.DirExplorer(tmp_path))
+
+    return _make
+
+
+def _forbid_builds(monkeypatch):
+    class _NoBuild:
+        def __get__(self, instance, owner):
+            pytest.fail("a build was attempted")
+
+    monkeypatch.setattr(DynamicPackageReader, "_wheel_package_metadata", _NoBuild())
+
+
+@pytest.mark.parametrize(
+    "module_path",
+    (
+        "foo_pkg.py",
+        "foo_pkg/__init__.py",
+        "src/foo_pkg.py",
+        "src/foo_pkg/__init__.py",
+    ),
+)
+def test_flit_version_and_description_are_read_from_module(
+    tmp_path, make_static_backend_reader, module_path
+):
+    (tmp_path / "pyproject.toml").write_text(FLIT_PYPROJECT, encoding="utf-8")
+    module_file = tmp_path / module_path
+    module_file.parent.mkdir(parents=True, exist_ok=True)
+    module_file.write_text(
+        d('''\
+            """
+            A package of foo.
+
+            More details follow.
+            """
+
+            __version__ = "1.02.0"
+            '''),
+        encoding="utf-8",
+    )
+
+    reader = make_static_backend_reader()
+    assert reader.build_backend() == "flit_core.buildapi"
+    # versions are normalized, as flit does
+    assert reader.version() == "1.2.0"
+    assert reader.description() == "A package of foo."
+
+
+def test_flit_module_name_can_be_set_in_tool_table(
+    tmp_path, make_static_backend_reader
+):
+    (tmp_path / "pyproject.toml").write_text(
+        FLIT_PYPROJECT + '\n[tool.flit.module]\nname = "foo"\n', encoding="utf-8"
+    )
+    (tmp_path / "foo.py").write_text('__version__ = "3.0"\n', encoding="utf-8")
+
+    assert make_static_backend_reader().version() == "3.0"
+
+
+@pytest.mark.parametrize(
+    "module_content",
+    (
+        pytest.param("from ._version import __version__\n", id="imported"),
+        pytest.param("__version__ = '.'.join(('1', '0'))\n", id="computed"),
+        pytest.param("__version__ = 'not a version'\n", id="invalid"),
+        pytest.param("def f(:\n", id="syntax-error"),
+    ),
+)
+def test_flit_version_is_unknown_when_ast_cannot_decide(
+    tmp_path, make_static_backend_reader, module_content
+):
+    (tmp_path / "pyproject.toml").write_text(FLIT_PYPROJECT, encoding="utf-8")
+    (tmp_path / "foo_pkg.py").write_text(module_content, encoding="utf-8")
+
+    assert make_static_backend_reader().version() is None
+
+
+@pytest.mark.parametrize(
+    "module_files",
+    (
+        ("foo_pkg.py", "src/foo_pkg.py"),
+        ("foo_pkg/__init__.py", "foo_pkg.py"),
+    ),
+)
+def test_flit_module_is_unknown_when_ambiguous(
+    tmp_path, make_static_backend_reader, module_files
+):
+    (tmp_path / "pyproject.toml").write_text(FLIT_PYPROJECT, encoding="utf-8")
+    for number, module_file in enumerate(module_files, 1):
+        path = tmp_path / module_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'__version__ = "{number}.0"\n', encoding="utf-8")
+
+    assert make_static_backend_reader().version() is None
+
+
+def test_non_dynamic_fields_and_other_backends_are_not_resolved(
+    tmp_path, make_static_backend_reader
+):
+    (tmp_path / "pyproject.toml").write_text(
+        FLIT_PYPROJECT.replace("flit_core.buildapi", "other.backend"),
+        encoding="utf-8",
+    )
+    (tmp_path / "foo_pkg.py").write_text(
+        '"""docs"""\n__version__ = "1.0"\n', encoding="utf-8"
+    )
+
+    reader = make_static_backend_reader()
+    assert reader.version() is None
+    assert reader.description() is None
+
+
+def test_reader_uses_flit_rules_without_building(tmp_path, chdir, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text(FLIT_PYPROJECT, encoding="utf-8")
+    (tmp_path / "foo_pkg.py").write_text(
+        '"""Foo things."""\n__version__ = "0.4.0"\n', encoding="utf-8"
+    )
+    _forbid_builds(monkeypatch)
+
+    with chdir(tmp_path):
+        reader = _ReaderImplementation(
+            _ReaderImplementation._ConfigClass(
+                dir_explorer=_discovery.DirExplorer(tmp_path),
+                document_cache=_cached_toml.TomlDocumentCache(),
+                isolated_builds=True,
+                capture_build_output=True,
+            )
+        )
+        assert reader.version() == "0.4.0"
+        assert reader.description() == "Foo things."
+
+
+SETUPTOOLS_PYPROJECT = d("""\
+    [build-system]
+    requires = ["setuptools"]
+    build-backend = "setuptools.build_meta"
+
+    [project]
+    name = "foo-pkg"
+    dynamic = [
+        "version",
+        "description",
+        "classifiers",
+        "dependencies",
+        "optional-dependencies",
+    ]
+
+    [tool.setuptools.dynamic]
+    version = {attr = "foo_pkg.__version__"}
+    description = {file = "DESCRIPTION.txt"}
+    classifiers = {file = ["classifiers.txt"]}
+    dependencies = {file = ["requirements.txt"]}
+    optional-dependencies.Test_Extra = {file = ["requirements-test.txt"]}
+    """)
+
+
+@pytest.mark.parametrize("layout", ("flat", "src"))
+def test_setuptools_pyproject_directives_are_evaluated(
+    tmp_path, make_static_backend_reader, layout
+):
+    (tmp_path / "pyproject.toml").write_text(SETUPTOOLS_PYPROJECT, encoding="utf-8")
+    package_dir = tmp_path / "foo_pkg" if layout == "flat" else tmp_path / "src/foo_pkg"
+    package_dir.mkdir(parents=True)
+    (package_dir / "__init__.py").write_text(
+        "import os\n__version__ = (1, 4, 0)\n", encoding="utf-8"
+    )
+    (tmp_path / "DESCRIPTION.txt").write_text("A foo package.\n", encoding="utf-8")
+    (tmp_path / "classifiers.txt").write_text(
+        "Typing :: Typed\n\nFramework :: Pytest\n", encoding="utf-8"
+    )
+    (tmp_path / "requirements.txt").write_text(
+        "# comment\nrequests >= 2\nclick\n", encoding="utf-8"
+    )
+    (tmp_path / "requirements-test.txt").write_text("pytest\n", encoding="utf-8")
+
+    reader = make_static_backend_reader()
+    assert reader.version() == "1.4.0"
+    assert reader.description() == "A foo package."
+    assert reader.classifiers() == ("Typing :: Typed", "Framework :: Pytest")
+    assert reader.dependencies() == ("requests>=2", "click")
+    assert reader.optional_dependencies() == {"test-extra": ("pytest",)}
+
+
+def test_setuptools_attr_which_is_not_a_literal_is_unknown(
+    tmp_path, make_static_backend_reader
+):
+    (tmp_path / "pyproject.toml").write_text(SETUPTOOLS_PYPROJECT, encoding="utf-8")
+    (tmp_path / "foo_pkg").mkdir()
+    (tmp_path / "foo_pkg" / "__init__.py").write_text(
+        "from importlib.metadata import version\n__version__ = version('foo-pkg')\n",
+        encoding="utf-8",
+    )
+
+    assert make_static_backend_reader().version() is None
+
+
+def test_setuptools_file_directive_cannot_leave_project(
+    tmp_path, make_static_backend_reader
+):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "pyproject.toml").write_text(
+        SETUPTOOLS_PYPROJECT.replace("DESCRIPTION.txt", "../secret.txt"),
+        encoding="utf-8",
+    )
+    (tmp_path / "secret.txt").write_text("secret\n", encoding="utf-8")
+
+    reader = _StaticBackendReaderImplementation(_discovery.DirExplorer(project_dir))
+    assert reader.description() is None
+
+
+SETUP_CFG = d("""\
+    [metadata]
+    name = foo-pkg
+    version = attr: foo_pkg.VERSION
+    summary = A foo package.
+    keywords = foo, bar
+    classifiers =
+        Typing :: Typed
+        Framework :: Pytest
+
+    [options]
+    package_dir =
+        =lib
+    python_requires = >=3.10
+    install_requires =
+        requests>=2
+        click; python_version < "4"
+
+    [options.extras_require]
+    test = pytest; coverage
+    """)
+
+
+@pytest.mark.parametrize(
+    "setup_py",
+    (
+        "from setuptools import setup\nsetup()\n",
+        "import setuptools\n\nif __name__ == '__main__':\n    setuptools.setup()\n",
+    ),
+)
+def test_setuptools_setup_cfg_is_evaluated(
+    tmp_path, make_static_backend_reader, setup_py
+):
+    (tmp_path / "setup.cfg").write_text(SETUP_CFG, encoding="utf-8")
+    (tmp_path / "setup.py").write_text(setup_py, encoding="utf-8")
+    (tmp_path / "lib" / "foo_pkg").mkdir(parents=True)
+    (tmp_path / "lib" / "foo_pkg" / "__init__.py").write_text(
+        'VERSION = "2.0.0"\n', encoding="utf-8"
+    )
+
+    reader = make_static_backend_reader()
+    assert reader.build_backend() is None
+    assert reader.name() == "foo-pkg"
+    assert reader.version() == "2.0.0"
+    assert reader.description() == "A foo package."
+    assert reader.keywords() == ("foo", "bar")
+    assert reader.classifiers() == ("Typing :: Typed", "Framework :: Pytest")
+    assert reader.requires_python() == ">=3.10"
+    assert reader.dependencies() == ("requests>=2", 'click; python_version < "4"')
+    assert reader.optional_dependencies() == {"test": ("pytest", "coverage")}
+
+
+def test_setuptools_setup_cfg_is_ignored_with_nontrivial_setup_py(
+    tmp_path, make_static_backend_reader
+):
+    (tmp_path / "setup.cfg").write_text(SETUP_CFG, encoding="utf-8")
+    (tmp_path / "setup.py").write_text(
+        "from setuptools import setup\nsetup(version='9.9')\n", encoding="utf-8"
+    )
+
+    reader = make_static_backend_reader()
+    assert reader.name() is None
+    assert reader.version() is None
+    assert reader.dependencies() is None
+
+
+def test_setuptools_setup_cfg_is_ignored_without_a_buildable_layout(
+    tmp_path, make_static_backend_reader
+):
+    # build refuses a project with neither pyproject.toml nor setup.py
+    (tmp_path / "setup.cfg").write_text(SETUP_CFG, encoding="utf-8")
+
+    reader = make_static_backend_reader()
+    assert reader.name() is None
+    assert reader.version() is None
+
+
+@pytest.mark.parametrize("name", ("Foo_Pkg", "foo.bar__baz", "foo--bar"))
+def test_setuptools_setup_cfg_name_matches_a_build(
+    tmp_path, make_static_backend_reader, name
+):
+    build_util = pytest.importorskip("build.util")
+    pytest.importorskip("setuptools")
+    (tmp_path / "setup.cfg").write_text(
+        f"[metadata]\nname = {name}\nversion = 1.0\n", encoding="utf-8"
+    )
+    (tmp_path / "setup.py").write_text(
+        "from setuptools import setup\nsetup()\n", encoding="utf-8"
+    )
+
+    built = build_util.project_wheel_metadata(tmp_path, isolated=False)
+    assert make_static_backend_reader().name() == built["Name"]
+
+
+def test_reader_uses_setup_cfg_without_building(tmp_path, chdir, monkeypatch):
+    (tmp_path / "setup.cfg").write_text(
+        "[metadata]\nname = foo\nversion = file: VERSION\n", encoding="utf-8"
+    )
+    (tmp_path / "setup.py").write_text(
+        "from setuptools import setup\nsetup()\n", encoding="utf-8"
+    )
+    (tmp_path / "VERSION").write_text("1.0.0\n", encoding="utf-8")
+    _forbid_builds(monkeypatch)
+
+    with chdir(tmp_path):
+        reader = _ReaderImplementation(
+            _ReaderImplementation._ConfigClass(
+                dir_explorer=_discovery.DirExplorer(tmp_path),
+                document_cache=_cached_toml.TomlDocumentCache(),
+                isolated_builds=True,
+                capture_build_output=True,
+            )
+        )
+        assert reader.name() == "foo"
+        assert reader.version() == "1.0.0"
+
+
+HATCH_PYPROJECT = d("""\
+    [build-system]
+    requires = ["hatchling"]
+    build-backend = "hatchling.build"
+
+    [project]
+    name = "foo-pkg"
+    dynamic = ["version"]
+    """)
+
+
+@pytest.mark.parametrize(
+    ("version_table", "about_content", "expect_version"),
+    (
+        pytest.param(
+            '[tool.hatch.version]\npath = "src/foo_pkg/__about__.py"\n',
+            '__version__ = "v1.0.0"\n',
+            "1.0.0",
+            id="default-pattern",
+        ),
+        pytest.param(
+            "[tool.hatch.version]\n"
+            'path = "src/foo_pkg/__about__.py"\n'
+            'pattern = \'BUILD = "(?P<version>[^"]+)"\'\n',
+            '__version__ = "1.0.0"\nBUILD = "2.1"\n',
+            "2.1",
+            id="custom-pattern",
+        ),
+        pytest.param(
+            '[tool.hatch.version]\npath = "src/foo_pkg/__about__.py"\n',
+            "__version__ = get_version()\n",
+            None,
+            id="no-match",
+        ),
+        pytest.param(
+            "[tool.hatch.version]\n"
+            'source = "code"\n'
+            'path = "src/foo_pkg/__about__.py"\n',
+            '__version__ = "1.0.0"\n',
+            None,
+            id="code-source",
+        ),
+        pytest.param(
+            '[tool.hatch.version]\npath = "src/foo_pkg/__about__.py"\n'
+            "[tool.hatch.metadata.hooks.custom]\n",
+            '__version__ = "1.0.0"\n',
+            None,
+            id="metadata-hook",
+        ),
+    ),
+)
+def test_hatch_version_sources(
+    tmp_path, make_static_backend_reader, version_table, about_content, expect_version
+):
+    (tmp_path / "pyproject.toml").write_text(
+        HATCH_PYPROJECT + "\n" + version_table, encoding="utf-8"
+    )
+    (tmp_path / "src" / "foo_pkg").mkdir(parents=True)
+    (tmp_path / "src" / "foo_pkg" / "__about__.py").write_text(
+        about_content, encoding="utf-8"
+    )
+
+    assert make_static_backend_reader().version() == expect_version
+
+
+def test_hatch_version_config_can_be_in_hatch_toml(
+    tmp_path, make_static_backend_reader
+):
+    (tmp_path / "pyproject.toml").write_text(HATCH_PYPROJECT, encoding="utf-8")
+    (tmp_path / "hatch.toml").write_text(
+        '[version]\npath = "foo_pkg.py"\n', encoding="utf-8"
+    )
+    (tmp_path / "foo_pkg.py").write_text("VERSION = '0.3'\n", encoding="utf-8")
+
+    assert make_static_backend_reader().version() == "0.3"
+
+
+def test_hatch_env_version_source(tmp_path, make_static_backend_reader, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text(
+        HATCH_PYPROJECT
+        + '\n[tool.hatch.version]\nsource = "env"\nvariable = "FOO_VERSION"\n',
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("FOO_VERSION", "4.5.6")
+
+    assert make_static_backend_reader().version() == "4.5.6"
+
+
+SCM_PYPROJECT = d("""\
+    [build-system]
+    requires = ["setuptools", "setuptools-scm"]
+    build-backend = "setuptools.build_meta"
+
+    [project]
+    name = "foo-pkg"
+    dynamic = ["version"]
+
+    [tool.setuptools_scm]
+    """)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+def test_setuptools_scm_version_is_computed_from_tags(
+    tmp_path, make_static_backend_reader
+):
+    (tmp_path / "pyproject.toml").write_text(SCM_PYPROJECT, encoding="utf-8")
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "mddj",
+        "GIT_AUTHOR_EMAIL": "mddj@example.org",
+        "GIT_COMMITTER_NAME": "mddj",
+        "GIT_COMMITTER_EMAIL": "mddj@example.org",
+    }
+    for command in (
+        ["init", "-q"],
+        ["add", "."],
+        ["commit", "-q", "-m", "init"],
+        ["tag", "v1.2.0"],
+        ["commit", "-q", "--allow-empty", "-m", "next"],
+    ):
+        subprocess.run(["git", *command], cwd=tmp_path, env=env, check=True)
+    sha = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    assert make_static_backend_reader().version() == f"1.2.1.dev1+g{sha}"
+
+
+def test_setuptools_scm_unsupported_options_are_unknown(
+    tmp_path, make_static_backend_reader, monkeypatch
+):
+    monkeypatch.setenv("SETUPTOOLS_SCM_PRETEND_VERSION", "9.9")
+    (tmp_path / "pyproject.toml").write_text(
+        SCM_PYPROJECT + 'version_scheme = "release-branch-semver"\n',
+        encoding="utf-8",
+    )
+
+    assert make_static_backend_reader().version() is None
+
+
+def test_hatch_vcs_version_source(tmp_path, make_static_backend_reader, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text(
+        HATCH_PYPROJECT
+        + '\n[tool.hatch.version]\nsource = "vcs"\nfallback-version = "0.0.1"\n',
+        encoding="utf-8",
+    )
+
+    # not in a repository: the fallback version is used
+    assert make_static_backend_reader().version() == "0.0.1"
+
+    monkeypatch.setenv("SETUPTOOLS_SCM_PRETEND_VERSION_FOR_FOO_PKG", "3.0")
+    assert make_static_backend_reader().version() == "3.0"
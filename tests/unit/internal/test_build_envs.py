@@ -0,0 +1,208 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import venv
+
+import pytest
+
+from mddj._internal import _build_envs, _filelock, _wheel_metadata
+
+
+def test_requirements_normalization_ignores_order_and_spelling():
+    assert _build_envs.normalize_requirements(
+        ["Setuptools_SCM >= 8", "setuptools>=64"]
+    ) == _build_envs.normalize_requirements(["setuptools >=64", "setuptools-scm>=8"])
+
+
+def test_environment_key_depends_on_requirements():
+    key_a = _build_envs.environment_key(["flit-core"])
+    assert key_a == _build_envs.environment_key(["flit-core"])
+    assert key_a != _build_envs.environment_key(["hatchling"])
+
+
+def test_pooled_envs_do_not_see_the_host_pythonpath(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path / "host-packages"))
+    env = _build_envs.PooledBuildEnv(tmp_path / "env", [])
+
+    extra_environ = env.make_extra_environ()
+    assert extra_environ["PYTHONPATH"] == ""
+    assert extra_environ["PATH"].startswith(str(tmp_path / "env"))
+
+
+def test_pip_install_does_not_see_the_host_pythonpath(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path / "host-packages"))
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(kwargs["env"])
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    _build_envs._pip_install(tmp_path / "env", ["flit-core"], quiet=True)
+
+    assert "PYTHONPATH" not in calls[0]
+    assert calls[0]["PATH"] == os.environ["PATH"]
+
+
+@pytest.fixture
+def pip_installs(monkeypatch):
+    """Record installs into pooled environments, without creating them."""
+    installs = []
+    monkeypatch.setattr(
+        venv.EnvBuilder, "create", lambda self, env_dir: os.makedirs(env_dir)
+    )
+    monkeypatch.setattr(
+        _build_envs,
+        "_pip_install",
+        lambda env_path, requirements, quiet: installs.append((env_path, requirements)),
+    )
+    return installs
+
+
+def test_envs_are_keyed_by_all_of_their_requirements(tmp_path, pip_installs):
+    pool = _build_envs.BuildEnvPool(tmp_path)
+
+    with pool.acquire(["setuptools", "foo<2"]) as old_foo:
+        pass
+    with pool.acquire(["setuptools", "foo>=2"]) as new_foo:
+        pass
+    with pool.acquire(["foo <2", "Setuptools"]) as old_foo_again:
+        pass
+
+    assert old_foo.path != new_foo.path
+    assert old_foo_again.path == old_foo.path
+    assert old_foo_again.requirements == ["foo<2", "setuptools"]
+    # each environment is installed into once, when it is created
+    assert pip_installs == [
+        (old_foo.path, ["foo<2", "setuptools"]),
+        (new_foo.path, ["foo>=2", "setuptools"]),
+    ]
+
+
+def test_backend_requirements_use_an_env_of_their_own(
+    tmp_path, pip_installs, monkeypatch
+):
+    build = pytest.importorskip("build")
+    (tmp_path / "pyproject.toml").write_text(
+        '[build-system]\nrequires = ["setuptools"]\n'
+        'build-backend = "setuptools.build_meta"\n'
+    )
+    backend_requires = {"foo<2"}
+
+    class FakeBuilder:
+        def __init__(self, env):
+            self.env = env
+
+        def get_requires_for_build(self, distribution):
+            return backend_requires
+
+    monkeypatch.setattr(
+        build.ProjectBuilder,
+        "from_isolated_env",
+        lambda env, source_dir, runner: FakeBuilder(env),
+    )
+    monkeypatch.setattr(
+        _wheel_metadata, "_read_metadata_text", lambda builder: builder.env
+    )
+    pool = _build_envs.BuildEnvPool(tmp_path / "cache")
+
+    env = _wheel_metadata._build_metadata_text(tmp_path, True, True, pool)
+    assert env.requirements == ["foo<2", "setuptools"]
+
+    backend_requires = set()
+    env = _wheel_metadata._build_metadata_text(tmp_path, True, True, pool)
+    assert env.requirements == ["setuptools"]
+    # the shared environment was not modified by the first build
+    assert [requirements for _, requirements in pip_installs] == [
+        ["setuptools"],
+        ["foo<2", "setuptools"],
+    ]
+
+
+def _make_fake_env(pool, name, age):
+    env_path = pool.envs_dir / name
+    env_path.mkdir(parents=True)
+    marker = env_path / _build_envs._READY_MARKER
+    marker.write_text(json.dumps({"requires": []}))
+    when = time.time() - age
+    os.utime(marker, (when, when))
+    return env_path
+
+
+def test_prune_removes_stale_envs(tmp_path):
+    pool = _build_envs.BuildEnvPool(tmp_path)
+    stale = _make_fake_env(pool, "stale", age=1000)
+    fresh = _make_fake_env(pool, "fresh", age=0)
+
+    evicted = pool.prune(max_age=500)
+    assert [e.path for e in evicted] == [stale]
+    assert not stale.exists()
+    assert fresh.exists()
+    assert not (pool.envs_dir / "stale.lock").exists()
+
+
+def test_prune_removes_orphaned_locks(tmp_path):
+    pool = _build_envs.BuildEnvPool(tmp_path)
+    _make_fake_env(pool, "fresh", age=0)
+    (pool.envs_dir / "fresh.lock").touch()
+    (pool.envs_dir / "orphan.lock").touch()
+
+    assert pool.prune(max_age=500) == []
+    assert sorted(p.name for p in pool.envs_dir.iterdir()) == ["fresh", "fresh.lock"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shared locks are POSIX-only")
+def test_prune_skips_envs_which_are_in_use(tmp_path):
+    pool = _build_envs.BuildEnvPool(tmp_path)
+    in_use = _make_fake_env(pool, "in-use", age=1000)
+
+    lock = _filelock.FileLock(pool.envs_dir / "in-use.lock")
+    lock.acquire(shared=True)
+    try:
+        assert pool.prune(max_age=0) == []
+        assert in_use.exists()
+    finally:
+        lock.release()
+
+    assert [e.path for e in pool.prune(max_age=0)] == [in_use]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="open files can't be deleted")
+def test_waiters_lock_the_current_file_after_a_delete(tmp_path):
+    path = tmp_path / "x.lock"
+    holder = _filelock.FileLock(path)
+    waiter = _filelock.FileLock(path)
+    assert holder.acquire()
+
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: waiter.acquire() and acquired.set())
+    thread.start()
+    assert not acquired.wait(timeout=0.2)
+
+    holder.delete()
+    thread.join(timeout=10)
+    assert acquired.is_set()
+    # the waiter holds a lock on a new file, which excludes everyone else
+    assert path.exists()
+    assert not _filelock.FileLock(path).acquire(blocking=False)
+    waiter.release()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shared locks are POSIX-only")
+def test_shared_locks_exclude_exclusive_locks(tmp_path):
+    path = tmp_path / "x.lock"
+    shared_1 = _filelock.FileLock(path)
+    shared_2 = _filelock.FileLock(path)
+    exclusive = _filelock.FileLock(path)
+
+    assert shared_1.acquire(shared=True)
+    assert shared_2.acquire(shared=True, blocking=False)
+    assert not exclusive.acquire(blocking=False)
+
+    shared_1.release()
+    shared_2.release()
+    assert exclusive.acquire(blocking=False)
+    exclusive.release()
@@ -0,0 +1,143 @@
+import os
+import pathlib
+from textwrap import dedent as d
+
+import pytest
+import tomlkit
+
+from mddj._internal import _cached_toml, _writers
+from mddj.api import DJ, DJConfig
+
+
+@pytest.fixture
+def pyproject(tmp_path):
+    path = tmp_path / "pyproject.toml"
+    path.write_text(
+        d("""\
+            [project]
+            # the version
+            version = '1.0.0'
+            """),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_reads_use_plain_data(pyproject):
+    cache = _cached_toml.TomlDocumentCache()
+
+    data = cache.load(pyproject)
+    assert type(data) is dict
+    assert type(data["project"]) is dict
+    assert data == {"project": {"version": "1.0.0"}}
+    assert cache.load(pyproject) is data
+    assert not cache._write_cache
+
+
+def test_writes_use_tomlkit_and_invalidate_reads(pyproject):
+    cache = _cached_toml.TomlDocumentCache()
+    cache.load(pyproject)
+
+    document = cache.load_for_write(pyproject)
+    assert isinstance(document, tomlkit.TOMLDocument)
+    assert cache.load_for_write(pyproject) is document
+
+    _writers.write_toml_value(
+        pyproject, "project.version", "2.0.0", loaded_document=document
+    )
+    cache.invalidate(pyproject)
+
+    assert cache.load(pyproject) == {"project": {"version": "2.0.0"}}
+    assert "# the version\nversion = '2.0.0'" in pyproject.read_text()
+
+
+def test_loads_require_absolute_paths():
+    cache = _cached_toml.TomlDocumentCache()
+    with pytest.raises(ValueError, match="absolute"):
+        cache.load_for_write(pathlib.Path("pyproject.toml"))
+
+
+def _rewrite(path, content):
+    # keep the mtime, as a change within the filesystem's timestamp resolution would
+    stat = path.stat()
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_unvalidated_cache_ignores_changes(pyproject):
+    cache = _cached_toml.TomlDocumentCache()
+    data = cache.load(pyproject)
+
+    pyproject.write_text("[project]\nversion = '2.0.0'\n", encoding="utf-8")
+    assert cache.load(pyproject) is data
+
+
+def test_validated_cache_reparses_only_changed_files(pyproject, tmp_path):
+    other = tmp_path / "other.toml"
+    other.write_text("a = 1\n", encoding="utf-8")
+    cache = _cached_toml.TomlDocumentCache(validate=True)
+    data = cache.load(pyproject)
+    other_data = cache.load(other)
+    assert cache.load(pyproject) is data
+
+    pyproject.write_text("[project]\nversion = '2.0.0'\n", encoding="utf-8")
+    assert cache.load(pyproject) == {"project": {"version": "2.0.0"}}
+    assert cache.load_table(pyproject, "project", "version") == "2.0.0"
+    assert cache.load(other) is other_data
+
+
+def test_validated_cache_drops_stale_write_documents(pyproject):
+    cache = _cached_toml.TomlDocumentCache(validate=True)
+    document = cache.load_for_write(pyproject)
+
+    pyproject.write_text("[project]\nversion = '2.0.0'\n", encoding="utf-8")
+    assert cache.load_for_write(pyproject) is not document
+    assert cache.load_for_write(pyproject)["project"]["version"] == "2.0.0"
+
+
+def test_validated_cache_detects_replaced_files(pyproject, tmp_path):
+    cache = _cached_toml.TomlDocumentCache(validate=True)
+    cache.load(pyproject)
+
+    # same size and mtime, but a different inode
+    replacement = tmp_path / "replacement.toml"
+    replacement.write_text(pyproject.read_text().replace("1.0.0", "3.0.0"))
+    stat = pyproject.stat()
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    replacement.replace(pyproject)
+
+    assert cache.load_table(pyproject, "project", "version") == "3.0.0"
+
+
+def test_validated_cache_forgets_deleted_files(pyproject):
+    cache = _cached_toml.TomlDocumentCache(validate=True)
+    cache.load(pyproject)
+
+    pyproject.unlink()
+    with pytest.raises(FileNotFoundError):
+        cache.load(pyproject)
+    assert not cache._cache
+
+
+def test_hash_verification_detects_changes_with_the_same_mtime(pyproject):
+    stat_cache = _cached_toml.TomlDocumentCache(validate=True)
+    hash_cache = _cached_toml.TomlDocumentCache(verify_hashes=True)
+    stat_cache.load(pyproject)
+    hash_cache.load(pyproject)
+
+    _rewrite(pyproject, pyproject.read_text().replace("1.0.0", "4.0.0"))
+
+    assert stat_cache.load_table(pyproject, "project", "version") == "1.0.0"
+    assert hash_cache.load_table(pyproject, "project", "version") == "4.0.0"
+
+
+def test_shared_cache_is_used_by_dj_when_enabled(tmp_path):
+    shared = _cached_toml.shared_cache()
+    assert shared is _cached_toml.shared_cache()
+    assert shared is not _cached_toml.shared_cache(verify_hashes=True)
+
+    first = DJ(DJConfig(discovery_start_dir=tmp_path, share_document_cache=True))
+    second = DJ(DJConfig(discovery_start_dir=tmp_path, share_document_cache=True))
+    private = DJ(DJConfig(discovery_start_dir=tmp_path, share_document_cache=False))
+    assert first._document_cache is second._document_cache is shared
+    assert private._document_cache is not shared
@@ -0,0 +1,80 @@
+import importlib.metadata
+
+import pytest
+
+from mddj._internal._core_metadata import CoreMetadata
+
+
+class _TextDistribution(importlib.metadata.Distribution):
+    def __init__(self, text):
+        self._text = text
+
+    def read_text(self, filename):
+        return self._text if filename == "METADATA" else None
+
+    def locate_file(self, path):
+        raise NotImplementedError
+
+
+METADATA_SAMPLES = {
+    "basic": (
+        "Metadata-Version: 2.4\n"
+        "Name: foo\n"
+        "Version: 1.0\n"
+        "Summary: the foo pkg\n"
+        "Classifier: Programming Language :: Python\n"
+        "Classifier: Typing :: Typed\n"
+        "Requires-Dist: bar; extra == 'cli'\n"
+        "Provides-Extra: cli\n"
+        "\n"
+        "# Foo\n"
+        "\n"
+        "Author: not a header, this is the description\n"
+    ),
+    "folded": (
+        "Metadata-Version: 2.1\n"
+        "Name: foo\n"
+        "License: MIT License\n"
+        "        \n"
+        "        Copyright (c) Foo\n"
+        "Description: Old style\n"
+        "        |\n"
+        "        | description\n"
+        "Author-email: A <a@example.org>,\n"
+        "  B <b@example.org>\n"
+    ),
+    "crlf-no-body": "Name: foo\r\nVersion: 1.0\r\n",
+    "missing-separator": "Name: foo\nthis is not a header\nVersion: 1.0\n",
+    "empty-body": "Name: foo\n\n",
+}
+
+
+@pytest.mark.parametrize("text", METADATA_SAMPLES.values(), ids=METADATA_SAMPLES)
+def test_values_match_importlib_metadata(text):
+    expected = _TextDistribution(text).metadata
+    actual = CoreMetadata(text)
+
+    for name in (
+        "Name",
+        "name",
+        "Version",
+        "Summary",
+        "Classifier",
+        "Requires-Dist",
+        "Provides-Extra",
+        "License",
+        "Description",
+        "Author-email",
+        "Missing",
+    ):
+        assert actual.get(name) == expected.get(name)
+        assert actual.get_all(name, ()) == expected.get_all(name, ())
+
+
+def test_body_is_read_lazily():
+    metadata = CoreMetadata("Name: foo\n\nlong description\n")
+
+    assert "body" not in vars(metadata)
+    assert metadata.get("Name") == "foo"
+    assert "body" not in vars(metadata)
+    assert metadata.get("Description") == "long description\n"
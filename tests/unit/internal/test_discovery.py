@@ -1,3 +1,4 @@
+import pathlib
 from textwrap import dedent as d
 
 import pytest
@@ -117,3 +118,97 @@ def test_discovery_finds_tox_tool_table_in_pyproject(tmp_path):
 
     explorer = DirExplorer(loc)
     assert str(explorer.search_for("tox").dirpath) == str(loc)
+
+
+@pytest.mark.parametrize("probe", (False, True))
+def test_probe_discovery_matches_listing(tmp_path, probe):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "tox.ini").touch()
+    (tmp_path / "setup.py").touch()
+    (tmp_path / "__init__.py").touch()
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    (package_dir / "setup.py").touch()
+    (package_dir / "__init__.py").touch()
+    (package_dir / "pyproject.toml").touch()
+    # broken symlinks are listed, so probing must find them too
+    (package_dir / ".readthedocs.yaml").symlink_to(tmp_path / "missing.yaml")
+    for i in range(50):
+        (package_dir / f"module{i}.py").touch()
+    loc = package_dir / "subdir"
+    loc.mkdir()
+
+    explorer = DirExplorer(loc, probe=probe)
+    assert explorer.search_for("python-package").dirpath == package_dir
+    assert explorer.search_for("tox").dirpath == tmp_path
+    assert explorer.search_for("vcs-root").dirpath == tmp_path
+    assert explorer.search_for("readthedocs").dirpath == package_dir
+    assert explorer._node_cache[package_dir]._dir_contents >= {
+        "setup.py",
+        "__init__.py",
+        "pyproject.toml",
+        ".readthedocs.yaml",
+    }
+    if probe:
+        assert "module0.py" not in explorer._node_cache[package_dir]._dir_contents
+
+
+@pytest.mark.parametrize("probe", (False, True))
+def test_discovery_does_not_move_up_into_ceiling_directories(tmp_path, probe):
+    (tmp_path / "pyproject.toml").touch()
+    ceiling = tmp_path / "ceiling"
+    loc = ceiling / "subdir"
+    loc.mkdir(parents=True)
+
+    explorer = DirExplorer(loc, probe=probe, ceiling_directories=[ceiling])
+    with pytest.raises(LookupError):
+        explorer.search_for("pyproject")
+    assert set(explorer._node_cache) == {loc}
+
+    # the start dir may be a ceiling itself, and relative ceilings are ignored
+    explorer = DirExplorer(
+        ceiling,
+        probe=probe,
+        ceiling_directories=[ceiling, pathlib.Path("relative")],
+    )
+    assert explorer.search_for("pyproject").dirpath == tmp_path
+
+
+def test_characteristic_index_is_built_in_one_walk(tmp_path, monkeypatch):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "tox.ini").touch()
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "pyproject.toml").write_text("[tool.tox]\n")
+    loc = project_dir / "subdir"
+    loc.mkdir()
+
+    explorer = DirExplorer(loc)
+    assert explorer.search_for("pyproject").dirpath == project_dir
+
+    # later searches, including failed ones, do not touch the filesystem
+    monkeypatch.setattr(pathlib.Path, "iterdir", None)
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            explorer.search_for("readthedocs")
+    assert explorer.search_for("vcs-root").dirpath == tmp_path
+    # the [tool.tox] table is nearer than tox.ini
+    assert explorer.characteristic_index().as_dict() == {
+        "pyproject": project_dir,
+        "python-package": project_dir,
+        "tox": project_dir,
+        "readthedocs": None,
+        "vcs-root": tmp_path,
+        "workspace": None,
+    }
+
+
+def test_characteristic_index_only_parses_pyproject_for_tox(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pyproject.toml").write_text("[invalid")
+
+    explorer = DirExplorer(tmp_path)
+    assert explorer.search_for("pyproject").dirpath == tmp_path
+    assert explorer.search_for("vcs-root").dirpath == tmp_path
+    with pytest.raises(ValueError):
+        explorer.search_for("tox")
@@ -0,0 +1,117 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from mddj._internal import _git_describe, _git_objects
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+
+
+@pytest.fixture
+def git(tmp_path):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "mddj",
+        "GIT_AUTHOR_EMAIL": "mddj@example.org",
+        "GIT_COMMITTER_NAME": "mddj",
+        "GIT_COMMITTER_EMAIL": "mddj@example.org",
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "HOME": str(tmp_path),
+    }
+
+    def _git(*args):
+        subprocess.run(
+            ["git", *args], cwd=tmp_path, env=env, check=True, capture_output=True
+        )
+
+    _git("init", "-q", "-b", "main")
+    return _git
+
+
+def _commit(git, tmp_path, name):
+    (tmp_path / f"{name}.txt").write_text(name, encoding="utf-8")
+    git("add", ".")
+    git("commit", "-q", "-m", name)
+
+
+def _assert_matches_git(tmp_path):
+    native = _git_describe.describe_native(tmp_path)
+    assert native == _git_describe.describe_subprocess(tmp_path)
+    return native
+
+
+def test_describe_without_tags_counts_all_commits(git, tmp_path):
+    for name in ("a", "b", "c"):
+        _commit(git, tmp_path, name)
+
+    description = _assert_matches_git(tmp_path)
+    assert description.tag is None
+    assert description.distance == 3
+    assert not description.dirty
+
+
+def test_describe_finds_nearest_tag_across_merges(git, tmp_path):
+    _commit(git, tmp_path, "a")
+    git("tag", "-a", "v1.0", "-m", "release")
+    _commit(git, tmp_path, "b")
+    git("tag", "v1.1")
+    git("checkout", "-q", "-b", "feature", "HEAD~1")
+    _commit(git, tmp_path, "c")
+    git("checkout", "-q", "main")
+    git("merge", "-q", "--no-edit", "feature")
+    # tags which don't contain a digit are ignored
+    git("tag", "latest")
+
+    description = _assert_matches_git(tmp_path)
+    assert description.tag == "v1.1"
+    assert description.distance == 2
+
+
+def test_describe_reads_packed_objects_and_refs(git, tmp_path):
+    for i in range(5):
+        _commit(git, tmp_path, f"f{i}")
+    git("tag", "2.0")
+    _commit(git, tmp_path, "after")
+    git("gc", "-q")
+    assert not (tmp_path / ".git" / "refs" / "tags" / "2.0").exists()
+
+    description = _assert_matches_git(tmp_path)
+    assert (description.tag, description.distance) == ("2.0", 1)
+
+
+@pytest.mark.parametrize("change", ("modify", "delete", "stage-new", "untracked"))
+def test_describe_detects_dirty_worktree(git, tmp_path, change):
+    _commit(git, tmp_path, "a")
+    git("tag", "1.0")
+
+    match change:
+        case "modify":
+            (tmp_path / "a.txt").write_text("b", encoding="utf-8")
+        case "delete":
+            (tmp_path / "a.txt").unlink()
+        case "stage-new" | "untracked":
+            (tmp_path / "new.txt").write_text("new", encoding="utf-8")
+            if change == "stage-new":
+                git("add", "new.txt")
+
+    description = _assert_matches_git(tmp_path)
+    assert description.dirty is (change != "untracked")
+
+
+def test_describe_falls_back_to_git_for_unsupported_repos(git, tmp_path):
+    _commit(git, tmp_path, "a")
+    git("tag", "1.0")
+    (tmp_path / ".gitattributes").write_text("*.txt text\n", encoding="utf-8")
+    git("add", ".gitattributes")
+    git("commit", "-q", "-m", "attributes")
+
+    with pytest.raises(_git_objects.UnsupportedRepository, match="content filters"):
+        _git_describe.describe_native(tmp_path)
+    description = _git_describe.describe(tmp_path)
+    assert (description.tag, description.distance) == ("1.0", 1)
+
+
+def test_describe_empty_repo(git, tmp_path):
+    assert _git_describe.describe(tmp_path) is None
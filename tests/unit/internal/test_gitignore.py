@@ -0,0 +1,96 @@
+import shutil
+import subprocess
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal._gitignore import IgnoreRules
+
+GITIGNORE = d("""\
+    # comments and blank lines are skipped
+
+    *.log
+    !keep.log
+    /build/
+    docs/_build
+    **/generated
+    cache/**
+    a/**/z
+    data?.csv
+    [Tt]emp*
+    \\#literal
+    """) + "trailing-space\\ \n"
+NESTED_GITIGNORE = d("""\
+    local
+    !*.log
+    /anchored
+    """)
+PATHS = (
+    ("app.log", False),
+    ("keep.log", False),
+    ("sub/app.log", False),
+    ("build", True),
+    ("build", False),
+    ("sub/build", True),
+    ("docs/_build", True),
+    ("sub/docs/_build", True),
+    ("generated", True),
+    ("deep/er/generated", True),
+    ("cache", True),
+    ("cache/x", False),
+    ("cache/x/y", True),
+    ("a/z", True),
+    ("a/b/c/z", True),
+    ("data1.csv", False),
+    ("data10.csv", False),
+    ("Temporary", True),
+    ("temp", True),
+    ("#literal", False),
+    ("trailing-space ", False),
+    ("nested/local", True),
+    ("nested/deeper/local", True),
+    ("local", True),
+    ("nested/app.log", False),
+    ("nested/anchored", True),
+    ("nested/deeper/anchored", True),
+    ("excluded-dir", True),
+)
+
+
+@pytest.fixture
+def worktree(tmp_path):
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("excluded-dir/\n")
+    (tmp_path / ".gitignore").write_text(GITIGNORE)
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / ".gitignore").write_text(NESTED_GITIGNORE)
+    return tmp_path
+
+
+def _rules_for(worktree, relative_path):
+    return IgnoreRules.for_directory((worktree / relative_path).parent)
+
+
+@pytest.mark.parametrize("relative_path, is_dir", PATHS)
+def test_is_ignored_matches_git(worktree, relative_path, is_dir):
+    rules = _rules_for(worktree, relative_path)
+    ignored = rules.is_ignored(worktree / relative_path, is_dir=is_dir)
+
+    if shutil.which("git") is None:
+        pytest.skip("requires git")
+    subprocess.run(["git", "init", "-q"], cwd=worktree, check=True)
+    # git only knows that a path is a directory if it exists
+    path = worktree / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.mkdir() if is_dir else path.touch()
+    result = subprocess.run(
+        ["git", "check-ignore", "-q", "--no-index", relative_path],
+        cwd=worktree,
+        capture_output=True,
+    )
+    assert result.returncode in (0, 1), result.stderr
+    assert ignored is (result.returncode == 0)
+
+
+def test_rules_outside_of_a_worktree(tmp_path):
+    assert IgnoreRules.for_directory(tmp_path) is None
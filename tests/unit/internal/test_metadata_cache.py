@@ -0,0 +1,131 @@
+import os
+import time
+
+import pytest
+
+from mddj._internal import _metadata_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return _metadata_cache.MetadataCache(tmp_path / "cache")
+
+
+def _set_last_used(cache, key, seconds_ago):
+    when = time.time() - seconds_ago
+    os.utime(cache._entry_path(key), (when, when))
+
+
+def test_cache_roundtrip(cache):
+    assert cache.get("abc") is None
+    cache.put("abc", "Name: foo\n")
+    assert cache.get("abc") == "Name: foo\n"
+    assert [e.path.name for e in cache.entries()] == ["abc.metadata"]
+
+
+def test_cache_get_refreshes_last_used(cache):
+    cache.put("abc", "Name: foo\n")
+    _set_last_used(cache, "abc", 1000)
+    (before,) = cache.entries()
+
+    cache.get("abc")
+    (after,) = cache.entries()
+    assert after.last_used > before.last_used
+
+
+def test_prune_by_age(cache):
+    cache.put("old", "Name: old\n")
+    cache.put("new", "Name: new\n")
+    _set_last_used(cache, "old", 100)
+
+    evicted = cache.prune(max_age=50)
+    assert [e.path.name for e in evicted] == ["old.metadata"]
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+
+def test_prune_by_size_evicts_least_recently_used(cache):
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, "x" * 10)
+        _set_last_used(cache, key, 100 - i)
+    # touch "a", making "b" the least recently used
+    cache.get("a")
+
+    evicted = cache.prune(max_size=20)
+    assert [e.path.name for e in evicted] == ["b.metadata"]
+
+
+def test_put_enforces_configured_limits(tmp_path):
+    cache = _metadata_cache.MetadataCache(tmp_path, max_age=None, max_size=15)
+    cache.put("a", "x" * 10)
+    _set_last_used(cache, "a", 100)
+    cache.put("b", "x" * 10)
+    assert [e.path.name for e in cache.entries()] == ["b.metadata"]
+
+
+def test_clear(cache):
+    cache.put("a", "x")
+    cache.put("b", "y")
+    assert len(cache.clear()) == 2
+    assert cache.entries() == []
+
+
+def test_fingerprint_tracks_build_inputs(tmp_path):
+    def fingerprint():
+        return _metadata_cache.source_fingerprint(
+            tmp_path, vcs_root=tmp_path, isolated=True
+        )
+
+    (tmp_path / "setup.cfg").write_text("[metadata]\nname = foo\n")
+    original = fingerprint()
+    assert fingerprint() == original
+
+    (tmp_path / "pyproject.toml").write_text("[build-system]\nrequires = []\n")
+    with_pyproject = fingerprint()
+    assert with_pyproject != original
+
+    # unrelated files do not matter
+    (tmp_path / "README.md").write_text("hi")
+    assert fingerprint() == with_pyproject
+
+    # but the VCS HEAD does
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+    at_commit_a = fingerprint()
+    assert at_commit_a != with_pyproject
+
+    (git_dir / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+    assert fingerprint() != at_commit_a
+
+
+def test_fingerprint_depends_on_isolation(tmp_path):
+    (tmp_path / "setup.py").write_text("")
+    assert _metadata_cache.source_fingerprint(
+        tmp_path, vcs_root=None, isolated=True
+    ) != _metadata_cache.source_fingerprint(tmp_path, vcs_root=None, isolated=False)
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path):
+    cache = _metadata_cache.MemoryMetadataCache(tmp_path / "cache", max_entries=2)
+    cache.put("a", "Name: a\n")
+    cache.put("b", "Name: b\n")
+    assert cache.get("a") == "Name: a\n"
+    cache.put("c", "Name: c\n")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "Name: a\n"
+    assert cache.get("c") == "Name: c\n"
+    # nothing is written to disk
+    assert cache.entries() == []
+
+
+def test_memory_cache_can_be_persistent(tmp_path):
+    cache = _metadata_cache.MemoryMetadataCache(tmp_path / "cache", persistent=True)
+    cache.put("abc", "Name: foo\n")
+    assert [e.path.name for e in cache.entries()] == ["abc.metadata"]
+
+    # a new cache loads entries from disk
+    other = _metadata_cache.MemoryMetadataCache(tmp_path / "cache", persistent=True)
+    assert other.get("abc") == "Name: foo\n"
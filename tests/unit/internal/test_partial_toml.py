@@ -0,0 +1,135 @@
+import tomllib
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal import _cached_toml, _partial_toml
+
+TRICKY_DOCUMENT = d('''\
+    # a comment with [brackets]
+    title = "not a [header]"
+
+    [build-system]
+    requires = [
+        "setuptools",
+    ]
+
+    [tool.ruff.lint]
+    select = [
+        ["nested"], # comment ]
+    [ "arrays", "at line start" ],
+    ]
+    message = """
+    [project]
+    name = "wrong"
+    """
+    literal = \'\'\'
+    [project]\'\'\'
+    inline = { a = [1, 2], "b]" = "}" }
+
+    [project]
+    name = "foo"
+    dynamic = ["version"]
+
+    [[tool.mddj.entries]]
+    value = 1
+
+    [ "project" . urls ]
+    home = "https://example.org"
+
+    [[tool.mddj.entries]]
+    value = 2
+    ''')
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(_cached_toml, "_PARTIAL_PARSE_MIN_SIZE", 0)
+    return _cached_toml.TomlDocumentCache()
+
+
+def _write(tmp_path, content):
+    path = tmp_path / "pyproject.toml"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "keys",
+    (
+        ("project",),
+        ("build-system",),
+        ("tool", "mddj"),
+        ("tool", "ruff", "lint"),
+        ("tool", "tox"),
+        ("title",),
+    ),
+)
+def test_partial_reads_match_full_parse(tmp_path, cache, keys):
+    path = _write(tmp_path, TRICKY_DOCUMENT)
+    expected = tomllib.loads(TRICKY_DOCUMENT)
+    for key in keys:
+        expected = expected.get(key) if isinstance(expected, dict) else None
+
+    assert cache.load_table(path, *keys) == expected
+
+
+def test_only_requested_sections_are_parsed(tmp_path, cache):
+    path = _write(tmp_path, TRICKY_DOCUMENT + "\n[tool.broken]\nvalue = = 1\n")
+
+    assert cache.load_table(path, "project")["name"] == "foo"
+    assert path not in cache._cache
+    with pytest.raises(tomllib.TOMLDecodeError):
+        cache.load_table(path, "tool", "broken")
+
+
+@pytest.mark.parametrize(
+    "content, keys",
+    (
+        ('project.name = "foo"\n[build-system]\nrequires = []\n', ("project",)),
+        ('project = { name = "foo" }\n', ("project",)),
+        (
+            '[tool]\nmddj.write_version = "x"\n[tool.mddj.readthedocs]\n',
+            ("tool", "mddj"),
+        ),
+        ('[[tool]]\nname = "foo"\n[tool.mddj]\nx = 1\n', ("tool", "mddj")),
+        ('["escaped\\u0020key"]\nvalue = 1\n[project]\nname = "foo"\n', ("project",)),
+    ),
+)
+def test_ambiguous_documents_fall_back_to_full_parse(tmp_path, cache, content, keys):
+    path = _write(tmp_path, content)
+    expected = tomllib.loads(content)
+    for key in keys:
+        expected = expected.get(key) if isinstance(expected, dict) else None
+
+    assert cache.load_table(path, *keys) == expected
+    assert cache._indexes[path] is None
+    assert path in cache._cache
+
+
+@pytest.mark.parametrize(
+    "content",
+    ("[project]\nname = [\n", "[project]\nname = ]\n", "[project]\nname = 'foo\n"),
+)
+def test_index_rejects_invalid_documents(tmp_path, content):
+    path = _write(tmp_path, content)
+    with pytest.raises(_partial_toml.Ambiguous):
+        _partial_toml.TableIndex.build(path)
+
+
+def test_scanning_is_linear_without_brackets(tmp_path):
+    # a long tail without any brackets must not cause backtracking
+    path = _write(tmp_path, "[project]\n" + 'key = "value"  # comment\n' * 50_000)
+
+    index = _partial_toml.TableIndex.build(path)
+    assert [section.path for section in index.sections] == [(), ("project",)]
+
+
+def test_large_files_are_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(_partial_toml, "_MMAP_MIN_SIZE", 0)
+    path = _write(tmp_path, TRICKY_DOCUMENT)
+
+    index = _partial_toml.TableIndex.build(path)
+    assert index.read_table(path, ("project", "urls")) == {
+        "home": "https://example.org"
+    }
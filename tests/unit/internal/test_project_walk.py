@@ -0,0 +1,83 @@
+import pathlib
+
+import pytest
+
+from mddj._internal import _project_walk
+from mddj.api import walk_projects
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    def project(relative_path, indicator="pyproject.toml"):
+        path = tmp_path / relative_path
+        path.mkdir(parents=True, exist_ok=True)
+        (path / indicator).touch()
+        return path
+
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("/dist/\n*.egg-info\n")
+    (tmp_path / "tox.ini").touch()
+    expected = [
+        project("libs/alpha"),
+        project("libs/beta", "setup.cfg"),
+        project("libs/beta/tests/fixture"),
+        project("services/api", "setup.py"),
+    ]
+    # a module with a setup.py, which is not a project
+    project("libs/alpha/src/alpha", "setup.py")
+    (tmp_path / "libs/alpha/src/alpha/__init__.py").touch()
+    # pruned and ignored directories
+    project(".tox/py311/lib/site-packages/pkg")
+    project("frontend/node_modules/pkg")
+    project("dist/pkg")
+    project("libs/alpha/alpha.egg-info")
+    project(".venv/src/pkg")
+    (tmp_path / ".venv/pyvenv.cfg").touch()
+    # symlinks are not followed
+    (tmp_path / "link").symlink_to(tmp_path / "libs")
+    return tmp_path, expected
+
+
+@pytest.mark.parametrize("max_workers", (None, 4))
+def test_walk_projects(monorepo, max_workers):
+    root, expected = monorepo
+    assert walk_projects(root, max_workers=max_workers) == expected
+
+
+def test_walk_projects_without_gitignore(monorepo):
+    root, expected = monorepo
+    assert walk_projects(root, respect_gitignore=False) == sorted(
+        [*expected, root / "dist/pkg", root / "libs/alpha/alpha.egg-info"]
+    )
+
+
+def test_walk_classifies_every_directory(monorepo):
+    root, _ = monorepo
+    found = {
+        found.dirpath.relative_to(root).as_posix(): found.characteristics
+        for found in _project_walk.walk(root)
+    }
+    assert found["."] == ("vcs-root", "tox")
+    assert found["libs/alpha"] == ("pyproject", "python-package")
+    assert "libs" not in found
+
+
+def test_walk_projects_uses_ignore_rules_of_enclosing_repo(monorepo):
+    root, _ = monorepo
+    (root / "libs" / ".gitignore").write_text("beta/tests/\n")
+    assert walk_projects(root / "libs") == [root / "libs/alpha", root / "libs/beta"]
+
+
+def test_walk_projects_skips_unreadable_subdirectories(monorepo, monkeypatch):
+    root, expected = monorepo
+    real_scandir = _project_walk.os.scandir
+
+    def scandir(path):
+        if pathlib.Path(path).name == "services":
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(_project_walk.os, "scandir", scandir)
+    assert walk_projects(root) == expected[:-1]
+    with pytest.raises(FileNotFoundError):
+        walk_projects(root / "missing")
@@ -0,0 +1,51 @@
+import pytest
+
+from mddj._internal._git_describe import Description
+from mddj._internal._scm_version import ScmConfig, version_from_description
+
+
+@pytest.mark.parametrize(
+    "description, expect_version",
+    (
+        (Description("v1.0", 0, "abcdef0123", "abcdef0", False), "1.0"),
+        (Description("v1.0", 2, "abcdef0123", "abcdef0", False), "1.1.dev2+gabcdef0"),
+        (
+            Description("v1.0", 0, "abcdef0123", "abcdef0", True),
+            "1.1.dev0+gabcdef0.d20230101",
+        ),
+        (
+            Description("1.0rc1", 3, "abcdef0123", "abcdef0", False),
+            "1.0rc2.dev3+gabcdef0",
+        ),
+        (Description("2.0.dev0", 0, "abcdef0123", "abcdef0", False), "2.0.dev0"),
+        (Description("2.0.dev0", 1, "abcdef0123", "abcdef0", False), None),
+        (Description("1.0.post1", 0, "abcdef0123", "abcdef0", False), "1.0.post1"),
+        (Description("1.0.post1", 2, "abcdef0123", "abcdef0", False), None),
+        (Description("1.0.post1", 0, "abcdef0123", "abcdef0", True), None),
+        (Description(None, 5, "abcdef0123", "abcdef0", False), "0.1.dev5+gabcdef0"),
+        (Description("release", 1, "abcdef0123", "abcdef0", False), None),
+    ),
+)
+def test_version_from_description(monkeypatch, description, expect_version):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1672531200")
+    assert version_from_description(description, ScmConfig()) == expect_version
+
+
+def test_local_scheme_can_be_configured():
+    description = Description("1.0", 1, "abcdef0123", "abcdef0", True)
+    config = ScmConfig.from_options({"local_scheme": "no-local-version"})
+    assert config is not None
+    assert version_from_description(description, config) == "1.1.dev1"
+
+
+@pytest.mark.parametrize(
+    "options",
+    (
+        {"version_scheme": "post-release"},
+        {"local_scheme": "dirty-tag"},
+        {"git_describe_command": "git describe"},
+        {"root": 1},
+    ),
+)
+def test_unsupported_options(options):
+    assert ScmConfig.from_options(options) is None
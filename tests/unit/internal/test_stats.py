@@ -0,0 +1,70 @@
+import pytest
+
+from mddj._internal import _cached_methods, _stats
+from mddj.api import DJ, DJConfig
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    _stats.reset()
+    yield
+    _stats.reset()
+
+
+@pytest.fixture
+def static_project(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "foo"\nversion = "1"\n')
+    return tmp_path
+
+
+def test_no_stats_are_collected_by_default(static_project):
+    dj = DJ(DJConfig(discovery_start_dir=static_project))
+    dj.read.version()
+
+    assert dj.stats() == ()
+
+
+def test_stats_count_hits_and_misses(static_project):
+    dj = DJ(DJConfig(discovery_start_dir=static_project, collect_stats=True))
+    dj.read.version()
+    dj.read.version()
+    dj.read.name()
+
+    stats = {s.name: s for s in dj.stats()}
+    assert list(stats) == sorted(stats)
+    assert (stats["Reader.version"].hits, stats["Reader.version"].misses) == (1, 1)
+    assert stats["Reader.version"].compute_time > 0
+    assert stats["TomlDocumentCache.load_table"].misses == 1
+    # one for each directory which discovery visited
+    assert stats["DiscoveryNode._dir_contents"].misses >= 1
+
+
+def test_stats_count_cached_property_hits():
+    class Foo:
+        @_cached_methods.cached_property
+        def bar(self):
+            return object()
+
+    _stats.enable()
+    obj = Foo()
+    assert obj.bar is obj.bar
+
+    (counters,) = _stats.snapshot()
+    assert counters.name.endswith("Foo.bar")
+    assert (counters.lookups, counters.misses) == (2, 1)
+
+
+def test_stats_count_misses_which_raise():
+    class Foo:
+        @_cached_methods.cached_method
+        def bar(self):
+            raise ValueError
+
+    _stats.enable()
+    obj = Foo()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            obj.bar()
+
+    (counters,) = _stats.snapshot()
+    assert (counters.lookups, counters.misses) == (2, 2)
@@ -0,0 +1,120 @@
+import types
+
+import pytest
+from packaging.markers import Marker
+
+from mddj._internal import _wheel_metadata
+from mddj._internal._wheel_metadata import (
+    load_wheel_dependency_data,
+    parse_package_metadata,
+)
+
+
+def _load(provides_extra, requires_dist):
+    lines = ["Metadata-Version: 2.1", "Name: foo", "Version: 1.0"]
+    lines.extend(f"Provides-Extra: {extra}" for extra in provides_extra)
+    lines.extend(f"Requires-Dist: {dist}" for dist in requires_dist)
+    return load_wheel_dependency_data(parse_package_metadata("\n".join(lines) + "\n"))
+
+
+@pytest.mark.parametrize(
+    "dist, expect_cleaned",
+    (
+        ("bar; extra == 'cli'", {"cli": ("bar",)}),
+        ("bar; 'cli' == extra", {"cli": ("bar",)}),
+        (
+            'bar; python_version < "3.11" and extra == "cli"',
+            {"cli": ('bar; python_version < "3.11"',)},
+        ),
+        (
+            'bar; extra == "cli" and (os_name == "nt" or python_version < "3.11")',
+            {"cli": ('bar; os_name == "nt" or python_version < "3.11"',)},
+        ),
+        ("bar; extra == 'cli' or extra == 'test'", {"cli": ("bar",), "test": ("bar",)}),
+        (
+            'bar; (extra == "cli" or extra == "test") and os_name == "nt"',
+            {"cli": ('bar; os_name == "nt"',), "test": ('bar; os_name == "nt"',)},
+        ),
+        (
+            'bar; extra == "cli" and os_name == "nt" or extra == "cli" '
+            'and sys_platform == "darwin"',
+            {"cli": ('bar; os_name == "nt" or sys_platform == "darwin"',)},
+        ),
+        ("bar[baz]>=1.0; extra == 'Test_Suite'", {"Test_Suite": ("bar[baz]>=1.0",)}),
+    ),
+)
+def test_extras_are_partitioned_by_marker(dist, expect_cleaned):
+    data = _load(("cli", "test", "Test_Suite"), ("foo", dist))
+
+    assert data.dependencies == ("foo",)
+    for extra in ("cli", "test", "Test_Suite"):
+        assert data.cleaned_extras[extra] == expect_cleaned.get(extra, ())
+        assert data.extras[extra] == ((dist,) if extra in expect_cleaned else ())
+
+
+@pytest.mark.parametrize(
+    "dist",
+    (
+        "bar",
+        'bar; python_version < "3.11"',
+        "bar; python_version < '3.11' or extra == 'cli'",
+        "bar; extra == 'not-provided'",
+        "bar; extra != 'cli'",
+    ),
+)
+def test_dependencies_which_apply_without_an_extra(dist):
+    data = _load(("cli",), (dist,))
+
+    assert data.dependencies == (dist,)
+    assert data.cleaned_extras == {"cli": ()}
+
+
+def test_extras_keep_metadata_order():
+    data = _load(
+        ("b", "a"),
+        ("x; extra == 'a'", "y; extra == 'b'", "z; extra == 'a' or extra == 'b'"),
+    )
+
+    assert list(data.cleaned_extras) == ["b", "a"]
+    assert dict(data.cleaned_extras) == {"b": ("y", "z"), "a": ("x", "z")}
+    with pytest.raises(KeyError):
+        data.cleaned_extras["c"]
+
+
+@pytest.mark.parametrize(
+    "marker",
+    (
+        types.SimpleNamespace(),
+        types.SimpleNamespace(_markers=("extra", "==", "cli")),
+        types.SimpleNamespace(_markers=[("extra", "==", "cli")]),
+        types.SimpleNamespace(_markers=[["xor"]]),
+    ),
+)
+def test_markers_with_an_unexpected_shape_are_rejected(marker):
+    assert _wheel_metadata._marker_list(marker) is None
+    assert _wheel_metadata._marker_list(Marker("extra == 'cli'")) is not None
+
+
+def test_extras_are_partitioned_by_evaluation_for_unexpected_markers(monkeypatch):
+    monkeypatch.setattr(_wheel_metadata, "_marker_list", lambda marker: None)
+
+    data = _load(
+        ("cli", "Test_Suite"),
+        (
+            "foo",
+            "bar; extra == 'cli'",
+            "baz; extra == 'cli' or extra == 'test-suite'",
+            "qux; extra == 'not-provided'",
+            "quux; python_version >= '3' or extra == 'cli'",
+        ),
+    )
+
+    assert data.dependencies == (
+        "foo",
+        "qux; extra == 'not-provided'",
+        "quux; python_version >= '3' or extra == 'cli'",
+    )
+    assert dict(data.cleaned_extras) == {
+        "cli": ('bar; extra == "cli"', 'baz; extra == "cli" or extra == "test-suite"'),
+        "Test_Suite": ('baz; extra == "cli" or extra == "test-suite"',),
+    }
@@ -0,0 +1,62 @@
+from textwrap import dedent as d
+
+import pytest
+
+from mddj._internal._discovery import DirExplorer
+
+
+def _project(path):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    return path
+
+
+def test_uv_workspace_members(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(d("""\
+        [project]
+        name = "root"
+
+        [tool.uv.workspace]
+        members = ["packages/*", "tools/cli", "missing/*"]
+        exclude = ["packages/legacy"]
+        """))
+    alpha = _project(tmp_path / "packages" / "alpha")
+    beta = _project(tmp_path / "packages" / "beta")
+    _project(tmp_path / "packages" / "legacy")
+    # a matching directory without a pyproject.toml is not a member
+    (tmp_path / "packages" / "docs").mkdir()
+    cli = _project(tmp_path / "tools" / "cli")
+    _project(tmp_path / "unlisted")
+
+    (alpha / "src").mkdir()
+    explorer = DirExplorer(alpha / "src")
+    workspace = explorer.find_workspace()
+    assert workspace.root == tmp_path
+    assert [d.tool for d in workspace.declarations] == ["uv"]
+    assert workspace.members == (tmp_path, alpha, beta, cli)
+
+
+def test_hatch_workspace_members(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(d("""\
+        [tool.hatch.envs.default.workspace]
+        members = ["libs/a", {path = "libs/b", features = ["x"]}, 1]
+
+        [tool.hatch.envs.docs.workspace]
+        members = ["docs/**/plugin"]
+        """))
+    a = _project(tmp_path / "libs" / "a")
+    b = _project(tmp_path / "libs" / "b")
+    plugin = _project(tmp_path / "docs" / "ext" / "plugin")
+
+    workspace = DirExplorer(tmp_path).find_workspace()
+    assert [d.tool for d in workspace.declarations] == ["hatch", "hatch"]
+    # the root has no [project] table, so it is not a member
+    assert workspace.members == (plugin, a, b)
+
+
+def test_find_workspace_without_declaration(tmp_path):
+    (tmp_path / ".git").mkdir()
+    _project(tmp_path)
+
+    with pytest.raises(LookupError, match="'workspace' rule"):
+        DirExplorer(tmp_path).find_workspace()
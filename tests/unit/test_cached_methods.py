@@ -1,3 +1,7 @@
+import gc
+import threading
+import time
+
 from mddj._internal import _cached_methods
 
 
@@ -55,3 +59,159 @@ def test_cached_method_distinguishes_different_calls():
     assert x3 is x2
     y3 = obj.bar(z=4, y=3, x=2)
     assert y3 is y2
+
+
+def _run_in_threads(func, n=8):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+    errors = []
+
+    def target(i):
+        barrier.wait()
+        try:
+            results[i] = func(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_cached_method_computes_each_key_once_across_threads():
+    calls = []
+
+    class Foo:
+        @_cached_methods.cached_method
+        def bar(self, x):
+            calls.append(x)
+            time.sleep(0.05)
+            return object()
+
+    obj = Foo()
+    results, errors = _run_in_threads(lambda i: obj.bar(i % 2))
+
+    assert not errors
+    assert sorted(calls) == [0, 1]
+    assert len({id(r) for r in results}) == 2
+
+
+def test_cached_method_with_maxsize_computes_each_key_once_across_threads():
+    calls = []
+
+    class Foo:
+        @_cached_methods.cached_method(maxsize=4)
+        def bar(self, x):
+            calls.append(x)
+            time.sleep(0.05)
+            return object()
+
+    obj = Foo()
+    results, errors = _run_in_threads(lambda i: obj.bar(i % 2))
+
+    assert not errors
+    assert sorted(calls) == [0, 1]
+    assert len({id(r) for r in results}) == 2
+
+
+def test_cached_method_computes_different_keys_in_parallel():
+    # each key waits for the other, which deadlocks if keys share a lock
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Foo:
+        @_cached_methods.cached_method
+        def bar(self, x):
+            barrier.wait()
+            return x
+
+    obj = Foo()
+    results, errors = _run_in_threads(obj.bar, n=2)
+
+    assert not errors
+    assert results == [0, 1]
+
+
+def test_cached_method_does_not_cache_errors_for_waiting_threads():
+    calls = []
+
+    class Foo:
+        @_cached_methods.cached_method
+        def bar(self):
+            calls.append(None)
+            time.sleep(0.01)
+            if len(calls) == 1:
+                raise ValueError("first call fails")
+            return "ok"
+
+    obj = Foo()
+    results, errors = _run_in_threads(lambda i: obj.bar(), n=4)
+
+    # one thread failed, the next computed the value, and the rest reused it
+    assert len(errors) == 1
+    assert len(calls) == 2
+    assert results.count("ok") == 3
+
+
+def test_cached_method_allows_recursion_on_the_same_key():
+    class Foo:
+        @_cached_methods.cached_method
+        def bar(self, n):
+            return 0 if n == 0 else self.bar(n - 1) + 1
+
+    assert Foo().bar(5) == 5
+
+
+def test_cached_method_table_is_cleared_under_concurrent_collection():
+    class Foo:
+        @_cached_methods.cached_method
+        def bar(self):
+            return object()
+
+    def churn(i):
+        for _ in range(200):
+            obj = Foo()
+            assert obj.bar() is obj.bar()
+            del obj
+
+    _, errors = _run_in_threads(churn)
+    gc.collect()
+
+    assert not errors
+    assert Foo.bar._function_table == {}
+
+
+def test_cached_property_computes_once_across_threads():
+    calls = []
+
+    class Foo:
+        @_cached_methods.cached_property
+        def bar(self):
+            calls.append(None)
+            time.sleep(0.05)
+            return object()
+
+    obj = Foo()
+    results, errors = _run_in_threads(lambda i: obj.bar)
+
+    assert not errors
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_cached_property_computes_different_instances_in_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Foo:
+        @_cached_methods.cached_property
+        def bar(self):
+            barrier.wait()
+            return self
+
+    objs = [Foo(), Foo()]
+    results, errors = _run_in_threads(lambda i: objs[i].bar, n=2)
+
+    assert not errors
+    assert results == objs
@@ -0,0 +1,76 @@
+import json
+import re
+import subprocess
+import sys
+
+# a generous budget, several times the import time on a developer machine, so that
+# only regressions which import heavy dependencies eagerly will exceed it
+IMPORT_TIME_BUDGET_US = 200_000
+
+# dependencies which are only needed by some readers, writers, or APIs
+HEAVY_MODULES = (
+    "asyncio",
+    "build",
+    "concurrent.futures",
+    "email.utils",
+    "packaging.markers",
+    "packaging.requirements",
+    "ryaml",
+    "subprocess",
+    "tomlkit",
+    "venv",
+)
+
+# `-X importtime` reports "self | cumulative | name", indenting nested imports
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def _import_time_us(code):
+    """
+    Measure the total import time of ``code``, excluding interpreter startup, as
+    the sum of the cumulative times of its top-level imports.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    after_startup = False
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indent, name = match.groups()
+        if indent:
+            continue
+        if after_startup:
+            total += int(cumulative)
+        elif name == "site":
+            after_startup = True
+    return total
+
+
+def test_import_api_is_within_budget():
+    # the best of several runs, to reduce noise from the machine
+    best = min(
+        _import_time_us("import mddj.api; mddj.api.DJ; mddj.api.DJConfig")
+        for _ in range(3)
+    )
+    assert best < IMPORT_TIME_BUDGET_US
+
+
+def test_import_api_defers_heavy_dependencies():
+    code = (
+        "import json, sys; "
+        "from mddj.api import DJ; "
+        "DJ().read.sys.python_version(); "
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(json.loads(result.stdout))
+
+    assert modules.isdisjoint(HEAVY_MODULES)
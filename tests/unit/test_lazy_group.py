@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+
+import click
+import pytest
+
+from mddj._cli import main
+from mddj._cli.lazy_group import LazyGroup
+
+
+def _lazy_groups(group):
+    yield group
+    ctx = click.Context(group)
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        if isinstance(command, LazyGroup):
+            yield from _lazy_groups(command)
+
+
+@pytest.mark.parametrize(
+    "group", list(_lazy_groups(main)), ids=lambda group: group.name
+)
+def test_lazy_subcommands_resolve_to_commands_of_the_same_name(group):
+    ctx = click.Context(group)
+    for name in group.lazy_subcommands:
+        assert group.get_command(ctx, name).name == name
+
+
+def test_lazy_group_lists_commands_without_importing_them():
+    group = LazyGroup(
+        "test",
+        commands=[click.Command("eager")],
+        lazy_subcommands={"lazy": "mddj._cli.read.name:read_name"},
+    )
+
+    assert group.list_commands(click.Context(group)) == ["eager", "lazy"]
+
+
+def test_lazy_group_rejects_non_commands():
+    group = LazyGroup(
+        "test", lazy_subcommands={"bad": "mddj._cli.lazy_group:LazyGroup"}
+    )
+
+    with pytest.raises(TypeError, match="did not resolve to a click command"):
+        group.get_command(click.Context(group), "bad")
+
+
+def test_running_a_command_only_imports_its_own_module(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "foo"\nversion = "1"\n')
+    code = (
+        "import json, sys\n"
+        "from mddj._cli import main\n"
+        "try:\n"
+        "    main(['read', 'name'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    name, modules = result.stdout.splitlines()
+    cli_modules = {m for m in json.loads(modules) if m.startswith("mddj._cli.")}
+
+    assert name == "foo"
+    assert cli_modules == {
+        "mddj._cli.lazy_group",
+        "mddj._cli.read",
+        "mddj._cli.read.name",
+        "mddj._cli.state",
+    }